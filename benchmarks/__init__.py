@@ -0,0 +1,16 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Benchmark suite.
+
+Generates a synthetic ``git`` repository, of any size, and times each stage
+of :mod:`mantic` against it. Run ``python -m benchmarks --help`` for usage.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from ._repository import generate, Shape  # noqa: F401
+from ._stages import measure, run, Stages  # noqa: F401
@@ -0,0 +1,131 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Benchmark runner.
+
+Results are written as JSON, so that they can be compared from one release
+to the next, and a summary is printed to ``stderr``.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Sequence
+
+import argparse
+import dataclasses
+import json
+import os
+import pathlib
+import platform
+import sys
+import tempfile
+import time
+
+import mantic
+
+from ._repository import generate, Shape
+from ._stages import run
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Generates a repository, times every stage, and reports the results.
+
+    Args:
+        argv: The command-line arguments, defaults to :obj:`sys.argv`.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    args: argparse.Namespace = _parser().parse_args(argv)
+    shape: Shape = Shape(**{
+        field.name: getattr(args, field.name)
+        for field in dataclasses.fields(Shape)
+        })
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(args.repo or tmp).resolve()
+
+        start = time.perf_counter()
+        generate(path, shape)
+        generation = time.perf_counter() - start
+
+        stages = run(path, args.repeat, args.stage)
+
+    report: Dict[str, Any] = {
+        "mantic": mantic.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "shape": dataclasses.asdict(shape),
+        "repeat": args.repeat,
+        "generation": generation,
+        "stages": stages,
+        }
+
+    for name, timing in stages.items():
+        sys.stderr.write(f"{name:<24} {timing['median'] * 1000:>10.1f} ms\n")
+
+    if args.output is None:
+        json.dump(report, sys.stdout, indent = 2)
+        sys.stdout.write("\n")
+        return
+
+    args.output.parent.mkdir(parents = True, exist_ok = True)
+    args.output.write_text(json.dumps(report, indent = 2) + "\n")
+
+
+def _parser() -> argparse.ArgumentParser:
+    """Builds the command-line arguments parser."""
+
+    parser = argparse.ArgumentParser(
+        prog = "python -m benchmarks",
+        description = "Times mantic against a synthetic repository.",
+        )
+
+    default: Shape = Shape()
+    field: dataclasses.Field[Any]
+
+    for field in dataclasses.fields(Shape):
+        parser.add_argument(
+            f"--{field.name}",
+            type = type(getattr(default, field.name)),
+            default = getattr(default, field.name),
+            help = "repository shape, defaults to %(default)s",
+            )
+
+    parser.add_argument(
+        "--repeat",
+        type = int,
+        default = 5,
+        help = "times to run each stage, defaults to 5",
+        )
+
+    parser.add_argument(
+        "--stage",
+        action = "append",
+        help = "a stage to run, can be repeated, defaults to all of them",
+        )
+
+    parser.add_argument(
+        "--repo",
+        type = pathlib.Path,
+        help = "where to generate the repository, defaults to a temporary one",
+        )
+
+    parser.add_argument(
+        "--output",
+        type = pathlib.Path,
+        help = "the JSON file to write the results to, defaults to stdout",
+        )
+
+    return parser
+
+
+if __name__ == "__main__":
+    main()
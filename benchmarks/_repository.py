@@ -0,0 +1,375 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Synthetic repository generator.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import dataclasses
+import pathlib
+import random
+import subprocess
+
+Argument = Tuple[str, Optional[str]]
+"""The name and the default value of an argument."""
+
+
+@dataclasses.dataclass(frozen = True)
+class Shape:
+    """The shape of a synthetic repository.
+
+    Attributes:
+        tags: The number of tagged versions, from ``1.0.0`` on.
+        files: The number of modules.
+        functions: The average number of functions per module.
+        arguments: The average number of arguments per function.
+        defaults: The probability of an argument to have a default value.
+        changes: The share of modules changed from one version to the next.
+        deprecations: The probability of a function to be deprecated.
+        seed: The seed of the random generator.
+
+    Examples:
+        >>> Shape(files = 10)
+        Shape(tags=3, files=10, functions=20, arguments=3, defaults=0.3, ...)
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    tags: int = 3
+    files: int = 100
+    functions: int = 20
+    arguments: int = 3
+    defaults: float = 0.3
+    changes: float = 0.1
+    deprecations: float = 0.01
+    seed: int = 0
+
+
+@dataclasses.dataclass
+class Function:
+    """A synthetic function.
+
+    Attributes:
+        name: The name of the function.
+        args: The positional arguments.
+        kwds: The keyword-only arguments.
+        method: Whether the function belongs to a class.
+        deprecated: Whether the function is deprecated.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    name: str
+    args: List[Argument]
+    kwds: List[Argument]
+    method: bool = False
+    deprecated: bool = False
+
+    def render(self) -> str:
+        """Renders the source code of the function.
+
+        Returns:
+            The source code, indented when it is a method.
+
+        Examples:
+            >>> function = Function("f", [("a", None), ("b", "1")], [])
+            >>> function.kwds.append(("c", "None"))
+
+            >>> print(function.render())
+            def f(a, b = 1, *, c = None):
+                total = [item for item in range(10) if item % 2]
+                return {key: str(key) for key in total}
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        # Arguments without a default go first, or it would not even parse.
+        args: List[str] = [
+            _render(arg)
+            for arg in sorted(self.args, key = lambda arg: arg[1] is not None)
+            ]
+
+        kwds: List[str] = [_render(kwd) for kwd in self.kwds]
+        lines: List[str] = []
+
+        if self.method:
+            args = ["self", *args]
+
+        if kwds:
+            args = [*args, "*", *kwds]
+
+        if self.deprecated:
+            lines.append('@deprecated(since = "1.0.0", expires = "2.0.0")')
+
+        # We add a body with a few expressions, like any real function.
+        lines.extend((
+            f"def {self.name}({', '.join(args)}):",
+            "    total = [item for item in range(10) if item % 2]",
+            "    return {key: str(key) for key in total}",
+            ))
+
+        if self.method:
+            lines = [f"    {line}" for line in lines]
+
+        return "\n".join(lines)
+
+
+@dataclasses.dataclass
+class Module:
+    """A synthetic module.
+
+    Attributes:
+        path: The path of the module, relative to the repository.
+        functions: The functions of the module, in order.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    path: str
+    functions: List[Function]
+
+    def render(self) -> str:
+        """Renders the source code of the module.
+
+        Returns:
+            The source code, with methods grouped in a single class.
+
+        Examples:
+            >>> module = Module("pkg/module.py", [
+            ...     Function("f", [("a", None)], []),
+            ...     Function("g", [("a", None)], [], method = True),
+            ...     ])
+
+            >>> source = module.render()
+
+            >>> [line for line in source.splitlines() if "def" in line]
+            ['def f(a):', '    def g(self, a):']
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        functions: List[str] = [
+            function.render()
+            for function in self.functions
+            if not function.method
+            ]
+
+        methods: List[str] = [
+            function.render()
+            for function in self.functions
+            if function.method
+            ]
+
+        blocks: List[str] = functions
+
+        if methods:
+            blocks.append("\n\n".join(("class Klass:", *methods)))
+
+        return "\n\n\n".join(blocks) + "\n"
+
+
+class Generator:
+    """Generates, and evolves, the modules of a synthetic repository.
+
+    Args:
+        shape: The shape of the repository.
+
+    Examples:
+        >>> generator = Generator(Shape(files = 3, functions = 2))
+        >>> [module.path for module in generator.modules]
+        ['pkg_0/module_0.py', 'pkg_1/module_1.py', 'pkg_2/module_2.py']
+
+        >>> generator.evolve()
+        >>> len(generator.modules)
+        3
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    shape: Shape
+    rng: random.Random
+    modules: List[Module]
+    count: int
+
+    def __init__(self, shape: Shape) -> None:
+        self.shape = shape
+        self.rng = random.Random(shape.seed)
+        self.count = 0
+
+        self.modules = [
+            Module(
+                f"pkg_{index % 10}/module_{index}.py",
+                [self._function() for _ in range(self._some(shape.functions))],
+                )
+            for index in range(shape.files)
+            ]
+
+    def evolve(self) -> None:
+        """Changes some of the modules, as a new version would."""
+
+        module: Module
+        size: int = max(1, round(len(self.modules) * self.shape.changes))
+
+        for module in self.rng.sample(self.modules, size):
+            self._change(module)
+
+    def _change(self, module: Module) -> None:
+        """Randomly adds, removes, or changes a function of a ``module``."""
+
+        function: Function
+        change: float = self.rng.random()
+
+        if not module.functions or change < 0.25:
+            module.functions.append(self._function())
+            return
+
+        function = self.rng.choice(module.functions)
+
+        if change < 0.5:
+            module.functions.remove(function)
+
+        elif change < 0.75:
+            function.args.append(self._argument())
+
+        elif len(function.args) > 1:
+            function.args.pop()
+
+        else:
+            function.kwds.append((self._name("kwd"), "None"))
+
+    def _function(self) -> Function:
+        """Builds a random function."""
+
+        # Every function has at least one argument.
+        args: List[Argument] = [
+            self._argument()
+            for _ in range(max(1, self._some(self.shape.arguments)))
+            ]
+
+        # And some of the arguments are keyword-only.
+        cut: int = self.rng.randint(1, len(args))
+
+        return Function(
+            name = self._name("function"),
+            args = args[:cut],
+            kwds = args[cut:],
+            method = self.rng.random() < 0.5,
+            deprecated = self.rng.random() < self.shape.deprecations,
+            )
+
+    def _argument(self) -> Argument:
+        """Builds a random argument."""
+
+        default: Optional[str] = None
+
+        if self.rng.random() < self.shape.defaults:
+            default = self.rng.choice(("None", "1", "'text'", "(1, 2)"))
+
+        return self._name("arg"), default
+
+    def _name(self, prefix: str) -> str:
+        """Builds an unique name."""
+
+        self.count += 1
+        return f"{prefix}_{self.count}"
+
+    def _some(self, mean: int) -> int:
+        """Draws an integer between ``0`` and twice the ``mean``."""
+
+        return self.rng.randint(0, 2 * mean)
+
+
+def generate(path: pathlib.Path, shape: Shape) -> pathlib.Path:
+    """Generates a synthetic ``git`` repository.
+
+    Each version is tagged, from ``1.0.0`` to ``{tags}.0.0``. Then a last,
+    untagged, commit changes some more modules, so that there is always
+    something to check.
+
+    Args:
+        path: Where to generate the repository.
+        shape: The shape of the repository.
+
+    Returns:
+        The path of the repository.
+
+    Examples:
+        >>> import tempfile
+
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     repo = generate(pathlib.Path(tmp), Shape(tags = 2, files = 3))
+        ...     _git(repo, "tag").split()
+        ['1.0.0', '2.0.0']
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    generator: Generator = Generator(shape)
+    tag: int
+
+    path.mkdir(parents = True, exist_ok = True)
+    _git(path, "init", "--quiet")
+    _git(path, "config", "user.name", "mantic")
+    _git(path, "config", "user.email", "mantic@example.com")
+
+    for tag in range(1, shape.tags + 2):
+        if tag > 1:
+            generator.evolve()
+
+        _write(path, generator.modules)
+        _git(path, "add", "--all")
+        _git(path, "commit", "--quiet", "--message", f"Version {tag}")
+
+        if tag <= shape.tags:
+            _git(path, "tag", f"{tag}.0.0")
+
+    return path
+
+
+def _write(path: pathlib.Path, modules: List[Module]) -> None:
+    """Writes the source code of the ``modules``."""
+
+    module: Module
+
+    for module in modules:
+        file: pathlib.Path = path / module.path
+        file.parent.mkdir(parents = True, exist_ok = True)
+        file.write_text(module.render())
+
+
+def _render(argument: Argument) -> str:
+    """Renders an argument."""
+
+    name, default = argument
+
+    if default is None:
+        return name
+
+    return f"{name} = {default}"
+
+
+def _git(path: pathlib.Path, *args: str) -> str:
+    """Runs a ``git`` command within the repository at ``path``."""
+
+    return subprocess.run(
+        ("git", *args),
+        cwd = path,
+        check = True,
+        capture_output = True,
+        text = True,
+        ).stdout
@@ -0,0 +1,255 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Benchmark stages.
+
+Each stage times one step of :mod:`mantic` on its own, from reading files
+out of ``git`` to running a whole check, so that a regression can be traced
+back to where it happens.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pathlib
+import statistics
+import time
+
+from mantic import actions
+from mantic.actions.check_signature import CheckSignature, CheckSignatures
+from mantic.domain import Signature
+from mantic.infra import quiet, repo
+
+Stage = Callable[[], Any]
+"""A step to time, over and over again."""
+
+
+class Stages:
+    """The stages to time against a repository.
+
+    Everything a stage needs, but does not measure, is prepared beforehand:
+    the sources to build signatures from, the pairs of signatures to score,
+    and so on.
+
+    Attributes:
+        path: The path of the repository.
+        head: The revision to check.
+        last: The last tagged version of the repository.
+        files: The python files of ``head``.
+        sources: The source code of each of ``files``.
+        these: The signatures of ``head``.
+        those: The signatures of ``last`` with the same name, in order.
+
+    Args:
+        path: The path of the repository.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    path: pathlib.Path
+    head: str
+    last: str
+    files: Tuple[str, ...]
+    sources: Tuple[str, ...]
+    these: Tuple[Signature, ...]
+    those: Tuple[Signature, ...]
+
+    def __init__(self, path: pathlib.Path) -> None:
+        self.path = path
+        self.head = "HEAD"
+        self.last = repo.versions.last(str(path))
+        self.files = _python(repo.files.tree(self.head, str(path)))
+        self.sources = self._read(self.head, self.files)
+
+        # We pair signatures by name, as :class:`.CheckVersion` does.
+        these: Dict[str, Signature] = {
+            signature.name: signature
+            for signature in self._build(self.head)
+            }
+
+        pairs: List[Tuple[Signature, Signature]] = [
+            (these[signature.name], signature)
+            for signature in self._build(self.last)
+            if signature.name in these
+            ]
+
+        self.these = tuple(this for this, _ in pairs)
+        self.those = tuple(that for _, that in pairs)
+
+    def __call__(self) -> Dict[str, Stage]:
+        """Lists the stages, by name, in the order they should be run.
+
+        Returns:
+            The stages.
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        return {
+            "repo.files.tree": self.tree,
+            "repo.files.diff": self.diff,
+            "repo.files.show": self.show,
+            "BuildSignatures": self.build,
+            "CheckSignature.score": self.score,
+            "CheckSignatures.score": self.score_all,
+            "CheckVersion": self.check_version,
+            "CheckDeprecated": self.check_deprecated,
+            }
+
+    def tree(self) -> None:
+        """Lists the files of ``head``."""
+
+        repo.files.tree(self.head, str(self.path))
+
+    def diff(self) -> None:
+        """Lists the files changed between ``last`` and ``head``."""
+
+        repo.files.diff(self.head, self.last, str(self.path))
+
+    def show(self) -> None:
+        """Reads every python file of ``head``, one by one."""
+
+        self._read(self.head, self.files)
+
+    def build(self) -> None:
+        """Builds the signatures of every python file of ``head``."""
+
+        builder = actions.BuildSignatures(self.files)
+
+        for source in self.sources:
+            builder(source)
+
+    def score(self) -> None:
+        """Scores every pair of signatures, one pair at a time."""
+
+        for this, that in zip(self.these, self.those):
+            CheckSignature(this, that).score()
+
+    def score_all(self) -> None:
+        """Scores every pair of signatures, all at once."""
+
+        CheckSignatures(self.these, self.those).score()
+
+    def check_version(self) -> None:
+        """Runs a whole version check, without any cached signatures."""
+
+        actions.check_version(
+            str(self.path),
+            self.head,
+            self.last,
+            version = repo.versions.this(),
+            cache = False,
+            )
+
+    def check_deprecated(self) -> None:
+        """Runs a whole deprecation check."""
+
+        actions.CheckDeprecated(
+            quiet,
+            files = self.files,
+            version = self.last,
+            revision = self.head,
+            repo = str(self.path),
+            )()
+
+    def _read(self, revision: str, files: Sequence[str]) -> Tuple[str, ...]:
+        """Reads ``files`` at ``revision``."""
+
+        return tuple(
+            repo.files.show(revision, file, str(self.path))
+            for file in files
+            )
+
+    def _build(self, revision: str) -> Tuple[Signature, ...]:
+        """Builds the signatures of the python files at ``revision``."""
+
+        files = _python(repo.files.tree(revision, str(self.path)))
+        builder = actions.BuildSignatures(files)
+
+        for source in self._read(revision, files):
+            builder(source)
+
+        return builder.signatures
+
+
+def measure(stage: Stage, repeat: int) -> Dict[str, Any]:
+    """Times a ``stage``.
+
+    Args:
+        stage: The stage to time.
+        repeat: How many times to run the stage.
+
+    Returns:
+        The best, median and worst time, and every single time, in seconds.
+
+    Examples:
+        >>> timing = measure(lambda: None, 3)
+        >>> sorted(timing)
+        ['max', 'median', 'min', 'runs']
+
+        >>> len(timing["runs"])
+        3
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    runs: List[float] = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stage()
+        runs.append(time.perf_counter() - start)
+
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "max": max(runs),
+        "runs": runs,
+        }
+
+
+def run(
+        path: pathlib.Path,
+        repeat: int = 5,
+        only: Optional[Sequence[str]] = None,
+        ) -> Dict[str, Dict[str, Any]]:
+    """Times every stage against the repository at ``path``.
+
+    Args:
+        path: The path of the repository.
+        repeat: How many times to run each stage.
+        only: The names of the stages to run, defaults to all of them.
+
+    Returns:
+        The timings of each stage, by name.
+
+    Raises:
+        KeyError: When a stage does not exist.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    stages: Dict[str, Stage] = Stages(path)()
+    names: Sequence[str] = tuple(stages) if only is None else only
+
+    for name in names:
+        if name not in stages:
+            raise KeyError(f"Unknown stage {name!r}, try: {', '.join(stages)}")
+
+    return {name: measure(stages[name], repeat) for name in names}
+
+
+def _python(files: Sequence[str]) -> Tuple[str, ...]:
+    """Keeps the python files."""
+
+    return tuple(file for file in files if file.endswith(".py"))
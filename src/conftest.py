@@ -0,0 +1,14 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+import pytest
+
+
+@pytest.fixture(autouse = True)
+def cache(tmp_path_factory, monkeypatch):
+    """Keeps the signatures cached by doctests out of the user's cache."""
+
+    directory = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("MANTIC_CACHE_DIR", str(directory))
@@ -5,13 +5,32 @@
 
 """Command-line tools to facilitate semantic versioning.
 
+.. versionchanged:: 2.1.0
+    Sub-packages and ``__version__`` are loaded on first access, not on
+    import, so that importing :mod:`.mantic` is cheap.
+
 .. versionadded:: 1.0.0
 
 """
 
-from . import actions  # noqa: F401
-from . import domain  # noqa: F401
-from . import infra  # noqa: F401
-from . import utils  # noqa: F401
+from typing import Any, TYPE_CHECKING
+
+import importlib
+
+if TYPE_CHECKING:
+    from . import actions  # noqa: F401
+    from . import domain  # noqa: F401
+    from . import infra  # noqa: F401
+    from . import utils  # noqa: F401
+
+_packages = ("actions", "domain", "infra", "utils")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _packages:
+        return importlib.import_module(f".{name}", __name__)
+
+    if name == "__version__":
+        return importlib.import_module(".infra.repo", __name__).versions.this()
 
-__version__ = infra.repo.versions.this()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,3 +13,8 @@ from . import check_signature  # noqa: F401
 from ._build_signatures import BuildSignatures  # noqa: F401
 from ._check_deprecated import CheckDeprecated  # noqa: F401
 from ._check_version import CheckVersion  # noqa: F401
+from ._check_version import check_version  # noqa: F401
+from ._check_version import Finding  # noqa: F401
+from ._check_version import Report  # noqa: F401
+from ._parse_files import ParseFiles  # noqa: F401
+from ._take_snapshot import TakeSnapshot  # noqa: F401
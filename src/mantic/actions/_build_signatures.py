@@ -14,8 +14,7 @@ from __future__ import annotations
 from typing import (
     Any,
     Callable,
-    Generator,
-    Iterator,
+    Dict,
     List,
     Optional,
     Tuple,
@@ -30,49 +29,91 @@ from pathlib import Path
 import deal
 import typic
 
+from .. import utils
 from ..domain import Argument, Signature, Suffix, to_value
+from ..infra import metrics
 
+_specials: Tuple[str, ...] = ("__init__", "__call__")
+"""The special functions that are part of the public interface."""
 
-def _build_unique_name(
-        path: Path,
-        node: ast.FunctionDef,
-        suffixes: Iterator[Suffix],
-        signatures: Tuple[Signature, ...],
-        ) -> str:
-    """Builds an unique signature name."""
+_suffixes: Tuple[str, ...] = tuple(suffix.value for suffix in Suffix)
+"""The suffixes of signatures with duplicated names, in order."""
 
-    module: str
-    name: str
-    decorator: ast.expr
+settings: Dict[str, Any] = {
+    "specials": _specials,
+    "decorators": ("property", "setter"),
+    }
+"""The settings signatures are extracted with.
+
+Any change in the way signatures are extracted has to be reflected here, so
+that previously extracted signatures are not reused.
+
+"""
+
+
+def _build_module(path: Path) -> str:
+    """Builds the name of the module of a file."""
 
     # We build the module name with the name of the parent path, a
     # folder, and the name of the file, without the extension.
     if len(path.parts) > 1:
-        module = f"{path.parts[-2]}.{path.stem}"
+        return f"{path.parts[-2]}.{path.stem}"
 
-    else:
-        module = path.stem
+    return path.stem
 
-    # We compose the name with the name of the module.
-    name = f"{module}.{node.name}"
+
+def _build_name(node: ast.FunctionDef) -> str:
+    """Builds the name of a signature, relative to its module."""
+
+    name: str
+    decorator: ast.expr
+    called: str
+
+    name = node.name
 
     # We suffix properties, othersise names would duplicate.
     for decorator in node.decorator_list:
-        if "property" in ast.dump(decorator):
+        called = utils.called(decorator)
+
+        # Like ``property``, or ``functools.cached_property``.
+        if "property" in called:
             name = f"{name}#getter"
 
-        if "setter" in ast.dump(decorator):
+        # Like ``name.setter``.
+        if called == "setter":
             name = f"{name}#setter"
 
-    # Finally we suffix all functions so as to catch the duplicated ones.
-    name = f"{name}{next(suffixes).value}"
+    return name
+
+
+def _build_suffix(index: int) -> str:
+    """Builds the suffix of the ``index``-th signature with the same name.
+
+    Args:
+        index: How many signatures with the same name were already built.
+
+    Returns:
+        The suffix.
+
+    Examples:
+        >>> _build_suffix(0)
+        ''
+
+        >>> _build_suffix(1)
+        '(bis)'
+
+        >>> _build_suffix(10)
+        '(11)'
+
+    .. versionadded:: 2.1.0
+
+    """
 
-    # If there are no duplicates, we continue.
-    if _is_unique(signatures, name):
-        return name
+    if index < len(_suffixes):
+        return _suffixes[index]
 
-    # Otherwise, we retry…
-    return _build_unique_name(path, node, suffixes, signatures)
+    # We ran out of latin, so we just count.
+    return f"({index + 1})"
 
 
 def _build_posarg(node: ast.FunctionDef) -> Callable[..., Any]:
@@ -197,79 +238,25 @@ def _build(node: Optional[ast.expr]) -> Any:
     return to_value(node)  # type: ignore
 
 
-@deal.pure
-def _is_unique(seq: Tuple[Signature, ...], name: str) -> bool:
-    """Check if a signature's name is unique or not.
-
-    Args:
-        seq: A sequence of signatures.
-        name: The name of a specific function.
-
-    Returns:
-        bool: Is it?
-
-
-    Examples:
-        >>> signature = Signature("name", "file.py")
-        >>> seq = [signature]
-        >>> _is_unique(seq, "nom")
-        True
-
-        >>> _is_unique(seq, "name")
-        False
-
-    .. versionadded:: 1.0.0
-
-    """
-
-    is_unique: bool = not next(_where(seq, name), False)
-
-    return is_unique
-
-
-@deal.pure
-def _where(
-        seq: Tuple[Signature, ...],
-        name: str,
-        ) -> Generator[bool, None, None]:
-    """Iterates over signatures to find the names named ``name``.
-
-    Args:
-        seq: A sequence of signatures.
-        name: The name of a specific function.
-
-    Returns:
-        A generator to find a signature by name.
-
-    Examples:
-        >>> signature = Signature("name", "file.py")
-        >>> seq = [signature]
-        >>> list(_where(seq, "name"))
-        [True]
-
-        >>> list(_where(seq, "nom"))
-        []
-
-    .. versionadded:: 1.0.0
-
-    """
-
-    return (True for el in seq if el.name == name)
-
-
 @typic.klass(always = True, strict = True)
 @dataclasses.dataclass
-class BuildSignatures(ast.NodeVisitor):
+class BuildSignatures(utils.StatementVisitor):
     """Builds signatures from the abstract syntax-tree of a revision.
 
     Attributes:
         files: The files to build signatures from.
         count: An iteration counter.
-        signatures: The built signatures.
 
     Examples:
         >>> BuildSignatures(["file.py"])
-        BuildSignatures(files=['file.py'], count=0, signatures=())
+        BuildSignatures(files=['file.py'], count=0)
+
+    .. versionchanged:: 2.1.0
+        Signatures are kept in a registry indexed by name, so that adding
+        one, and finding it an unique name, takes constant time.
+
+    .. versionchanged:: 2.1.0
+        Only statements are visited, see :class:`.StatementVisitor`.
 
     .. versionadded:: 1.0.0
 
@@ -277,7 +264,31 @@ class BuildSignatures(ast.NodeVisitor):
 
     files: Union[List[str], Tuple[str, ...]]
     count: int = 0
-    signatures: Tuple[Signature, ...] = ()
+
+    def __post_init__(self) -> None:
+        # The built signatures, in order.
+        self._signatures: List[Signature] = []
+
+        # How many signatures were built for each name, before suffixing.
+        self._names: Dict[str, int] = {}
+
+    @property
+    def signatures(self) -> Tuple[Signature, ...]:
+        """The built signatures.
+
+        Returns:
+            The signatures, in the order they were built.
+
+        Examples:
+            >>> builder = BuildSignatures(["file.py"])
+            >>> builder.signatures
+            ()
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        return tuple(self._signatures)
 
     @property
     def total(self) -> int:
@@ -334,19 +345,149 @@ class BuildSignatures(ast.NodeVisitor):
             >>> builder.count
             1
 
+        .. versionchanged:: 2.1.0
+            Equivalent to :meth:`.extract` followed by :meth:`.merge`.
+
         .. versionadded:: 1.0.0
 
         """
 
-        node = ast.parse(source, self.files[self.count], "exec")
+        self.merge(self.extract(source))
+
+    def extract(
+            self,
+            source: str,
+            file: Optional[str] = None,
+            ) -> Tuple[Signature, ...]:
+        """Extracts the signatures of a file, the current one by default.
+
+        The names of the extracted signatures are relative to their module,
+        and not yet unique, so they only depend on ``source``. That makes
+        them safe to cache, or to build elsewhere.
+
+        Arguments:
+            source: The source code of the file.
+            file: The path of the file, if not the current one, as when
+                extracting files out of order.
+
+        Returns:
+            The extracted signatures.
+
+        Examples:
+            >>> builder = BuildSignatures(["file.py"])
+            >>> builder.extract("def function(n):\\n    ...")
+            (Signature(name='function', file='file.py', arguments=(Argume...
+
+            >>> builder.count
+            0
+
+            >>> builder.extract("def function(n):\\n    ...", "other.py")
+            (Signature(name='function', file='other.py', arguments=(Argum...
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        self._file: str = self.files[self.count] if file is None else file
+        node = ast.parse(source, self._file, "exec")
+        self.extracted: List[Signature] = []
         self.visit(node)
+
+        return tuple(self.extracted)
+
+    def merge(self, signatures: Tuple[Signature, ...]) -> None:
+        """Adds the signatures extracted from the current file.
+
+        Each signature is named after its module, and suffixed so that all
+        of the built signatures have an unique name.
+
+        Arguments:
+            signatures: The signatures extracted from the current file.
+
+        Examples:
+            >>> builder = BuildSignatures(["file.py", "file.py"])
+            >>> extracted = builder.extract("def function(n):\\n    ...")
+
+            >>> builder.merge(extracted)
+            >>> builder.merge(extracted)
+            >>> [signature.name for signature in builder.signatures]
+            ['...file.function', '...file.function(bis)']
+
+            >>> builder.count
+            2
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        self._signatures.extend(self.rename(signatures))
+
+    def rename(
+            self,
+            signatures: Tuple[Signature, ...],
+            ) -> Tuple[Signature, ...]:
+        """Names the signatures extracted from the current file.
+
+        Like :meth:`.merge`, but the signatures are returned instead of kept,
+        so that they can be dropped once done with.
+
+        Arguments:
+            signatures: The signatures extracted from the current file.
+
+        Returns:
+            The signatures, with an unique name.
+
+        Examples:
+            >>> builder = BuildSignatures(["file.py", "file.py"])
+            >>> extracted = builder.extract("def function(n):\\n    ...")
+
+            >>> builder.rename(extracted)
+            (Signature(name='...file.function', file='file.py', arguments=...
+
+            >>> builder.rename(extracted)
+            (Signature(name='...file.function(bis)', file='file.py', argum...
+
+            >>> builder.signatures
+            ()
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        file: str
+        module: str
+        name: str
+        index: int
+        signature: Signature
+        renamed: List[Signature] = []
+
+        # We look for the corresponding ``file``.
+        file = self.files[self.count]
+
+        # We find the name of the module from the absolute path of the file.
+        module = _build_module(Path(file).resolve())
+
+        for signature in signatures:
+            name = f"{module}.{signature.name}"
+
+            # We count the signatures already named ``name``. As names never
+            # end with a suffix, that tells us the next free one.
+            index = self._names.get(name, 0)
+            self._names[name] = index + 1
+
+            # And we give it an unique name.
+            name = f"{name}{_build_suffix(index)}"
+            renamed.append(Signature(name, file, signature.arguments))
+
         self.count += 1
+        metrics.count("signatures.built", len(renamed))
+
+        return tuple(renamed)
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """An :obj:`ast` node visitor."""
 
         file: str
-        path: Path
         name: str
         args: Tuple[ast.arg, ...]
         kwds: Tuple[ast.arg, ...]
@@ -354,11 +495,8 @@ class BuildSignatures(ast.NodeVisitor):
         keyargs: Tuple[Argument, ...]
         signature: Signature
 
-        # We look for the corresponding ``file``.
-        file = self.files[self.count]
-
-        # We find the absolute path of the file.
-        path = Path(file).resolve()
+        # We look for the file being extracted.
+        file = self._file
 
         # We take the node name as a base for checks.
         name = node.name
@@ -368,11 +506,11 @@ class BuildSignatures(ast.NodeVisitor):
             return
 
         # We pass if it is a special function not in __init__ or __call__.
-        if name.startswith("__") and name not in ("__init__", "__call__"):
+        if name.startswith("__") and name not in _specials:
             return
 
-        # We find a unique name for each signature.
-        name = _build_unique_name(path, node, iter(Suffix), self.signatures)
+        # We build the name of the signature, relative to its module.
+        name = _build_name(node)
 
         # We build all positional arguments.
         args = tuple(node.args.args)
@@ -385,5 +523,5 @@ class BuildSignatures(ast.NodeVisitor):
         # We build the signature.
         signature = Signature(name, file, posargs + keyargs)
 
-        # And we add it to the list of signatures.
-        self.signatures = self.signatures + (signature,)
+        # And we add it to the list of extracted signatures.
+        self.extracted.append(signature)
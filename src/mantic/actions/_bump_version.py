@@ -12,6 +12,7 @@
 from nptyping import NDArray as Array
 from typing import Sequence, Tuple, Type
 
+import dataclasses
 import re
 
 import deal
@@ -53,12 +54,16 @@ class BumpVersion:
         Added default values for ``this``, ``that``, ``what``, and
         ``required``.
 
+    .. versionchanged:: 2.1.0
+        Default values for ``this`` and ``that`` are looked up when a bumper
+        is created, instead of when this module is imported.
+
     .. versionadded:: 1.0.0
 
     """
 
-    this: str = repo.versions.this()
-    that: str = repo.versions.last()
+    this: str = dataclasses.field(default_factory = repo.versions.this)
+    that: str = dataclasses.field(default_factory = repo.versions.last)
     what: Type[VersionInt] = VersionInt
     required: VersionInt = VersionInt.NONE
 
@@ -11,7 +11,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Sequence, Tuple
+from typing import Any, Iterable, Optional, Sequence, Tuple
 
 import ast
 import pathlib
@@ -22,15 +22,9 @@ import typic
 from .. import infra, utils
 from ..domain import Exit
 
-_version: str
-_version = infra.repo.versions.last()
-
-_files: Tuple[str, ...]
-_files = infra.repo.files.tree(_version)
-
 
 @typic.klass(always = True, strict = True)
-class CheckDeprecated(ast.NodeVisitor):
+class CheckDeprecated(utils.StatementVisitor):
     """Prints the list of features marked as deprecated.
 
     Attributes:
@@ -44,6 +38,10 @@ class CheckDeprecated(ast.NodeVisitor):
             The corresponding :mod:`ast` of each ``file``.
         version:
             The version to use for the expiration check.
+        revision:
+            The revision to read the ``files`` from.
+        repo:
+            The git repository path.
 
     Args:
         files:
@@ -52,6 +50,32 @@ class CheckDeprecated(ast.NodeVisitor):
         version:
             The version to use for the expiration check. Defaults to the
             current version of :mod:`.openfisca_core`.
+        revision:
+            The revision to read the ``files`` from, if any. Defaults to
+            ``None``, so files are read from the disk, as they are before
+            being committed. Files not tracked in ``revision`` are read from
+            the disk as well.
+        repo:
+            The git repository path, defaults to the current directory.
+
+    .. versionchanged:: 2.1.0
+        Files can be read in bulk, from a ``revision``, through a single
+        ``git`` process, and default files and version are looked up when a
+        checker is created, instead of when this module is imported.
+
+    .. versionchanged:: 2.1.0
+        Only statements are visited, see :class:`.StatementVisitor`.
+
+    .. versionchanged:: 2.1.0
+        Files to ``ignore`` are matched with ``.gitignore`` patterns, see
+        :mod:`.infra.ignore`.
+
+    .. versionchanged:: 2.1.0
+        Each deprecation found, and the outcome, are reported as records as
+        well, for loggers printing them, like :mod:`.infra.ndjson`.
+
+    .. versionchanged:: 2.1.0
+        Files can be checked in another ``repo`` than the current one.
 
     .. versionadded:: 1.0.0
 
@@ -64,34 +88,54 @@ class CheckDeprecated(ast.NodeVisitor):
     nodes: Tuple[ast.Module, ...]
     total: int
     version: str
+    revision: Optional[str]
     ignore: Tuple[str, ...]
+    repo: str
 
     def __init__(
             self,
             logs: Any,
-            files: Tuple[str, ...] = _files,
+            files: Optional[Tuple[str, ...]] = None,
             ignore: Tuple[str, ...] = (),
-            version: str = _version,
+            version: Optional[str] = None,
+            revision: Optional[str] = None,
+            repo: str = "",
             ) -> None:
+        if version is None:
+            version = infra.repo.versions.last(repo)
+
+        if files is None:
+            files = infra.repo.files.tree(infra.repo.versions.last(repo), repo)
+
         self.logs = logs
         self.exit = Exit.OK
         self.ignore = ignore
+        self.revision = revision
+        self.repo = repo
 
         self.files = [
             file for file in files
             if self._is_functional(file) and self._is_python(file)
             ]
 
+        sources: Iterable[Tuple[str, Optional[str]]]
+        sources = ((file, None) for file in self.files)
+
+        if revision is not None:
+            sources = infra.repo.files.blobs(revision, self.files, repo)
+
         _nodes: Iterable[ast.Module] = (
-            self._node(file)
-            for file
-            in self.files
+            self._node(file, source)
+            for file, source
+            in sources
             )
 
-        self.nodes = tuple(utils.compact(_nodes))
+        with infra.metrics.stage("parse"):
+            self.nodes = tuple(utils.compact(_nodes))
         self.total = len(self.nodes)
         self.version = version
 
+    @infra.metrics.stage("visit")
     def __call__(self) -> None:
         """Check fro deprecated features."""
 
@@ -105,6 +149,11 @@ class CheckDeprecated(ast.NodeVisitor):
             self.logs.push(self.count, self.total)
 
         self.logs.wipe()
+        self.logs.report({
+            "type": "summary",
+            "version": self.version,
+            "expired": self.exit == Exit.KO,
+            })
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         """Defines the ``visit()`` function to inspect the ``node``.
@@ -147,7 +196,7 @@ class CheckDeprecated(ast.NodeVisitor):
         file = self.files[self.count]
 
         # We find the absolute path of the file.
-        path = pathlib.Path(file).resolve()
+        path = pathlib.Path(self.repo, file).resolve()
 
         # We build the module name with the name of the parent path, a
         # folder, and the name of the file, without the extension.
@@ -163,7 +212,7 @@ class CheckDeprecated(ast.NodeVisitor):
                 continue
 
             # We only print out the deprecated functions.
-            if "deprecated" not in ast.dump(decorator):
+            if "deprecated" not in utils.called(decorator):
                 continue
 
             # We cast each keyword to ``str``.
@@ -184,6 +233,16 @@ class CheckDeprecated(ast.NodeVisitor):
                 ]
 
             self.logs.warn(f"{' '.join(message)}")
+            self.logs.report({
+                "type": "finding",
+                "name": f"{module}.{node.name}",
+                "file": file,
+                "line": lineno,
+                "reason": "expired" if self._isthis(expires) else "deprecated",
+                "since": since,
+                "expires": expires,
+                "bump": None,
+                })
 
             # If there is at least one expired deprecation, the handler
             # will exit with an error.
@@ -196,20 +255,23 @@ class CheckDeprecated(ast.NodeVisitor):
     def _isthis(self, version: str) -> bool:
         return self.version == version
 
-    def _node(self, file: str) -> ast.Module:
-        source: str
+    def _node(self, file: str, source: Optional[str]) -> ast.Module:
+        # If ``file`` is not read from a revision, we read it from the disk.
+        path: pathlib.Path = pathlib.Path(self.repo, file)
+
+        if source is None and path.resolve().exists():
+            with open(path) as f:
+                source = f.read()
 
-        if pathlib.Path(file).resolve().exists():
-            with open(file) as f:
-                source = textwrap.dedent(f.read())
-                return ast.parse(source, file, "exec")
+        if source is None:
+            return ast.Module()
 
-        return ast.Module()
+        return ast.parse(textwrap.dedent(source), file, "exec")
 
     def _is_functional(self, file: str) -> bool:
         """Checks if a given ``file`` is whitelisted as functional."""
 
-        return not any(ignore in file for ignore in self.ignore)
+        return not infra.ignore.matcher(self.ignore)(file)
 
     def _is_python(self, file: str) -> bool:
         """Checks if a given ``file`` is a python file."""
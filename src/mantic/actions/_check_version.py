@@ -11,20 +11,79 @@
 
 from __future__ import annotations
 
-from typing import Any, cast, Optional, Set, Tuple, TypeVar
+from typing import (
+    Any,
+    cast,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    )
+
+import hashlib
+import json
 
 import typic
 
+from mantic import infra
 from mantic.domain import Signature, VersionInt, VersionStr
 
 from ..types import What
 from ._bump_version import BumpVersion
-from ._parse_files import ParseFiles
-from .check_signature import CheckSignature
+from ._parse_files import _namespace as _signatures, ParseFiles
+from .check_signature import CheckSignatures
 
 T = TypeVar("T", bound = "CheckVersion")
 
-PARSER = ParseFiles(this = "HEAD")
+_namespace: str = "verdicts"
+"""Where verdicts are cached, apart from signatures."""
+
+
+class Finding(NamedTuple):
+    """A change requiring a version bump.
+
+    Attributes:
+        name: The name of the function, or None for a whole file.
+        file: The path of the file.
+        reason: What changed, like ``file-diff``, ``added``, ``removed``,
+            or ``args-diff``.
+        bump: The version bump it requires.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    name: Optional[str]
+    file: str
+    reason: Optional[str]
+    bump: VersionInt
+
+
+class Report(NamedTuple):
+    """The outcome of checking a version, see :func:`.check_version`.
+
+    Attributes:
+        this: The revision checked.
+        that: The revision it was compared with.
+        version: The version of ``this``.
+        required: The version bump required.
+        acceptable: Whether ``version`` is acceptable.
+        findings: The changes found, in the order they were found.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    this: str
+    that: str
+    version: str
+    required: VersionInt
+    acceptable: bool
+    findings: Tuple[Finding, ...]
 
 
 @typic.klass(always = True, slots = True, strict = True)
@@ -36,6 +95,41 @@ class CheckVersion:
         exit: An exit code.
         parser: A file parser.
         bump_version: A version bump_version.
+        stream: Whether to compare the files one by one.
+        fail_fast: Whether to stop as soon as the verdict is settled.
+        stopped: Whether the checks were stopped before the end.
+        cache: Whether to reuse the verdict of a previous, identical, run.
+        reasons: The changes found, as reported.
+        findings: The changes found, as records, see :mod:`.infra.ndjson`.
+
+    .. versionchanged:: 2.1.0
+        The default ``parser`` is created along with the checker, instead of
+        when this module is imported.
+
+    .. versionchanged:: 2.1.0
+        With ``stream``, both revisions of each file are parsed and compared
+        before moving on to the next file, so changes are reported as soon as
+        they are found, and only the signatures of one file are kept in
+        memory at a time.
+
+    .. versionchanged:: 2.1.0
+        With ``fail_fast``, files are compared one by one, and the checks
+        stop as soon as nothing else could change whether the current
+        version is acceptable or not.
+
+    .. versionchanged:: 2.1.0
+        Files to ``ignore`` are matched with ``.gitignore`` patterns, see
+        :mod:`.infra.ignore`.
+
+    .. versionchanged:: 2.1.0
+        With ``cache``, the verdict is stored, keyed by the trees of both
+        revisions, the versions to compare, the options, and the version of
+        :mod:`mantic`. Re-running the same check just replays the report,
+        without reading any file.
+
+    .. versionchanged:: 2.1.0
+        Each change found, and the verdict, are reported as records as well,
+        for loggers printing them, like :mod:`.infra.ndjson`.
 
     .. versionadded:: 1.0.0
 
@@ -46,21 +140,64 @@ class CheckVersion:
     parser: ParseFiles
     ignore: Tuple[str, ...]
     bump_version: BumpVersion
+    stream: bool
+    fail_fast: bool
+    stopped: bool
+    cache: bool
+    reasons: List[str]
+    findings: List[Dict[str, Any]]
 
     def __init__(
             self,
             logs: Any,
             ignore: Tuple[str, ...],
-            parser: ParseFiles = PARSER) -> None:
+            parser: Optional[ParseFiles] = None,
+            stream: bool = False,
+            fail_fast: bool = False,
+            cache: bool = False,
+            bump_version: Optional[BumpVersion] = None) -> None:
         self.logs = logs
         self.ignore = ignore
         self.exit = VersionInt.NONE
-        self.parser = parser
-        self.bump_version = BumpVersion()
+        self.parser = ParseFiles(this = "HEAD") if parser is None else parser
+        self.bump_version = bump_version or BumpVersion()
+        self.stream = stream
+        self.fail_fast = fail_fast
+        self.stopped = False
+        self.cache = cache
+        self.reasons = []
+        self.findings = []
 
     def __call__(self) -> None:
+        """Runs all the checks, unless their verdict is already known."""
+
+        key: Optional[str] = self._key() if self.cache else None
+
+        if key is not None and self._replay(key):
+            return
+
+        self._check()
+
+        if key is not None:
+            self._store(key)
+
+    def _check(self) -> None:
         """Runs all the checks."""
 
+        self.reasons = []
+        self.findings = []
+
+        if self.stream or self.fail_fast:
+            (
+                self
+                ._check_files(self.bump_version, set(self.parser.diff))
+                ._check_pairs(self.bump_version, self.parser)
+                ._check_version_acceptable(self.bump_version)
+                .logs.then()
+                )
+
+            return
+
         this: Set[Signature] = set(self._parse(self.parser, "this"))
         that: Set[Signature] = set(self._parse(self.parser, "that"))
         diff: Set[str] = set(self.parser.diff)
@@ -74,6 +211,7 @@ class CheckVersion:
             .logs.then()
             )
 
+    @infra.metrics.stage("parse")
     def _parse(self, parser: ParseFiles, what: What) -> Tuple[Signature, ...]:
         """Updates status while the parser builds signatures."""
 
@@ -88,6 +226,7 @@ class CheckVersion:
 
         return cast(Tuple[Signature, ...], parser.signatures)
 
+    @infra.metrics.stage("files")
     def _check_files(self: T, bump_version: BumpVersion, files: Set[str]) -> T:
         """Requires a bump if there's a diff in files."""
 
@@ -104,13 +243,20 @@ class CheckVersion:
             bump_version(what)
             self.exit = bump_version.required
             self.logs.wipe()
-            self.logs.warn(f"{str(bump_version.what(what))} {file}\n")
+            self._warn(
+                f"{str(bump_version.what(what))} {file}\n",
+                _finding(None, file, "file-diff", bump_version.what(what)),
+                )
             self.logs.push(count, total)
 
+            if self._stop(bump_version):
+                break
+
         self.logs.wipe()
 
         return self
 
+    @infra.metrics.stage("functions")
     def _check_funcs(
             self: T,
             bump_version: BumpVersion,
@@ -119,68 +265,184 @@ class CheckVersion:
             ) -> T:
         """Requires a bump if there's a diff in functions."""
 
-        # We first do a ``hash`` comparison, so it is still grosso modo.
-        diff: Set[Signature] = files[0] ^ files[1] & files[0]
-        total: int = len(diff)
+        count: int
+        total: int
 
         self.logs.info(f"Checking for {what} functions…\n")
         self.logs.init()
 
-        for count, this in enumerate(diff):
-            name: str
-            that: Optional[Signature]
-            checker: CheckSignature
+        for count, total in self._compare(bump_version, what, *files):
+            self.logs.push(count, total)
+
+        self.logs.wipe()
+
+        return self
+
+    @infra.metrics.stage("pairs")
+    def _check_pairs(
+            self: T,
+            bump_version: BumpVersion,
+            parser: ParseFiles,
+            ) -> T:
+        """Requires a bump if there's a diff in functions, file by file."""
+
+        count: int
+        total: int
+        this: Tuple[Signature, ...]
+        that: Tuple[Signature, ...]
+        what: VersionStr
+        these: Set[Signature]
+        those: Set[Signature]
+
+        # There is no need to even parse files if we already know.
+        if self.stopped:
+            return self
+
+        self.logs.info(
+            f"Checking for functions from {parser.that} to {parser.this}…\n",
+            )
+        self.logs.init()
 
+        for count, total, this, that in parser.pairs():
             self.logs.push(count, total)
 
+            comparisons = (
+                (VersionStr.MINOR, set(this), set(that)),
+                (VersionStr.MAJOR, set(that), set(this)),
+                )
+
+            # We count files here, so we just run through the comparisons.
+            for what, these, those in comparisons:
+                tuple(self._compare(bump_version, what, these, those))
+
+                if self.stopped:
+                    break
+
+            if self.stopped:
+                break
+
+        self.logs.wipe()
+
+        return self
+
+    def _compare(
+            self,
+            bump_version: BumpVersion,
+            what: VersionStr,
+            *files: Set[Signature],
+            ) -> Iterator[Tuple[int, int]]:
+        """Compares signatures, yielding a counter before each comparison."""
+
+        # We first do a ``hash`` comparison, so it is still grosso modo.
+        diff: Set[Signature] = files[0] ^ files[1] & files[0]
+        total: int = len(diff)
+
+        # We index the signatures we compare with by name, as names are
+        # unique within a revision.
+        index: Dict[str, Signature] = {that.name: that for that in files[1]}
+
+        # We will try to find a match between before/after signatures.
+        pairs: Tuple[Tuple[Signature, Optional[Signature]], ...] = tuple(
+            (this, index.get(this.name))
+            for this in diff
+            )
+
+        # Then we do a ``small-print`` comparison between all of the matched
+        # signatures, at once.
+        matched: Tuple[Tuple[Signature, Signature], ...] = tuple(
+            (this, that)
+            for this, that in pairs
+            if that is not None and self._is_functional(this.file)
+            )
+
+        checker = CheckSignatures(
+            tuple(this for this, _ in matched),
+            tuple(that for _, that in matched),
+            )
+
+        scores: Iterator[Tuple[int, Optional[str]]]
+        scores = zip(checker.score(), checker.reasons)
+
+        for count, (this, that) in enumerate(pairs):
+            score: int
+            reason: Optional[str]
+
+            yield count, total
+
             # If it is not a functional change, we move on.
-            if this is None or not self._is_functional(this.file):
+            if not self._is_functional(this.file):
                 continue
 
             # We know we will fail already, but we still need to determine
             # the needed version bump.
             self.exit = bump_version.required
 
-            # We will try to find a match between before/after signatures.
-            name = this.name
-            that = next((that for that in files[1] if that.name == name), None)
-
             # If we can't find a base signature with the same name, we can just
             # assume the function was added/removed, so minor/major.
             if that is None:
                 bump_version(what.to_int())
                 self.logs.wipe()
-                self.logs.warn(
+                self._warn(
                     f"{str(bump_version.what(what.to_int()))} "
-                    f"{name} => {what.name}\n")
+                    f"{this.name} => {what.name}\n",
+                    _finding(
+                        this.name,
+                        this.file,
+                        "added" if what == VersionStr.MINOR else "removed",
+                        bump_version.what(what.to_int()),
+                        ),
+                    )
                 self.exit = bump_version.required
+
+                if self._stop(bump_version):
+                    return
+
                 continue
 
-            # Now we do a ``small-print`` comparison between signatures.
-            f = CheckSignature(this, that)
+            score, reason = next(scores)
 
-            if f.score() == bump_version.what(what.to_int()).value:
+            if score == bump_version.what(what.to_int()).value:
                 bump_version(what.to_int())
                 self.logs.wipe()
-                self.logs.warn(
+                self._warn(
                     f"{str(bump_version.what(what.to_int()))} "
-                    f"{name}: {f.reason}\n"
+                    f"{this.name}: {reason}\n",
+                    _finding(
+                        this.name,
+                        this.file,
+                        reason,
+                        bump_version.what(what.to_int()),
+                        ),
                     )
                 self.exit = bump_version.required
-                continue
 
-        self.logs.wipe()
+                if self._stop(bump_version):
+                    return
 
-        return self
+                continue
 
     def _check_version_acceptable(self: T, bump_version: BumpVersion) -> T:
         """Requires a bump if there current version is not acceptable."""
 
-        self.logs.info(
-            f"Version bump required: {bump_version.required.name}!\n")
-        self.logs.okay(f"Current version: {bump_version.this}")
+        required: str = bump_version.required.name
+        acceptable: bool = bool(bump_version.is_acceptable())
 
-        if bump_version.is_acceptable():
+        # If we stopped early, a bigger bump could be required.
+        if self.stopped and bump_version.required != VersionInt.MAJOR:
+            required = f"at least {required}"
+
+        self.logs.info(f"Version bump required: {required}!\n")
+        self.logs.okay(f"Current version: {bump_version.this}")
+        self.logs.report({
+            "type": "summary",
+            "required": bump_version.required.name,
+            "stopped": self.stopped,
+            "version": bump_version.this,
+            "last": bump_version.that,
+            "acceptable": acceptable,
+            })
+
+        if acceptable:
             self.exit = VersionInt.NONE
             return self
 
@@ -188,7 +450,202 @@ class CheckVersion:
 
         return self
 
+    def _stop(self, bump_version: BumpVersion) -> bool:
+        """Checks whether to stop, as nothing else could change the verdict.
+
+        The bigger the required bump, the harder it is for a version to be
+        acceptable. So once a version is not acceptable, or once a major
+        bump is required, we already know the outcome.
+
+        """
+
+        self.stopped = self.fail_fast and (
+            bump_version.required == VersionInt.MAJOR
+            or not bump_version.is_acceptable()
+            )
+
+        return self.stopped
+
+    def _warn(self, message: str, finding: Dict[str, Any]) -> None:
+        """Reports a change, and keeps it in case the verdict is stored."""
+
+        self.reasons.append(message)
+        self.findings.append(finding)
+        self.logs.warn(message)
+        self.logs.report(finding)
+
+    def _key(self) -> str:
+        """Keys the verdict by everything it depends on.
+
+        Signatures depend on the version of mantic, and of python, so the
+        verdict is keyed by the same namespace as the signatures.
+
+        """
+
+        key: str = json.dumps([
+            _signatures(),
+            infra.repo.files.root(self.parser.this, self.parser.repo),
+            infra.repo.files.root(self.parser.that, self.parser.repo),
+            self.bump_version.this,
+            self.bump_version.that,
+            self.ignore,
+            self.parser.ignore,
+            self.stream,
+            self.fail_fast,
+            ])
+
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    @infra.metrics.stage("verdict")
+    def _replay(self, key: str) -> bool:
+        """Reports a stored verdict, if any."""
+
+        data: Optional[bytes] = infra.cache.get(_namespace, key)
+
+        if data is None:
+            return False
+
+        # If a stored verdict can't be loaded, we just check again.
+        try:
+            report: Dict[str, Any] = json.loads(data)
+            required = VersionInt(report["required"])
+            code = VersionInt(report["exit"])
+            stopped = bool(report["stopped"])
+            reasons = [str(reason) for reason in report["reasons"]]
+            findings = [dict(finding) for finding in report["findings"]]
+
+        except (ValueError, KeyError, TypeError):
+            return False
+
+        self.logs.info(
+            f"Reusing the verdict from {self.parser.that} "
+            f"to {self.parser.this}…\n",
+            )
+
+        self.reasons = []
+        self.findings = []
+
+        for reason, finding in zip(reasons, findings):
+            self._warn(reason, finding)
+
+        self.bump_version.required = required
+        self.exit = code
+        self.stopped = stopped
+        self._check_version_acceptable(self.bump_version).logs.then()
+
+        return True
+
+    def _store(self, key: str) -> None:
+        """Stores the verdict, to be replayed by identical runs."""
+
+        report: Dict[str, Any] = {
+            "required": int(self.bump_version.required),
+            "exit": int(self.exit),
+            "stopped": self.stopped,
+            "reasons": self.reasons,
+            "findings": self.findings,
+            }
+
+        infra.cache.put(_namespace, key, json.dumps(report).encode())
+
     def _is_functional(self, file: str) -> bool:
         """Checks if a given ``file`` is whitelisted as functional."""
 
-        return not any(exclude in file for exclude in self.ignore)
+        return not infra.ignore.matcher(self.ignore)(file)
+
+
+def check_version(
+        repo: str = "",
+        this: str = "HEAD",
+        that: Optional[str] = None,
+        ignore: Tuple[str, ...] = (),
+        *,
+        version: str,
+        cache: bool = True,
+        jobs: int = 1,
+        ) -> Report:
+    """Checks if the version of a revision is acceptable.
+
+    Nothing is printed, and nothing exits, so that many repositories, and
+    revisions, can be checked one after the other by the same process, and
+    share the same caches.
+
+    Args:
+        repo: The git repository path, defaults to the current directory.
+        this: The revision to check.
+        that: The tagged version to compare with, defaults to the last one.
+        ignore: The patterns of the files to leave out, see
+            :mod:`.infra.ignore`.
+        version: The version of ``this``, as the package in ``repo``
+            declares it. It is not looked up, as there is no telling where
+            each package declares it.
+        cache: Whether to reuse signatures, and verdicts, of previous runs.
+        jobs: The number of processes to parse files with, if ``0``, one
+            per available CPU.
+
+    Returns:
+        The report.
+
+    Raises:
+        TypeError: When a revision does not exist.
+        ValueError: When a version is not a valid one.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    checker: CheckVersion
+
+    if that is None:
+        that = infra.repo.versions.last(repo)
+
+    checker = CheckVersion(
+        infra.quiet,
+        ignore,
+        ParseFiles(
+            this = this,
+            that = that,
+            cache = cache,
+            jobs = jobs,
+            ignore = ignore,
+            repo = repo,
+            ),
+        cache = cache,
+        bump_version = BumpVersion(this = version, that = that),
+        )
+
+    checker()
+
+    return Report(
+        this = this,
+        that = that,
+        version = version,
+        required = checker.bump_version.required,
+        acceptable = bool(checker.bump_version.is_acceptable()),
+        findings = tuple(
+            Finding(
+                name = finding["name"],
+                file = finding["file"],
+                reason = finding["reason"],
+                bump = VersionInt[finding["bump"]],
+                )
+            for finding in checker.findings
+            ),
+        )
+
+
+def _finding(
+        name: Optional[str],
+        file: str,
+        reason: Optional[str],
+        bump: VersionInt,
+        ) -> Dict[str, Any]:
+    """A change found, as a record."""
+
+    return {
+        "type": "finding",
+        "name": name,
+        "file": file,
+        "reason": reason,
+        "bump": bump.name,
+        }
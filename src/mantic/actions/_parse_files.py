@@ -11,19 +11,37 @@
 
 from __future__ import annotations
 
-from typing import Any, cast, Generator, Optional, Set, Tuple
-
+from typing import (
+    Any,
+    cast,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    )
+
+import functools
+import hashlib
+import json
+import os
+import sys
 import textwrap
+from concurrent.futures import Future, ProcessPoolExecutor
 
 import typic
 
 from ..domain import Signature
-from ..infra import repo
+from ..infra import cache, codec, metrics, snapshot, trace
+from ..infra import repo as git
+from ..infra.ignore import pathspecs
+from ..infra.snapshot import Snapshot
 from ..types import What
-from ._build_signatures import BuildSignatures
+from ._build_signatures import BuildSignatures, settings
 
-_this: str = repo.versions.this()
-_that: str = repo.versions.last()
+Pair = Tuple[int, int, Tuple[Signature, ...], Tuple[Signature, ...]]
+"""A counter, a total, and the signatures of a file in both revisions."""
 
 
 @typic.klass(always = True, slots = True, strict = True)
@@ -31,18 +49,39 @@ class ParseFiles:
     """Wrapper around the repo and the signature builder.
 
     Attributes:
-        repo: To query files and changes from.
+        repo: The git repository path, to query files and changes from.
         this: The base revision.
         that: The revision to compare with.
         diff: The list of files changed between ``this`` and ``that``.
+        changes: The python files changed, with their object ids.
         current: ``this`` or ``that``.
         builder: A signature builder.
         signatures: The list of built signatures.
+        cache: Whether to cache the signatures extracted from each file.
+        jobs: The number of processes to extract signatures with.
+        ignore: The patterns of the files to leave out.
+        baseline: A snapshot of ``that``, to load its signatures from.
 
     Args:
-        repo: The repo to use, defaults to :class:`.Repo`.
-        this: The revision to use, defaults to ``HEAD``.
+        repo: The git repository path, defaults to the current directory.
+        this: The revision to use, defaults to the current version. Either
+            a revision, or :data:`.files.index`, for the files staged.
         that: The revision to compare ``this`` with, defaults to last version.
+        cache: Whether to cache signatures, defaults to ``True``. Also
+            whether to look for a snapshot attached to ``that``, if there is
+            no ``baseline``.
+        jobs: The number of processes to use, defaults to ``1``. If ``0``,
+            one per available CPU.
+        ignore: The patterns of the files to leave out, see
+            :mod:`.infra.ignore`. They are excluded by ``git`` itself.
+        baseline: A snapshot of ``that``, see :mod:`.infra.snapshot`, if
+            any. The signatures of ``that`` are then loaded from it, instead
+            of being parsed again.
+
+    Raises:
+        ValueError: When ``jobs`` is negative, when the ``baseline`` is not
+            a snapshot of ``that``, or when it was taken extracting
+            signatures otherwise.
 
     Examples:
         >>> parser = ParseFiles(this = "0.3.0", that = "0.2.0")
@@ -76,6 +115,34 @@ class ParseFiles:
         >>> next(iter(that ^ this & that))  # Removed functions…
         Signature(name='...', ...
 
+    .. versionchanged:: 2.1.0
+        The signatures of each file are cached by the object id of its
+        contents, so files already seen are not parsed again.
+
+        Files can be parsed by a pool of ``jobs`` processes, the largest
+        first. Signatures are still merged in the same order, so the result
+        is exactly the same as parsing them one after the other.
+
+        Default revisions are looked up when a parser is created, instead
+        of when this module is imported.
+
+        Both revisions can be streamed file by file, see :meth:`.pairs`.
+
+        Changed python files, and their object ids, are found with a single
+        raw diff, instead of listing the whole tree of each revision. Renamed
+        files are parsed on both sides.
+
+        The signatures of ``that`` can be loaded from a ``baseline``, and the
+        signatures of every file of a revision can be extracted at once, to
+        take such a baseline, see :meth:`.snapshot`. Without a baseline,
+        one attached to ``that`` as a ``git`` note is used, if any.
+
+        Files can be parsed from any ``repo``, not just the current one.
+
+        The files staged can be parsed instead of ``this`` revision, so that
+        pre-commit hooks check what is about to be committed. Only staged
+        python files are read, straight from the index.
+
     .. versionadded:: 1.0.0
 
     """
@@ -84,16 +151,70 @@ class ParseFiles:
     that: str
     current: Optional[str]
     diff: Tuple[str, ...]
+    changes: Tuple[git.files.Change, ...]
     builder: Optional[BuildSignatures]
     signatures: Optional[Tuple[Signature, ...]]
-
-    def __init__(self, *, this: str = _this, that: str = _that) -> None:
-        self.this = this
-        self.that = that
-        self.diff = repo.files.diff(this, that)
+    cache: bool
+    jobs: int
+    ignore: Tuple[str, ...]
+    baseline: Optional[Snapshot]
+    repo: str
+
+    def __init__(
+            self,
+            *,
+            this: Optional[str] = None,
+            that: Optional[str] = None,
+            cache: bool = True,
+            jobs: int = 1,
+            ignore: Tuple[str, ...] = (),
+            baseline: Optional[Snapshot] = None,
+            repo: str = "",
+            ) -> None:
+        excludes: Tuple[str, ...] = pathspecs(ignore)
+
+        if jobs < 0:
+            raise ValueError(f"Expected 0 jobs or more, got {jobs}")
+
+        self.repo = repo
+        self.this = git.versions.this() if this is None else this
+        self.that = git.versions.last(repo) if that is None else that
+        self.diff = git.files.diff(self.this, self.that, repo, *excludes)
+        self.changes = git.files.changes(
+            self.this,
+            self.that,
+            repo,
+            "*.py",
+            *excludes,
+            )
         self.current = None
         self.builder = None
         self.signatures = None
+        self.cache = cache
+        self.jobs = jobs or os.cpu_count() or 1
+        self.ignore = ignore
+        self.baseline = baseline
+
+        # Without a baseline, we use the one attached to ``that``, if any.
+        if baseline is None and cache:
+            self.baseline = snapshot.attached(self.that, repo, _namespace())
+
+        if baseline is None:
+            return
+
+        # A snapshot of any other tree would just give the wrong signatures.
+        if baseline.tree != git.files.root(self.that, repo):
+            raise ValueError(
+                f"The baseline is a snapshot of {baseline.revision}, "
+                f"not of {self.that}",
+                )
+
+        # Nor one of signatures extracted otherwise.
+        if baseline.namespace != _namespace():
+            raise ValueError(
+                f"The baseline of {baseline.revision} was taken with another "
+                "python, or extracting signatures otherwise, take it again",
+                )
 
     def __call__(self, *, what: What) -> ParseFiles:
         """We try recover the revision (``this`` or ``that``)."""
@@ -107,30 +228,23 @@ class ParseFiles:
         return self
 
     def __enter__(self) -> Generator[Tuple[int, ...], None, None]:
-        # We recover the python files corresponding to ``revison``.
-        files: Set[str] = {
-            file
-            for file in repo.files.tree(cast(str, self.current))
-            if file.endswith(".py")
-            }
-
-        # We only keep the files changed between ``this`` and ``that``.
-        to_parse: Set[str] = files & set(self.diff)
+        revision: str = cast(str, self.current)
 
-        # We create a builder with the selected files.
-        self.builder = BuildSignatures(tuple(to_parse))
+        files: Tuple[str, ...]
+        oids: Tuple[str, ...]
 
-        # And finally we iterate over the files…
-        for file in self.builder.files:
+        # We recover the changed python files of ``revision``, always in the
+        # same order, so that signatures are always named the same way.
+        files, oids = self._changed(revision)
 
-            # We recover the contents of ``file`` at ``revision``.
-            content: str = repo.files.show(cast(str, self.current), file)
+        # We create a builder with the selected files.
+        self.builder = BuildSignatures(files)
 
-            # We sanitize the source code.
-            source: str = textwrap.dedent(content)
+        # And finally we iterate over the signatures of each file…
+        for signatures in self._extract(revision, self.builder, oids):
 
-            # Then pass it on to the signature builder.
-            self.builder(source)
+            # Then pass them on to the signature builder.
+            self.builder.merge(signatures)
 
             # And we yield a counter to keep the user updated.
             yield self.builder.count, self.builder.total
@@ -138,3 +252,379 @@ class ParseFiles:
     def __exit__(self, *args: Any) -> None:
         # We save the signatures for upstream recovery.
         self.signatures = cast(BuildSignatures, self.builder).signatures
+
+    def pairs(self) -> Iterator[Pair]:
+        """Streams the signatures of each changed file, in both revisions.
+
+        Files are read one after the other, and their signatures are not
+        kept, so only the signatures of the current file are ever held in
+        memory. Signatures are named exactly as when parsing each revision
+        as a whole.
+
+        With several ``jobs``, only a few files per process are read ahead,
+        so that memory is still bounded by the largest files, and so that
+        little is read in vain when the caller stops early.
+
+        Yields:
+            A counter, the total number of files, and the signatures of the
+            file in ``this`` and in ``that``, empty if the file does not
+            exist in that revision.
+
+        Examples:
+            >>> parser = ParseFiles(this = "0.2.6", that = "0.2.5")
+            >>> count, total, these, those = next(parser.pairs())
+
+            >>> count, total > 0
+            (0, True)
+
+            >>> type(these), type(those)
+            (<class 'tuple'>, <class 'tuple'>)
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        these, these_oids = self._changed(self.this)
+        those, those_oids = self._changed(self.that)
+        files: Tuple[str, ...] = tuple(sorted({*these, *those}))
+
+        # We keep one builder per revision, so that names are unique within
+        # each revision, just as if we had parsed them as a whole.
+        this: BuildSignatures = BuildSignatures(these)
+        that: BuildSignatures = BuildSignatures(those)
+
+        # And we stream the signatures of each revision, file by file.
+        this_signatures = self._extract(self.this, this, these_oids, True)
+        that_signatures = self._extract(self.that, that, those_oids, True)
+
+        for count, file in enumerate(files):
+            yield (
+                count,
+                len(files),
+                _rename(this, this_signatures, file),
+                _rename(that, that_signatures, file),
+                )
+
+    def snapshot(self, revision: str) -> Iterator[Tuple[int, int, Snapshot]]:
+        """Extracts the signatures of every python file of ``revision``.
+
+        Files are extracted just as when parsing a revision, so the cache,
+        and the pool of ``jobs``, are used as well.
+
+        Args:
+            revision: A commit, a tag, and so on…
+
+        Yields:
+            A counter, the total number of files, and the snapshot taken so
+            far, complete once every file has been extracted.
+
+        Examples:
+            >>> parser = ParseFiles(this = "0.2.0", that = "0.2.0")
+            >>> *_, (count, total, snapshot) = parser.snapshot("0.2.0")
+
+            >>> count + 1 == total == len(snapshot.files)
+            True
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        objects: Tuple[Tuple[str, str], ...] = tuple(
+            (file, oid)
+            for file, oid in git.files.objects(revision, self.repo)
+            if file.endswith(".py")
+            )
+
+        paths: Tuple[str, ...] = tuple(file for file, _ in objects)
+        oids: Tuple[str, ...] = tuple(oid for _, oid in objects)
+        builder: BuildSignatures = BuildSignatures(paths)
+
+        taken: Snapshot = Snapshot(
+            revision = revision,
+            tree = git.files.root(revision, self.repo),
+            files = {},
+            namespace = _namespace(),
+            )
+
+        extracted = self._extract(revision, builder, oids)
+
+        for count, (file, signatures) in enumerate(zip(paths, extracted)):
+            taken.files[file] = codec.encode(signatures)
+            yield count, len(paths), taken
+
+    def _changed(
+            self,
+            revision: str,
+            ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Lists the changed python files of ``revision``, and their ids."""
+
+        changed: Dict[str, str]
+
+        # Each change tells us the path and the object id of the file on
+        # both sides, if any.
+        if revision == self.this:
+            changed = {
+                change.this: change.this_oid
+                for change in self.changes
+                if change.this is not None and change.this_oid is not None
+                }
+
+        else:
+            changed = {
+                change.that: change.that_oid
+                for change in self.changes
+                if change.that is not None and change.that_oid is not None
+                }
+
+        files: Tuple[str, ...] = tuple(sorted(changed))
+
+        return files, tuple(changed[file] for file in files)
+
+    def _extract(
+            self,
+            revision: str,
+            builder: BuildSignatures,
+            oids: Tuple[str, ...],
+            streaming: bool = False,
+            ) -> Iterator[Tuple[Signature, ...]]:
+        """Extracts the signatures of each file, unless already cached.
+
+        When ``streaming``, files are read ahead only as far as needed to
+        keep the pool of ``jobs`` busy.
+
+        """
+
+        files: Tuple[str, ...] = tuple(builder.files)
+
+        # If we have a snapshot of ``revision``, there is nothing to parse.
+        if self.baseline is not None and revision == self.that:
+            yield from (self.baseline.signatures(file) for file in files)
+            return
+
+        # We find out which files we have already seen, by object id, without
+        # loading them yet, so that we do not hold them all in memory.
+        seen: Tuple[bool, ...] = tuple(self._seen(oid) for oid in oids)
+
+        # We find out which files we still have to parse.
+        misses: Tuple[str, ...] = tuple(
+            file
+            for file, hit in zip(files, seen)
+            if not hit
+            )
+
+        extracted: Iterator[Tuple[Signature, ...]]
+
+        if self.jobs == 1 or len(misses) < 2:
+            extracted = self._extract_serial(revision, builder, misses)
+
+        else:
+            extracted = self._extract_parallel(revision, misses, streaming)
+
+        # And we yield them back in order, so that they're merged as if we
+        # had parsed every file, one after the other.
+        for file, oid, hit in zip(files, oids, seen):
+            signatures: Optional[Tuple[Signature, ...]] = None
+
+            if hit:
+                signatures = self._load(oid, file)
+
+            # If a cached entry can't be loaded, we just parse it again.
+            if hit and signatures is not None:
+                metrics.count("cache.hits")
+                yield signatures
+                continue
+
+            if self.cache:
+                metrics.count("cache.misses")
+
+            if hit:
+                signatures = next(self._extract_serial(
+                    revision,
+                    builder,
+                    (file,),
+                    ))
+
+            else:
+                signatures = next(extracted)
+
+            metrics.count("files.parsed")
+            self._dump(oid, signatures)
+
+            yield signatures
+
+    def _extract_serial(
+            self,
+            revision: str,
+            builder: BuildSignatures,
+            misses: Tuple[str, ...],
+            ) -> Iterator[Tuple[Signature, ...]]:
+        """Extracts the signatures of each file, one after the other."""
+
+        # We stream the contents of the files at ``revision``, all of them
+        # through the same git process.
+        blobs = git.files.blobs(revision, misses, self.repo)
+
+        for file, content in blobs:
+            # We sanitize the source code.
+            source: str = textwrap.dedent(cast(str, content))
+
+            # And we extract the signatures.
+            with trace.span("parse", file = file, size = len(source)) as span:
+                signatures = builder.extract(source, file)
+                span["signatures"] = len(signatures)
+
+            yield signatures
+
+    def _extract_parallel(
+            self,
+            revision: str,
+            misses: Tuple[str, ...],
+            streaming: bool = False,
+            ) -> Iterator[Tuple[Signature, ...]]:
+        """Extracts the signatures of each file, in a pool of processes.
+
+        When ``streaming``, files are sent in order, and at most two per
+        process are waiting to be yielded at any time.
+
+        """
+
+        futures: Dict[str, Future[Tuple[codec.Encoded, List[trace.Event]]]]
+        futures = {}
+        sent: Optional[Tuple[str, Optional[str]]]
+        traced: bool = trace.enabled()
+        order: Tuple[str, ...] = misses
+        ahead: int = 2 * self.jobs if streaming else len(misses)
+
+        # Unless streaming, we start with the largest files, so that a big
+        # file scheduled last does not keep everybody else waiting.
+        if not streaming:
+            order = self._largest(revision, misses)
+
+        # We stream the contents of the files from git while the workers are
+        # already parsing the ones we have sent.
+        blobs = git.files.blobs(revision, order, self.repo)
+
+        with ProcessPoolExecutor(max_workers = self.jobs) as pool:
+
+            # Then we decode the results, in the order they were asked for.
+            try:
+                for file in misses:
+
+                    # Sending as many files ahead as we are allowed to.
+                    while file not in futures or len(futures) < ahead:
+                        sent = next(blobs, None)
+
+                        if sent is None:
+                            break
+
+                        source: str = textwrap.dedent(cast(str, sent[1]))
+                        futures[sent[0]] = pool.submit(
+                            _extract_file,
+                            sent[0],
+                            source,
+                            traced,
+                            )
+
+                    encoded, events = futures.pop(file).result()
+                    trace.extend(events)
+                    yield codec.decode(encoded, file)
+
+            # If we are stopped early, there is no need to parse the rest.
+            finally:
+                for future in futures.values():
+                    future.cancel()
+
+    def _largest(
+            self,
+            revision: str,
+            files: Tuple[str, ...],
+            ) -> Tuple[str, ...]:
+        """Sorts files by size, the largest first, without reading them."""
+
+        sizes: Dict[str, int] = {
+            file: git.files.stat(revision, file, self.repo)[1]
+            for file in files
+            }
+
+        return tuple(sorted(files, key = lambda file: -sizes[file]))
+
+    def _seen(self, oid: str) -> bool:
+        """Checks whether the signatures of a file are in the cache."""
+
+        if not self.cache:
+            return False
+
+        return cache.has(_namespace(), oid)
+
+    def _load(self, oid: str, file: str) -> Optional[Tuple[Signature, ...]]:
+        """Loads the signatures of a file from the cache, if any."""
+
+        data: Optional[bytes]
+
+        if not self.cache:
+            return None
+
+        data = cache.get(_namespace(), oid)
+
+        if data is None:
+            return None
+
+        try:
+            return codec.loads(data, file)
+
+        except ValueError:
+            return None
+
+    def _dump(self, oid: str, signatures: Tuple[Signature, ...]) -> None:
+        """Stores the signatures of a file in the cache."""
+
+        if not self.cache:
+            return
+
+        cache.put(_namespace(), oid, codec.dumps(signatures))
+
+
+@functools.lru_cache(maxsize = 1)
+def _namespace() -> str:
+    """Namespaces cached signatures by version and extractor settings."""
+
+    key: str = json.dumps(
+        [git.versions.this(), sys.version_info[:2], settings],
+        sort_keys = True,
+        )
+
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _rename(
+        builder: BuildSignatures,
+        extracted: Iterator[Tuple[Signature, ...]],
+        file: str,
+        ) -> Tuple[Signature, ...]:
+    """Names the signatures of ``file``, if ``builder`` is building it."""
+
+    if builder.count >= builder.total or builder.files[builder.count] != file:
+        return ()
+
+    return builder.rename(next(extracted))
+
+
+def _extract_file(
+        file: str,
+        source: str,
+        traced: bool,
+        ) -> Tuple[codec.Encoded, List[trace.Event]]:
+    """Extracts the signatures of a file, within a worker process.
+
+    Workers record their own spans, if tracing, and send them back.
+
+    """
+
+    if traced:
+        trace.enable()
+
+    with trace.span("parse", file = file, size = len(source)) as span:
+        signatures = BuildSignatures((file,)).extract(source)
+        span["signatures"] = len(signatures)
+
+    return codec.encode(signatures), trace.disable()
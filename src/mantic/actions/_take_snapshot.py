@@ -0,0 +1,105 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Snapshot taker.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import typic
+
+from .. import infra
+from ..domain import Exit
+from ..infra.snapshot import Snapshot
+from ._parse_files import ParseFiles, _namespace
+
+
+@typic.klass(always = True, slots = True, strict = True)
+class TakeSnapshot:
+    """Writes the signatures of a revision to a snapshot file, or note.
+
+    The snapshot of a released version can then be given as a baseline to
+    :class:`.CheckVersion`, so that only the current revision is parsed.
+    Once attached to the revision as a ``git`` note, it is used as such by
+    default.
+
+    Attributes:
+        logs: A logger.
+        exit: The exit code for the task handler.
+        path: The path of the snapshot file, if any.
+        parser: A file parser, of the revision to take a snapshot of.
+
+    Args:
+        logs: A logger.
+        path: The path of the snapshot file. If None, the snapshot is
+            attached to the revision instead, see :mod:`.infra.snapshot`.
+        parser: A file parser, defaults to one of the last tagged version.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    logs: Any
+    exit: Exit
+    path: Optional[str]
+    parser: ParseFiles
+
+    def __init__(
+            self,
+            logs: Any,
+            path: Optional[str],
+            parser: Optional[ParseFiles] = None,
+            ) -> None:
+        self.logs = logs
+        self.exit = Exit.OK
+        self.path = path
+
+        if parser is None:
+            last: str = infra.repo.versions.last()
+            parser = ParseFiles(this = last, that = last)
+
+        self.parser = parser
+
+    def __call__(self) -> None:
+        """Takes the snapshot."""
+
+        count: int
+        total: int
+        revision: str = self.parser.this
+        snapshot: Optional[Snapshot] = None
+
+        self.logs.info(f"Parsing files from {revision}…\n")
+        self.logs.init()
+
+        for count, total, snapshot in self.parser.snapshot(revision):
+            self.logs.push(count, total)
+
+        self.logs.wipe()
+
+        if snapshot is None:
+            snapshot = Snapshot(
+                revision,
+                infra.repo.files.root(revision),
+                {},
+                _namespace(),
+                )
+
+        if self.path is None:
+            infra.snapshot.attach(snapshot)
+            where = infra.repo.notes.ref
+
+        else:
+            infra.snapshot.dump(snapshot, self.path)
+            where = self.path
+
+        self.logs.okay(
+            f"Snapshot of {revision}, {len(snapshot.files)} files: {where}",
+            )
+        self.logs.then()
@@ -11,7 +11,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 
 import dataclasses
 
@@ -20,6 +20,7 @@ import numpy
 import typic
 
 from mantic import utils
+from mantic.infra import metrics, trace
 from mantic.domain import Signature, VersionInt
 
 limit = 2e5
@@ -326,6 +327,8 @@ class CheckSignature:
     def score(self) -> int:
         """Calculates the score, that is the required version bump."""
 
+        metrics.count("signatures.compared")
+
         hash_score = max(diff_hash(self.this, self.that))
         args_score = max(diff_args(self.this, self.that))
         name_score = max(diff_name(self.this, self.that))
@@ -350,3 +353,164 @@ class CheckSignature:
             self.reason = "args/defaults-diff"
 
         return max(hash_score, args_score, name_score, defs_score)
+
+
+@typic.klass(always = True, slots = True, strict = True)
+@dataclasses.dataclass
+class CheckSignatures:
+    """Checks for changes between many pairs of :class:`.Signature` at once.
+
+    Scores are the same as those of :class:`.CheckSignature`, but all of the
+    pairs are packed into padded arrays of argument names and defaults, and
+    scored with a handful of array operations, instead of several tiny ones
+    per pair.
+
+    Args:
+        these: Some signatures.
+        those: Their counterparts, in the same order.
+
+    Examples
+        >>> from mantic.domain import Argument
+
+        >>> argument = Argument("count")
+        >>> default = Argument("count", "1")
+        >>> this = Signature("greet", "file.py", (argument,))
+        >>> that = Signature("greet", "file.py", (default,))
+        >>> extra = Signature("greet", "file.py", (default, argument))
+        >>> service = CheckSignatures((this, that, this), (this, this, extra))
+
+        >>> service.score()
+        array([0, 2, 3])
+
+        >>> service.reasons
+        (None, 'defaults-diff', 'args-diff')
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    these: Tuple[Signature, ...]
+    those: Tuple[Signature, ...]
+    reasons: Tuple[Optional[str], ...] = ()
+
+    @deal.pre(lambda self: len(self.these) == len(self.those))
+    def score(self) -> numpy.ndarray:
+        """Calculates the scores, that is the required version bumps."""
+
+        metrics.count("signatures.compared", len(self.these))
+
+        with trace.span("score", signatures = len(self.these)):
+            return self._score()
+
+    def _score(self) -> numpy.ndarray:
+        # The number of arguments of each signature.
+        n_this = numpy.array([len(this) for this in self.these], int)
+        n_that = numpy.array([len(that) for that in self.those], int)
+
+        # The number of arguments of the longest signature.
+        width = max(n_this.max(initial = 0), n_that.max(initial = 0), 1)
+
+        # Argument names, as ids, and whether they have a default value.
+        ids: Dict[str, int] = {}
+        names_this, nones_this = _pack(self.these, n_this, width, ids)
+        names_that, nones_that = _pack(self.those, n_that, width, ids)
+
+        # Positions where both signatures have an argument.
+        overlap = numpy.arange(width) < numpy.minimum(n_this, n_that)[:, None]
+
+        # Any change is at least a patch.
+        hash_score = numpy.where(
+            [hash(this) != hash(that) for this, that in self._pairs()],
+            VersionInt.PATCH,
+            VersionInt.NONE,
+            )
+
+        # Removing arguments is major, adding them is minor.
+        args_score = numpy.select(
+            [n_this < n_that, n_this > n_that],
+            [VersionInt.MAJOR, VersionInt.MINOR],
+            VersionInt.NONE,
+            )
+
+        # Renaming arguments is major, adding or removing them is minor.
+        name_score = numpy.select(
+            [
+                ((names_this != names_that) & overlap).any(axis = 1),
+                n_this != n_that,
+                ],
+            [VersionInt.MAJOR, VersionInt.MINOR],
+            VersionInt.NONE,
+            )
+
+        # Removing defaults is major, adding them is minor.
+        defs_score = numpy.select(
+            [
+                (nones_this > nones_that).any(axis = 1),
+                (nones_this < nones_that).any(axis = 1),
+                ],
+            [VersionInt.MAJOR, VersionInt.MINOR],
+            VersionInt.NONE,
+            )
+
+        # Reasons override each other the same way as they do for a pair.
+        reason = numpy.zeros(len(self.these), int)
+        reason = numpy.where(args_score > VersionInt.PATCH, 1, reason)
+        reason = numpy.where(name_score == VersionInt.MAJOR, 1, reason)
+        reason = numpy.where((args_score == 0) & (defs_score > 0), 2, reason)
+        reason = numpy.where(
+            (args_score == VersionInt.MINOR) & (defs_score == 0),
+            3,
+            reason,
+            )
+
+        self.reasons = tuple(_reasons[index] for index in reason)
+
+        return numpy.maximum.reduce(
+            [hash_score, args_score, name_score, defs_score],
+            )
+
+    def _pairs(self) -> Iterator[Tuple[Signature, Signature]]:
+        return zip(self.these, self.those)
+
+
+_reasons: Tuple[Optional[str], ...]
+_reasons = (None, "args-diff", "defaults-diff", "args/defaults-diff")
+
+
+def _pack(
+        signatures: Tuple[Signature, ...],
+        lengths: numpy.ndarray,
+        width: int,
+        ids: Dict[str, int],
+        ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Packs arguments into padded arrays of name ids and missing defaults.
+
+    Padding is ``-1`` for names, and ``0`` for defaults, as if no default
+    was missing, like :func:`.diff_defs` does.
+
+    """
+
+    names = numpy.full((len(signatures), width), -1, int)
+    nones = numpy.zeros((len(signatures), width), int)
+
+    arguments = [
+        argument
+        for signature in signatures
+        for argument in signature.arguments
+        ]
+
+    # The row and column of each argument.
+    rows = numpy.repeat(numpy.arange(len(signatures)), lengths)
+    cols = numpy.arange(len(arguments)) - numpy.repeat(
+        numpy.cumsum(lengths) - lengths,
+        lengths,
+        )
+
+    names[rows, cols] = [
+        ids.setdefault(argument.name, len(ids))
+        for argument in arguments
+        ]
+
+    nones[rows, cols] = [argument.default is None for argument in arguments]
+
+    return names, nones
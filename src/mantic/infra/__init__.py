@@ -5,9 +5,47 @@
 
 """Adapters (logs, git...).
 
+.. versionchanged:: 2.1.0
+    Modules are loaded on first access, not on import.
+
 .. versionadded:: 1.0.0
 
 """
 
-from . import logs  # noqa: F401
-from . import repo  # noqa: F401
+from typing import Any, TYPE_CHECKING
+
+import importlib
+
+if TYPE_CHECKING:
+    from . import cache  # noqa: F401
+    from . import codec  # noqa: F401
+    from . import ignore  # noqa: F401
+    from . import logs  # noqa: F401
+    from . import metrics  # noqa: F401
+    from . import ndjson  # noqa: F401
+    from . import profiling  # noqa: F401
+    from . import quiet  # noqa: F401
+    from . import repo  # noqa: F401
+    from . import snapshot  # noqa: F401
+    from . import trace  # noqa: F401
+
+_modules = (
+    "cache",
+    "codec",
+    "ignore",
+    "logs",
+    "metrics",
+    "ndjson",
+    "profiling",
+    "quiet",
+    "repo",
+    "snapshot",
+    "trace",
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name in _modules:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
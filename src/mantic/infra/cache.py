@@ -0,0 +1,235 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Content-addressed, on-disk cache.
+
+Entries are stored under a ``namespace``, so that a change in whatever
+produced them (a new version of :mod:`mantic`, for example) just points to
+a new, empty namespace, and stale entries are never served.
+
+The cache lives in ``$MANTIC_CACHE_DIR``, or in ``$XDG_CACHE_HOME/mantic``,
+or in ``~/.cache/mantic``, in that order.
+
+Long-running processes can keep entries in memory as well, see
+:func:`.remember`.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import os
+import tempfile
+from pathlib import Path
+
+import deal
+
+_memory: Optional[Dict[Tuple[str, str], bytes]] = None
+"""The entries read or written so far, if remembered."""
+
+
+@deal.has("read")
+def root() -> Path:
+    """Retrieves the cache directory.
+
+    Returns:
+        The path to the cache directory.
+
+    Examples:
+        >>> os.environ["MANTIC_CACHE_DIR"] = "/tmp/mantic"
+        >>> root()
+        PosixPath('/tmp/mantic')
+
+        >>> del os.environ["MANTIC_CACHE_DIR"]
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    if os.environ.get("MANTIC_CACHE_DIR"):
+        return Path(os.environ["MANTIC_CACHE_DIR"])
+
+    if os.environ.get("XDG_CACHE_HOME"):
+        return Path(os.environ["XDG_CACHE_HOME"]) / "mantic"
+
+    return Path.home() / ".cache" / "mantic"
+
+
+@deal.pre(lambda _: len(_.namespace) > 0 and len(_.key) > 2)
+@deal.has("read")
+def get(namespace: str, key: str) -> Optional[bytes]:
+    """Retrieves an entry from the cache.
+
+    Args:
+        namespace: The namespace of the entry.
+        key: The key of the entry, for example a git object id.
+
+    Returns:
+        The entry, or None if there is no such entry.
+
+    Examples:
+        >>> directory = tempfile.TemporaryDirectory()
+        >>> os.environ["MANTIC_CACHE_DIR"] = directory.name
+
+        >>> get("namespace", "abcd") is None
+        True
+
+        >>> put("namespace", "abcd", b"1")
+        >>> get("namespace", "abcd")
+        b'1'
+
+        >>> del os.environ["MANTIC_CACHE_DIR"]
+        >>> directory.cleanup()
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    value: bytes
+
+    if _memory is not None and (namespace, key) in _memory:
+        return _memory[namespace, key]
+
+    try:
+        value = _path(namespace, key).read_bytes()
+
+    except OSError:
+        return None
+
+    if _memory is not None:
+        _memory[namespace, key] = value
+
+    return value
+
+
+@deal.pre(lambda _: len(_.namespace) > 0 and len(_.key) > 2)
+@deal.has("read")
+def has(namespace: str, key: str) -> bool:
+    """Checks whether there is an entry in the cache, without reading it.
+
+    Args:
+        namespace: The namespace of the entry.
+        key: The key of the entry, for example a git object id.
+
+    Returns:
+        True if there is such an entry, False otherwise.
+
+    Examples:
+        >>> directory = tempfile.TemporaryDirectory()
+        >>> os.environ["MANTIC_CACHE_DIR"] = directory.name
+
+        >>> has("namespace", "abcd")
+        False
+
+        >>> put("namespace", "abcd", b"1")
+        >>> has("namespace", "abcd")
+        True
+
+        >>> del os.environ["MANTIC_CACHE_DIR"]
+        >>> directory.cleanup()
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    if _memory is not None and (namespace, key) in _memory:
+        return True
+
+    return _path(namespace, key).is_file()
+
+
+@deal.pre(lambda _: len(_.namespace) > 0 and len(_.key) > 2)
+@deal.has("write")
+def put(namespace: str, key: str, value: bytes) -> None:
+    """Stores an entry in the cache.
+
+    Writes are atomic, so concurrent runs can share the same cache. As the
+    cache is just an optimisation, failing to write to it is not an error.
+
+    Args:
+        namespace: The namespace of the entry.
+        key: The key of the entry, for example a git object id.
+        value: The contents of the entry.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    path: Path = _path(namespace, key)
+
+    if _memory is not None:
+        _memory[namespace, key] = value
+
+    try:
+        path.parent.mkdir(parents = True, exist_ok = True)
+
+        with tempfile.NamedTemporaryFile(
+                dir = path.parent,
+                delete = False,
+                ) as file:
+            file.write(value)
+
+        os.replace(file.name, path)
+
+    except OSError:
+        return
+
+
+@deal.has("global")
+def remember() -> None:
+    """Keeps every entry read, or written, in memory as well.
+
+    Entries are addressed by their contents, so they never go stale, but
+    they are never evicted either: this is meant for long-running processes
+    checking the same few repositories over and over again.
+
+    Examples:
+        >>> directory = tempfile.TemporaryDirectory()
+        >>> os.environ["MANTIC_CACHE_DIR"] = directory.name
+
+        >>> remember()
+        >>> put("namespace", "abcd", b"1")
+        >>> directory.cleanup()
+
+        >>> get("namespace", "abcd")
+        b'1'
+
+        >>> forget()
+        >>> get("namespace", "abcd") is None
+        True
+
+        >>> del os.environ["MANTIC_CACHE_DIR"]
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    global _memory
+
+    if _memory is None:
+        _memory = {}
+
+    return None
+
+
+@deal.has("global")
+def forget() -> None:
+    """Stops keeping entries in memory, and drops those kept so far.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    global _memory
+    _memory = None
+
+    return None
+
+
+def _path(namespace: str, key: str) -> Path:
+    return root() / namespace / key[:2] / key[2:]
@@ -0,0 +1,155 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Serialises signatures to compact, primitive values.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Tuple
+
+import json
+
+import deal
+
+from ..domain import Argument, Signature
+
+Encoded = Tuple[Tuple[str, Tuple[Tuple[str, Any], ...]], ...]
+
+
+@deal.pure
+def encode(signatures: Iterable[Signature]) -> Encoded:
+    """Encodes signatures as nested tuples of primitive values.
+
+    The file of each signature is left out, as it is already known by
+    whoever stores the signatures of a file.
+
+    Args:
+        signatures: The signatures to encode.
+
+    Returns:
+        The encoded signatures.
+
+    Examples:
+        >>> argument = Argument("count", ("1",))
+        >>> encode([Signature("greet", "file.py", (argument,))])
+        (('greet', (('count', ('1',)),)),)
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    return tuple(
+        (
+            signature.name,
+            tuple(
+                (argument.name, argument.default)
+                for argument in signature.arguments
+                ),
+            )
+        for signature in signatures
+        )
+
+
+@deal.pure
+def decode(encoded: Iterable[Any], file: str) -> Tuple[Signature, ...]:
+    """Decodes signatures previously encoded with :func:`.encode`.
+
+    Args:
+        encoded: The encoded signatures, as tuples or lists.
+        file: The file the signatures belong to.
+
+    Returns:
+        The signatures.
+
+    Examples:
+        >>> decode([["greet", [["count", ["1"]]]]], "file.py")
+        (Signature(name='greet', file='file.py', arguments=(Argument(name=...
+
+        >>> _, = decode([["greet", [["count", ["1"]]]]], "file.py")
+        >>> _.arguments
+        (Argument(name='count', default=('1',)),)
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    return tuple(
+        Signature(
+            name,
+            file,
+            tuple(
+                Argument(argument, _freeze(default))
+                for argument, default in arguments
+                ),
+            )
+        for name, arguments in encoded
+        )
+
+
+@deal.pure
+def dumps(signatures: Iterable[Signature]) -> bytes:
+    """Serialises signatures to ``JSON``.
+
+    Args:
+        signatures: The signatures to serialise.
+
+    Returns:
+        The serialised signatures.
+
+    Examples:
+        >>> dumps([Signature("greet", "file.py", (Argument("count"),))])
+        b'[["greet",[["count",null]]]]'
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    return json.dumps(encode(signatures), separators = (",", ":")).encode()
+
+
+@deal.raises(ValueError)
+@deal.has()
+def loads(data: bytes, file: str) -> Tuple[Signature, ...]:
+    """Deserialises signatures previously serialised with :func:`.dumps`.
+
+    Args:
+        data: The serialised signatures.
+        file: The file the signatures belong to.
+
+    Returns:
+        The signatures.
+
+    Raises:
+        ValueError: When ``data`` is not valid.
+
+    Examples:
+        >>> loads(b'[["greet",[["count",null]]]]', "file.py")
+        (Signature(name='greet', file='file.py', arguments=(Argument(name=...
+
+        >>> loads(b'[["greet"', "file.py")
+        Traceback (most recent call last):
+        ValueError: ...
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    try:
+        return decode(json.loads(data), file)
+    except json.JSONDecodeError as error:
+        raise ValueError(error) from error
+
+
+def _freeze(value: Any) -> Any:
+    """Lists are not hashable, so we turn them back into tuples."""
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    return value
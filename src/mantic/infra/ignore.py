@@ -0,0 +1,235 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Matches the files to ignore.
+
+Patterns follow the semantics of ``.gitignore`` files: a pattern without a
+slash, like ``tests`` or ``*.md``, matches at any depth, a pattern with a
+slash, like ``/setup.cfg`` or ``docs/*.rst``, is relative to the root of the
+repository, a trailing slash only matches directories, ``**`` matches any
+number of directories, and ``!`` brings back a previously ignored path.
+Ignoring a directory ignores everything in it.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Pattern, Sequence, Tuple
+
+import functools
+import re
+
+import deal
+
+Matcher = Callable[[str], bool]
+"""Tells whether a file is ignored."""
+
+
+@functools.lru_cache(maxsize = None)
+def matcher(patterns: Tuple[str, ...]) -> Matcher:
+    """Compiles ``patterns`` into a matcher.
+
+    All of the patterns are compiled together, and the result for each path
+    is memoised, so checking a file many times is as cheap as a lookup.
+
+    Args:
+        patterns: The patterns of the files to ignore.
+
+    Returns:
+        A function telling whether a file is ignored.
+
+    Examples:
+        >>> ignored = matcher(("tests", "/setup.cfg", "*.md", "!CHANGELOG.md"))
+
+        >>> ignored("tests/test_this.py"), ignored("src/tests/__init__.py")
+        (True, True)
+
+        >>> ignored("src/test_this.py"), ignored("src/contests.py")
+        (False, False)
+
+        >>> ignored("setup.cfg"), ignored("src/setup.cfg")
+        (True, False)
+
+        >>> ignored("README.md"), ignored("CHANGELOG.md")
+        (True, False)
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    rules: Tuple[Tuple[bool, str], ...] = tuple(
+        rule
+        for rule in map(_rule, patterns)
+        if rule is not None
+        )
+
+    regex: Pattern[str]
+    memo: Dict[str, bool] = {}
+
+    # Without negations, any match is enough, so we match them all at once.
+    if all(not negated for negated, _ in rules):
+        regex = re.compile("|".join(f"(?:{rule})" for _, rule in rules))
+
+        def ignored(file: str) -> bool:
+            if file not in memo:
+                memo[file] = bool(rules) and regex.match(file) is not None
+
+            return memo[file]
+
+        return ignored
+
+    # Otherwise the last matching pattern wins.
+    compiled: Tuple[Tuple[bool, Pattern[str]], ...] = tuple(
+        (negated, re.compile(rule))
+        for negated, rule in rules
+        )
+
+    def ignored_unless(file: str) -> bool:
+        if file not in memo:
+            memo[file] = False
+
+            for negated, pattern in reversed(compiled):
+                if pattern.match(file):
+                    memo[file] = not negated
+                    break
+
+        return memo[file]
+
+    return ignored_unless
+
+
+@deal.pure
+def pathspecs(patterns: Sequence[str]) -> Tuple[str, ...]:
+    """Translates ``patterns`` into ``git`` pathspecs excluding them.
+
+    Negated patterns can't be expressed as pathspecs, so if there is any,
+    there are no pathspecs at all, and :func:`.matcher` does all the work.
+
+    Args:
+        patterns: The patterns of the files to ignore.
+
+    Returns:
+        The pathspecs.
+
+    Examples:
+        >>> pathspecs(("tests", "/setup.cfg", "docs/"))
+        (':(exclude,glob)**/tests', ':(exclude,glob)**/tests/**', ':(exclu...
+
+        >>> pathspecs(("tests", "!tests/fixtures"))
+        ()
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    pattern: str
+    specs: List[str] = []
+
+    for pattern in patterns:
+        pattern = pattern.strip()
+
+        if not pattern or pattern.startswith("#"):
+            continue
+
+        if pattern.startswith("!"):
+            return ()
+
+        directory: bool = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+
+        # Patterns without a slash match at any depth.
+        if "/" not in pattern:
+            pattern = f"**/{pattern}"
+
+        pattern = pattern.lstrip("/")
+
+        if not directory:
+            specs.append(f":(exclude,glob){pattern}")
+
+        specs.append(f":(exclude,glob){pattern}/**")
+
+    return tuple(specs)
+
+
+def _rule(pattern: str) -> Optional[Tuple[bool, str]]:
+    """Translates a pattern into whether it is negated, and a regex."""
+
+    negated: bool
+    directory: bool
+    anchored: bool
+    regex: str
+
+    pattern = pattern.strip()
+
+    # Blank lines and comments match nothing.
+    if not pattern or pattern.startswith("#"):
+        return None
+
+    negated = pattern.startswith("!")
+    pattern = pattern[1:] if negated else pattern
+
+    # A trailing slash only matches directories, so only paths within.
+    directory = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+
+    # A slash anywhere else anchors the pattern to the root.
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    regex = _translate(pattern)
+
+    if not anchored:
+        regex = f"(?:.*/)?{regex}"
+
+    # Ignoring a directory ignores everything in it.
+    if directory:
+        return negated, f"{regex}/.*$"
+
+    return negated, f"{regex}(?:/.*)?$"
+
+
+@functools.lru_cache(maxsize = None)
+def _translate(pattern: str) -> str:
+    """Translates a glob into a regex, where ``*`` does not match slashes."""
+
+    index: int = 0
+    regex: List[str] = []
+
+    while index < len(pattern):
+        char: str = pattern[index]
+
+        if pattern.startswith("**/", index):
+            regex.append("(?:.*/)?")
+            index += 3
+
+        elif pattern.startswith("**", index):
+            regex.append(".*")
+            index += 2
+
+        elif char == "*":
+            regex.append("[^/]*")
+            index += 1
+
+        elif char == "?":
+            regex.append("[^/]")
+            index += 1
+
+        elif char == "[" and "]" in pattern[index + 1:]:
+            end: int = pattern.index("]", index + 1)
+            body: str = pattern[index + 1:end].replace("\\", "\\\\")
+
+            if body.startswith("!"):
+                body = f"^{body[1:]}"
+
+            regex.append(f"[{body}]")
+            index = end + 1
+
+        else:
+            regex.append(re.escape(char))
+            index += 1
+
+    return "".join(regex)
@@ -5,6 +5,11 @@
 
 """Provides a logger for tasks, with a progress bar!.
 
+.. versionchanged:: 2.1.0
+    The progress bar is redrawn a few times per second at most, along with
+    the throughput and the time left. When ``stdout`` is not a terminal, as
+    in continuous integration, only a few milestones are printed instead.
+
 .. versionadded:: 1.0.0
 
 """
@@ -12,9 +17,10 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Any, Dict, Optional, Sequence
 
 import sys
+import time
 
 import deal
 import termcolor
@@ -34,22 +40,76 @@ _eta_icon: str = termcolor.colored("·", "green")
 
 _bar_size: int = 50
 
+_fps: int = 10
+"""How many times per second the progress bar is redrawn, at most."""
+
+_milestone: int = 25
+"""How often progress is printed, in percent, when not in a terminal."""
+
+_started: Optional[float] = None
+"""When the progress bar was initialised."""
+
+_drawn: float = 0.0
+"""When the progress bar was last redrawn."""
+
+_reached: int = 0
+"""The last milestone printed."""
+
 
 @deal.safe
-@deal.has("stdout")
+@deal.has("global", "stdout", "time")
 def init() -> None:
-    """Initialises the progress bar."""
+    """Initialises the progress bar.
+
+    .. versionchanged:: 2.1.0
+        Nothing is printed when ``stdout`` is not a terminal.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    global _started, _drawn, _reached
+
+    _started = _drawn = time.monotonic()
+    _reached = 0
 
-    sys.stdout.write(_init_message())
+    if _interactive():
+        sys.stdout.write(_init_message())
 
 
 @deal.pre(lambda count, total: limit > count >= 0 and limit > total >= 0)
-@deal.has("stdout")
+@deal.has("global", "stdout", "time")
 def push(count: int, total: int) -> None:
-    """Pushes progress to the ``stdout``."""
+    """Pushes progress to the ``stdout``.
+
+    .. versionchanged:: 2.1.0
+        Progress is only redrawn :attr:`._fps` times per second, and the
+        last one, with the throughput and the time left. When ``stdout`` is
+        not a terminal, only every :attr:`._milestone` percent is printed.
+
+    .. versionadded:: 1.0.0
 
+    """
+
+    global _drawn, _reached
+
+    now: float = time.monotonic()
     done: int = (count + 1) * 100 // total
-    sys.stdout.write(_push_message(done))
+    milestone: int = done // _milestone * _milestone
+
+    # Skipping frames is what keeps large diffs from flooding the output.
+    if now - _drawn < 1 / _fps and count + 1 < total:
+        return
+
+    _drawn = now
+
+    if _interactive():
+        sys.stdout.write(_push_message(done, _rate(count, total, now)))
+        return
+
+    if milestone > _reached:
+        _reached = milestone
+        sys.stdout.write(_milestone_message(count, total, done, now))
 
 
 @deal.safe
@@ -76,6 +136,18 @@ def warn(message: str) -> None:
     sys.stdout.write(f"{_warn_icon} {message}")
 
 
+@deal.safe
+@deal.has()
+def report(record: Dict[str, Any]) -> None:
+    """Reports are already printed as messages, see :mod:`.ndjson`.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    return None
+
+
 @deal.safe
 @deal.has("stdout")
 def fail() -> None:
@@ -95,9 +167,17 @@ def then() -> None:
 @deal.safe
 @deal.has("stdout")
 def wipe() -> None:
-    """Cleans last printed message."""
+    """Cleans last printed message.
+
+    .. versionchanged:: 2.1.0
+        Nothing is printed when ``stdout`` is not a terminal.
 
-    sys.stdout.write(_wipe_message())
+    .. versionadded:: 1.0.0
+
+    """
+
+    if _interactive():
+        sys.stdout.write(_wipe_message())
 
 
 @deal.pure
@@ -111,9 +191,9 @@ def _init_message() -> str:
     return "".join(message)
 
 
-@deal.pre(lambda done: limit > done >= 0)
+@deal.pre(lambda done, rate = "": limit > done >= 0)
 @deal.has()
-def _push_message(done: int) -> str:
+def _push_message(done: int, rate: str = "") -> str:
     message: Sequence[str]
     spaces: str
 
@@ -125,12 +205,47 @@ def _push_message(done: int) -> str:
         f"{_work_icon} {done}% {spaces}{_bar_icon}"
         f"{_acc_icon * (done // 2)}"
         f"{_eta_icon * (_bar_size - done // 2)}"
-        f"{_bar_icon}\r"
+        f"{_bar_icon}{f' {rate}' if rate else ''}\r"
         ]
 
     return "".join(message)
 
 
+@deal.has()
+def _milestone_message(count: int, total: int, done: int, now: float) -> str:
+    rate: str = _rate(count, total, now)
+    progress: str = f"{count + 1}/{total}"
+
+    if rate:
+        progress = f"{progress}, {rate}"
+
+    return f"{_work_icon} {done}% ({progress})\n"
+
+
+@deal.has()
+def _rate(count: int, total: int, now: float) -> str:
+    """The throughput, and the time left, once there is any to tell."""
+
+    elapsed: float
+    rate: float
+    left: int
+
+    if _started is None or now <= _started:
+        return ""
+
+    elapsed = now - _started
+    rate = (count + 1) / elapsed
+    left = round(max(total - count - 1, 0) / rate)
+
+    return f"{rate:.0f}/s, ETA {left // 60}:{left % 60:02}"
+
+
+def _interactive() -> bool:
+    """Progress is only redrawn in place within a terminal."""
+
+    return sys.stdout.isatty()
+
+
 @deal.pure
 def _wipe_message() -> str:
     return f"{' ' * _bar_size * 3}\r"
@@ -0,0 +1,266 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Counts what a run does, and times its stages.
+
+Counters are always kept, as they cost no more than adding to a number, so
+they are there to print at the end of any run:
+
+* ``git.commands``: the ``git`` commands run, not counting the long-lived
+  ``git cat-file`` processes of :func:`.repo.handle`.
+* ``git.blobs`` and ``git.bytes``: the files read, and their size.
+* ``git.headers``: the files looked up, without reading them.
+* ``files.parsed``: the files parsed, that is, not cached.
+* ``cache.hits`` and ``cache.misses``: the files found in the cache, or not.
+* ``signatures.built``: the signatures built, cached or not.
+* ``signatures.compared``: the pairs of signatures scored.
+
+Peak memory is only traced while collecting, see :func:`.collecting`.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Counter,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    )
+
+import collections
+import contextlib
+import json
+import sys
+import time
+import tracemalloc
+
+_counters: Counter[str] = collections.Counter()
+"""The counters, by name."""
+
+_stages: Dict[str, float] = collections.defaultdict(float)
+"""The wall time spent in each stage, by name, in seconds."""
+
+
+def count(name: str, value: int = 1) -> None:
+    """Adds ``value`` to a counter.
+
+    Args:
+        name: The name of the counter, like ``git.blobs``.
+        value: How much to add.
+
+    Examples:
+        >>> reset()
+        >>> count("git.blobs")
+        >>> count("git.bytes", 37)
+        >>> report()["counters"]
+        {'git.blobs': 1, 'git.bytes': 37}
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    _counters[name] += value
+
+
+def stage(name: str) -> ContextManager[None]:
+    """Adds the wall time spent within to a stage.
+
+    It can be used as a decorator as well, as stages usually are methods.
+
+    Args:
+        name: The name of the stage, like ``parse``.
+
+    Examples:
+        >>> reset()
+
+        >>> with stage("parse"):
+        ...     pass
+
+        >>> list(report()["stages"])
+        ['parse']
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    return _stage(name)
+
+
+def reset() -> None:
+    """Starts counting from zero.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    _counters.clear()
+    _stages.clear()
+
+
+def report() -> Dict[str, Any]:
+    """Reports the counters, and the time spent in each stage.
+
+    Returns:
+        The counters and the stages, sorted by name, and the peak memory
+        traced in bytes, if tracing.
+
+    Examples:
+        >>> reset()
+        >>> count("files.parsed", 2)
+        >>> report()
+        {'counters': {'files.parsed': 2}, 'stages': {}, 'memory': None}
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    memory: Optional[int] = None
+
+    if tracemalloc.is_tracing():
+        memory = tracemalloc.get_traced_memory()[1]
+
+    return {
+        "counters": dict(sorted(_counters.items())),
+        "stages": dict(sorted(_stages.items())),
+        "memory": memory,
+        }
+
+
+@contextlib.contextmanager
+def collecting(
+        output_format: Optional[str],
+        output: Optional[TextIO] = None,
+        ) -> Iterator[None]:
+    """Counts whatever runs within, if there is a format to print as.
+
+    Memory is traced as well, which slows a run down, so only the times of
+    runs with statistics should be compared with one another.
+
+    The statistics are printed even when the run exits, as tasks do.
+
+    Args:
+        output_format: Either ``text`` or ``json``, if any.
+        output: Where to print the statistics, defaults to ``stderr``.
+
+    Raises:
+        ValueError: When the format is unknown.
+
+    Examples:
+        >>> import io
+
+        >>> output = io.StringIO()
+
+        >>> with collecting("json", output):
+        ...     count("files.parsed")
+
+        >>> json.loads(output.getvalue())["counters"]
+        {'files.parsed': 1}
+
+        >>> with collecting("xml"):
+        ...     pass
+        Traceback (most recent call last):
+        ValueError: Unknown format 'xml', expected one of: text, json
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    statistics: Dict[str, Any]
+
+    if output_format is None:
+        yield
+        return
+
+    if output_format not in formats:
+        raise ValueError(
+            f"Unknown format {output_format!r}, expected one of: "
+            f"{', '.join(formats)}",
+            )
+
+    reset()
+    tracemalloc.start()
+    start: float = time.perf_counter()
+
+    try:
+        yield
+
+    finally:
+        statistics = report()
+        statistics["time"] = time.perf_counter() - start
+        tracemalloc.stop()
+
+        print(
+            formats[output_format](statistics),
+            file = sys.stderr if output is None else output,
+            )
+
+
+def render(statistics: Dict[str, Any]) -> str:
+    """Renders statistics as text.
+
+    Args:
+        statistics: The statistics, as reported by :func:`.report`.
+
+    Returns:
+        The text.
+
+    Examples:
+        >>> print(render({
+        ...     "counters": {"git.blobs": 12},
+        ...     "stages": {"parse": 0.5},
+        ...     "memory": 2 ** 20,
+        ...     "time": 2.0,
+        ...     }))
+        git.blobs                      12
+        parse                      0.500s
+        memory                    1.0 MiB
+        time                       2.000s
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    lines: List[str] = []
+
+    for name, value in statistics["counters"].items():
+        lines.append(f"{name:<20} {value:>12}")
+
+    for name, value in statistics["stages"].items():
+        lines.append(f"{name:<20} {value:>11.3f}s")
+
+    if statistics.get("memory") is not None:
+        memory: float = statistics["memory"] / 2 ** 20
+        lines.append(f"{'memory':<20} {memory:>8.1f} MiB")
+
+    if statistics.get("time") is not None:
+        lines.append(f"{'time':<20} {statistics['time']:>11.3f}s")
+
+    return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def _stage(name: str) -> Iterator[None]:
+    start: float = time.perf_counter()
+
+    try:
+        yield
+
+    finally:
+        _stages[name] += time.perf_counter() - start
+
+
+formats: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "text": render,
+    "json": json.dumps,
+    }
+"""The formats statistics can be printed as, by name."""
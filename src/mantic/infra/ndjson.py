@@ -0,0 +1,60 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Provides a logger for tasks, printing reports as newline-delimited JSON.
+
+It can be given to tasks instead of :mod:`.logs`, for tools to read their
+results. Nothing but reports is printed, one JSON object per line, as soon
+as they are found: no colours, and no progress bar.
+
+Reports are either findings, like::
+
+    {"type": "finding", "name": "pkg.mod.greet", "file": "pkg/mod.py", ...}
+
+or the summary of a task, always last::
+
+    {"type": "summary", "required": "MAJOR", "version": "2.0.0", ...}
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import json
+import sys
+
+import deal
+
+from .quiet import (  # noqa: F401
+    fail,
+    info,
+    init,
+    okay,
+    push,
+    then,
+    warn,
+    wipe,
+    )
+
+
+@deal.has("stdout")
+def report(record: Dict[str, Any]) -> None:
+    """Prints a report, on a line of its own.
+
+    Args:
+        record: The report, a finding or a summary.
+
+    Examples:
+        >>> report({"type": "finding", "name": "greet", "bump": "MAJOR"})
+        {"type": "finding", "name": "greet", "bump": "MAJOR"}
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    sys.stdout.write(f"{json.dumps(record)}\n")
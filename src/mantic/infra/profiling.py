@@ -0,0 +1,230 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Profiles whole runs, and tells where the time went.
+
+The profile is written as a :mod:`pstats` file, to dig into with any of the
+usual tools, like ``snakeviz``. A short summary is printed as well, with the
+time spent in each phase of a run, measured at the functions that enter it.
+Workers parsing files in a pool of processes are not profiled, only the time
+spent waiting for them is.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import contextlib
+import cProfile
+import os
+import pstats
+import sys
+
+import deal
+
+Entry = Tuple[str, str]
+"""The end of the path of a module, and the name of a function in it."""
+
+Phase = Tuple[str, float, int]
+"""The name of a phase, the time spent in it, and how many calls it took."""
+
+phases: Tuple[Tuple[str, Tuple[Entry, ...]], ...] = (
+    ("revision resolution", (
+        ("infra/repo/versions.py", "_this"),
+        ("infra/repo/versions.py", "_last"),
+        ("infra/repo/files.py", "root"),
+        )),
+    ("tree/diff", (
+        ("infra/repo/files.py", "tree"),
+        ("infra/repo/files.py", "objects"),
+        ("infra/repo/files.py", "diff"),
+        ("infra/repo/files.py", "changes"),
+        )),
+    ("blob reads", (
+        ("infra/repo/files.py", "show"),
+        ("infra/repo/files.py", "stat"),
+        ("infra/repo/notes.py", "show"),
+        )),
+    ("extraction", (
+        ("actions/_build_signatures.py", "extract"),
+        ("infra/codec.py", "loads"),
+        ("infra/snapshot.py", "signatures"),
+        )),
+    ("scoring", (
+        ("actions/check_signature.py", "score"),
+        )),
+    ("reporting", tuple(
+        (module, name)
+        for module in ("infra/logs.py", "infra/ndjson.py", "infra/quiet.py")
+        for name in (
+            "init",
+            "push",
+            "wipe",
+            "okay",
+            "info",
+            "warn",
+            "fail",
+            "report",
+            )
+        )),
+    )
+"""The phases of a run, and the functions that enter each of them.
+
+Entries of the same phase never call each other, so that no time is counted
+twice.
+"""
+
+
+@contextlib.contextmanager
+def profiling(
+        path: Optional[str],
+        output: Optional[TextIO] = None,
+        ) -> Iterator[None]:
+    """Profiles whatever runs within, if there is a ``path`` to write to.
+
+    The profile is written, and the summary printed, even when the run
+    exits, as tasks do.
+
+    Args:
+        path: The path of the :mod:`pstats` file, if any.
+        output: Where to print the summary, defaults to ``stderr``.
+
+    Examples:
+        >>> import io
+        >>> import tempfile
+
+        >>> output = io.StringIO()
+
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     path = os.path.join(directory, "run.pstats")
+        ...
+        ...     with profiling(path, output):
+        ...         _ = sorted(range(1000))
+        ...
+        ...     os.path.exists(path)
+        True
+
+        >>> print(output.getvalue())
+        Phase ...
+        total ...
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    profile: cProfile.Profile
+
+    if path is None:
+        yield
+        return
+
+    profile = cProfile.Profile()
+    profile.enable()
+
+    try:
+        yield
+
+    finally:
+        profile.disable()
+        profile.dump_stats(path)
+
+        print(
+            render(summary(pstats.Stats(profile))),
+            file = sys.stderr if output is None else output,
+            )
+
+
+@deal.pure
+def summary(stats: pstats.Stats) -> Tuple[Phase, ...]:
+    """Sums up the time spent in each phase.
+
+    Args:
+        stats: The statistics of a profile.
+
+    Returns:
+        The time spent and the calls made in each phase, then everywhere
+        else, and in total.
+
+    Examples:
+        >>> profile = cProfile.Profile()
+        >>> _ = profile.runcall(sorted, range(1000))
+
+        >>> [name for name, _, _ in summary(pstats.Stats(profile))]
+        ['revision resolution', 'tree/diff', 'blob reads', 'extraction', ...]
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    # Each function is keyed by its file, its line, and its name, and has
+    # primitive calls, calls, its own time, its cumulative time, and its
+    # callers.
+    functions: Dict[Tuple[str, int, str], Tuple[Any, ...]]
+    functions = stats.stats  # type: ignore
+    items = functions.items()
+
+    total: float = stats.total_tt  # type: ignore
+    result: List[Phase] = []
+
+    for name, entries in phases:
+        time: float = 0.0
+        calls: int = 0
+
+        for (file, _, function), (_, count, _, cumulative, _) in items:
+            if _enters(entries, file, function):
+                time += cumulative
+                calls += count
+
+        result.append((name, time, calls))
+
+    other: float = max(0.0, total - sum(time for _, time, _ in result))
+
+    return (*result, ("other", other, 0), ("total", total, 0))
+
+
+@deal.pure
+def render(phases: Sequence[Phase]) -> str:
+    """Renders the time spent in each phase as a table.
+
+    Args:
+        phases: The phases, as summed up by :func:`.summary`.
+
+    Returns:
+        The table.
+
+    Examples:
+        >>> print(render((("extraction", 0.5, 10), ("total", 2.0, 0))))
+        Phase                    Time      %    Calls
+        extraction             0.500s   25.0       10
+        total                  2.000s  100.0
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    total: float = max((time for _, time, _ in phases), default = 0.0)
+    lines: List[str] = [f"{'Phase':<20} {'Time':>8} {'%':>6} {'Calls':>8}"]
+
+    for name, time, calls in phases:
+        share: float = 100 * time / total if total else 0.0
+        count: str = f"{calls:>8}" if calls else ""
+        line: str = f"{name:<20} {time:>7.3f}s {share:>6.1f} {count}"
+        lines.append(line.rstrip())
+
+    return "\n".join(lines)
+
+
+def _enters(entries: Tuple[Entry, ...], file: str, function: str) -> bool:
+    """Checks whether ``function``, of ``file``, enters a phase."""
+
+    path: str = file.replace(os.sep, "/")
+
+    return any(
+        path.endswith(module) and function == name
+        for module, name in entries
+        )
@@ -0,0 +1,91 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Provides a logger for tasks, printing nothing at all.
+
+It can be given to tasks instead of :mod:`.logs`, to run them from another
+program, and to read their results from the tasks themselves.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import deal
+
+
+@deal.safe
+@deal.has()
+def init() -> None:
+    """Progress is not printed."""
+
+    return None
+
+
+@deal.safe
+@deal.has()
+def push(count: int, total: int) -> None:
+    """Progress is not printed."""
+
+    return None
+
+
+@deal.safe
+@deal.has()
+def okay(message: str) -> None:
+    """Messages are not printed."""
+
+    return None
+
+
+@deal.safe
+@deal.has()
+def info(message: str) -> None:
+    """Messages are not printed."""
+
+    return None
+
+
+@deal.safe
+@deal.has()
+def warn(message: str) -> None:
+    """Messages are not printed."""
+
+    return None
+
+
+@deal.safe
+@deal.has()
+def fail() -> None:
+    """Messages are not printed."""
+
+    return None
+
+
+@deal.safe
+@deal.has()
+def then() -> None:
+    """Messages are not printed."""
+
+    return None
+
+
+@deal.safe
+@deal.has()
+def wipe() -> None:
+    """Progress is not printed."""
+
+    return None
+
+
+@deal.safe
+@deal.has()
+def report(record: Dict[str, Any]) -> None:
+    """Reports are not printed."""
+
+    return None
@@ -10,4 +10,5 @@
 """
 
 from . import files  # noqa: F401
+from . import notes  # noqa: F401
 from . import versions  # noqa: F401
@@ -0,0 +1,54 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Long-lived handles to git repositories.
+
+:mod:`git` is only imported when a handle is first asked for, as importing
+it already runs ``git``.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import functools
+import os
+
+if TYPE_CHECKING:
+    from git import Repo
+
+
+def handle(repo: str = "") -> Repo:
+    """Retrieves a long-lived handle to a git repository.
+
+    Each handle keeps its ``git cat-file --batch`` processes open, so every
+    blob requested through it is streamed by the same process, instead of
+    spawning one process per file.
+
+    Args:
+        repo: The git repository path, defaults to the current directory.
+
+    Returns:
+        The repository, always the same one for the same path.
+
+    Examples:
+        >>> handle() is handle(os.curdir)
+        True
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    return _handle(os.path.abspath(repo or os.curdir))
+
+
+@functools.lru_cache(maxsize = None)
+def _handle(path: str) -> Repo:
+    from git import Repo
+
+    return Repo(path)
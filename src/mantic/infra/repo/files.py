@@ -11,11 +11,51 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 import deal
-from git import Repo
-from git.exc import GitCommandError
+
+from .. import metrics, trace
+from ._git import handle
+
+_null: str = "0" * 40
+"""The object id git uses for files that do not exist."""
+
+index: str = ":0"
+"""Stands for the files staged in the index, wherever a revision is asked.
+
+Files are read from the index as ``:0:path``, so :func:`.show`, and
+:func:`.stat`, read staged files as they would any other. Only :func:`.root`,
+:func:`.diff` and :func:`.changes` tell it apart.
+
+.. versionadded:: 2.1.0
+
+"""
+
+
+class Change(NamedTuple):
+    """A file changed between two revisions.
+
+    Attributes:
+        status: ``A``dded, ``D``eleted, ``M``odified, ``R``enamed, and so on.
+        this: The path of the file in the newer revision, if any.
+        that: The path of the file in the older revision, if any.
+        this_oid: The object id of the file in the newer revision, if any.
+        that_oid: The object id of the file in the older revision, if any.
+
+    Examples:
+        >>> Change("A", "file.py", None, "a" * 40, None)
+        Change(status='A', this='file.py', that=None, this_oid='aaaaaaaaa...
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    status: str
+    this: Optional[str]
+    that: Optional[str]
+    this_oid: Optional[str]
+    that_oid: Optional[str]
 
 
 @deal.pre(lambda _: len(_.revision) > 0 and len(_.file) > 0)
@@ -42,18 +82,124 @@ def show(revision: str, file: str, repo: str = "") -> str:
         >>> repo = Path("./tests/fixtures").resolve()
         >>> source = show("1.0.0", "func.py", str(repo))
         >>> source
-        'def function(a, *, b, c, d):\\n    ...'
+        'def function(a, *, b, c, d):\\n    ...\\n'
+
+    .. versionchanged:: 2.1.0
+        The contents are read through a long-lived ``git cat-file --batch``
+        process, and returned verbatim.
 
     .. versionadded:: 1.0.0
 
     """
 
     try:
-        return (
-            Repo(repo)
-            .git
-            .show(f"{revision}:{file}")
-            )
+        with trace.span("git.show", revision = revision, file = file) as span:
+            _, _, size, data = (
+                handle(repo)
+                .git
+                .get_object_data(f"{revision}:{file}")
+                )
+            span["size"] = size
+
+        metrics.count("git.blobs")
+        metrics.count("git.bytes", size)
+
+        return data.decode("utf-8", "replace")
+    except ValueError as error:
+        raise TypeError(error) from error
+
+
+@deal.pre(lambda _: len(_.revision) > 0 and len(_.file) > 0)
+@deal.raises(TypeError, ValueError)
+@deal.has("io")
+def stat(revision: str, file: str, repo: str = "") -> Tuple[str, int]:
+    """Retrives the object id and the size of a file in a revision.
+
+    The file itself is not read, so this is a cheap way to find out whether
+    the contents of a file have already been seen before.
+
+    Args:
+        revision: A commit, a tag, and so on…
+        file: The relative file path.
+        repo: The git repository path.
+
+    Returns:
+        A tuple with the object id and the size of the file.
+
+    Raises:
+        TypeError: When arguments are invalid.
+
+    Examples:
+        >>> from pathlib import Path
+
+        >>> repo = Path("./tests/fixtures").resolve()
+        >>> oid, size = stat("1.0.0", "func.py", str(repo))
+        >>> type(oid).__name__, len(oid), size
+        ('str', 40, 37)
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    try:
+        with trace.span("git.stat", revision = revision, file = file):
+            oid, _, size = (
+                handle(repo)
+                .git
+                .get_object_header(f"{revision}:{file}")
+                )
+
+        metrics.count("git.headers")
+
+        return oid.decode(), size
+    except ValueError as error:
+        raise TypeError(error) from error
+
+
+@deal.pre(lambda _: len(_.revision) > 0)
+@deal.raises(TypeError, ValueError)
+@deal.has("import", "io")
+def root(revision: str, repo: str = "") -> str:
+    """Retrives the object id of the tree of a revision.
+
+    Two revisions with the same tree have exactly the same files, whatever
+    their history, so this is a cheap way to identify their contents.
+
+    The tree of the :data:`.index` is written to the object database first,
+    just as ``git commit`` would.
+
+    Args:
+        revision: A commit, a tag, and so on…
+        repo: The git repository path.
+
+    Returns:
+        The object id of the tree.
+
+    Raises:
+        TypeError: When arguments are invalid.
+
+    Examples:
+        >>> from pathlib import Path
+
+        >>> repo = Path("./tests/fixtures").resolve()
+        >>> oid = root("1.0.0", str(repo))
+        >>> type(oid).__name__, len(oid)
+        ('str', 40)
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    from git.exc import GitCommandError
+
+    try:
+        metrics.count("git.commands")
+
+        with trace.span("git.root", revision = revision):
+            if revision == index:
+                return handle(repo).git.write_tree().strip()
+
+            return handle(repo).git.rev_parse(f"{revision}^{{tree}}").strip()
     except GitCommandError as error:
         raise TypeError(error) from error
 
@@ -61,6 +207,50 @@ def show(revision: str, file: str, repo: str = "") -> str:
 @deal.pre(lambda _: len(_.revision) > 0)
 @deal.raises(TypeError, ValueError)
 @deal.has("io")
+def blobs(
+        revision: str,
+        files: Iterable[str],
+        repo: str = "",
+        ) -> Iterator[Tuple[str, Optional[str]]]:
+    """Streams the contents of several files in a revision.
+
+    All the files are read through the same ``git cat-file --batch``
+    process, so this is way cheaper than calling :func:`.show` over and
+    over again for large sets of files.
+
+    Args:
+        revision: A commit, a tag, and so on…
+        files: The relative file paths.
+        repo: The git repository path.
+
+    Yields:
+        A tuple with each file and its contents, or None if the file does
+        not exist in ``revision``.
+
+    Examples:
+        >>> from pathlib import Path
+
+        >>> repo = Path("./tests/fixtures").resolve()
+        >>> reads = blobs("1.0.0", ["func.py", "nope.py"], str(repo))
+        >>> [(file, data is None) for file, data in reads]
+        [('func.py', False), ('nope.py', True)]
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    file: str
+
+    for file in files:
+        try:
+            yield file, show(revision, file, repo)
+        except TypeError:
+            yield file, None
+
+
+@deal.pre(lambda _: len(_.revision) > 0)
+@deal.raises(TypeError, ValueError)
+@deal.has("import", "io")
 def tree(revision: str, repo: str = "") -> Tuple[str, ...]:
     """Retrives the list of tracked files in a revision.
 
@@ -85,27 +275,96 @@ def tree(revision: str, repo: str = "") -> Tuple[str, ...]:
     .. versionadded:: 1.0.0
 
     """
+
+    from git.exc import GitCommandError
+
     try:
-        return tuple(
-            Repo(repo)
-            .git
-            .ls_tree("-r", "--name-only", revision)
-            .split()
-            )
+        metrics.count("git.commands")
+
+        with trace.span("git.tree", revision = revision):
+            return tuple(
+                handle(repo)
+                .git
+                .ls_tree("-r", "--name-only", revision)
+                .split()
+                )
     except GitCommandError as error:
         raise TypeError(error) from error
 
 
+@deal.pre(lambda _: len(_.revision) > 0)
+@deal.raises(TypeError, ValueError)
+@deal.has("import", "io")
+def objects(revision: str, repo: str = "") -> Tuple[Tuple[str, str], ...]:
+    """Retrives the tracked files in a revision, with their object ids.
+
+    Args:
+        revision: A commit, a tag, and so on…
+        repo: The git repository path.
+
+    Returns:
+        A sequence with the files' names and object ids.
+
+    Raises:
+        TypeError: When arguments are invalid.
+
+    Examples:
+        >>> from pathlib import Path
+
+        >>> repo = Path("./tests/fixtures").resolve()
+        >>> files = objects("1.0.0", str(repo))
+        >>> [file for file, _ in files] == list(tree("1.0.0", str(repo)))
+        True
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    from git.exc import GitCommandError
+
+    output: str
+    record: str
+    result: List[Tuple[str, str]] = []
+
+    try:
+        metrics.count("git.commands")
+
+        with trace.span("git.objects", revision = revision):
+            output = handle(repo).git.ls_tree("-r", "-z", revision)
+
+    except GitCommandError as error:
+        raise TypeError(error) from error
+
+    # Records look like ``mode type oid\tpath\0``.
+    for record in output.split("\0"):
+        if not record:
+            continue
+
+        header, path = record.split("\t", 1)
+        _, kind, oid = header.split(" ")
+
+        if kind == "blob":
+            result.append((path, oid))
+
+    return tuple(result)
+
+
 @deal.pre(lambda _: len(_.this) > 0 and len(_.that) > 0)
 @deal.raises(TypeError, ValueError)
-@deal.has("io")
-def diff(this: str, that: str, repo: str = "") -> Tuple[str, ...]:
+@deal.has("import", "io")
+def diff(
+        this: str,
+        that: str,
+        repo: str = "",
+        *pathspecs: str,
+        ) -> Tuple[str, ...]:
     """Retrives the list of changed files between two revisions.
 
     Args:
         this: A commit, a tag, and so on…
         that: The same as ``that``, but in the past…
         repo: The git repository path.
+        pathspecs: Only the paths matching any of these, like ``*.py``.
 
     Returns:
         A sequence with the files' names.
@@ -120,16 +379,145 @@ def diff(this: str, that: str, repo: str = "") -> Tuple[str, ...]:
         >>> diff("2.0.0", "1.0.0", str(repo))
         ('func.py',)
 
+        >>> diff("2.0.0", "1.0.0", str(repo), ":(exclude)func.py")
+        ()
+
+    .. versionchanged:: 2.1.0
+        Added ``pathspecs``. ``this`` can be the :data:`.index`.
+
     .. versionadded:: 1.0.0
 
     """
 
+    from git.exc import GitCommandError
+
     try:
-        return tuple(
-            Repo(repo)
-            .git
-            .diff("--name-only", f"{that}..{this}")
-            .split()
-            )
+        metrics.count("git.commands")
+
+        with trace.span("git.diff", this = this, that = that):
+            return tuple(
+                handle(repo)
+                .git
+                .diff("--name-only", *_range(this, that), "--", *pathspecs)
+                .split()
+                )
     except GitCommandError as error:
         raise TypeError(error) from error
+
+
+@deal.pre(lambda _: len(_.this) > 0 and len(_.that) > 0)
+@deal.raises(TypeError, ValueError)
+@deal.has("import", "io")
+def changes(
+        this: str,
+        that: str,
+        repo: str = "",
+        *pathspecs: str,
+        ) -> Tuple[Change, ...]:
+    """Retrives the changes between two revisions, with their object ids.
+
+    Unlike :func:`.diff`, renames are detected, and the object id of each
+    side of a change is known, without having to list any tree.
+
+    When ``this`` is the :data:`.index`, the changes are those staged, so
+    only the files about to be committed are ever read.
+
+    Args:
+        this: A commit, a tag, and so on…
+        that: The same as ``that``, but in the past…
+        repo: The git repository path.
+        pathspecs: Only the paths matching any of these, like ``*.py``.
+
+    Returns:
+        A sequence with the changes.
+
+    Raises:
+        TypeError: When arguments are invalid.
+
+    Examples:
+        >>> from pathlib import Path
+
+        >>> repo = Path("./tests/fixtures").resolve()
+        >>> changes("2.0.0", "1.0.0", str(repo), "*.py")
+        (Change(status='M', this='func.py', that='func.py', this_oid='a3e...
+
+        >>> changes("2.0.0", "1.0.0", str(repo), "*.txt")
+        ()
+
+        >>> changes(index, "1.0.0", str(repo), "*.txt")
+        ()
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    from git.exc import GitCommandError
+
+    output: str
+    header: str
+    result: List[Change] = []
+
+    try:
+        metrics.count("git.commands")
+
+        with trace.span("git.changes", this = this, that = that):
+            # The index can only be compared with ``git diff --cached``.
+            command = handle(repo).git.diff_tree
+
+            if this == index:
+                command = handle(repo).git.diff
+
+            output = command(
+                "-r",
+                "-z",
+                "--raw",
+                "--find-renames",
+                *_range(this, that),
+                "--",
+                *pathspecs,
+                )
+
+    except GitCommandError as error:
+        raise TypeError(error) from error
+
+    # Records look like ``:mode mode oid oid status\0path\0``, with one
+    # more path for renames and copies.
+    records = iter(output.split("\0"))
+
+    for header in records:
+        if not header:
+            break
+
+        _, _, that_oid, this_oid, status = header.lstrip(":").split(" ")
+        that_path: Optional[str] = next(records)
+        this_path: Optional[str] = that_path
+
+        if status[0] in "RC":
+            this_path = next(records)
+
+        if status[0] == "A":
+            that_path = None
+
+        if status[0] == "D":
+            this_path = None
+
+        result.append(
+            Change(
+                status[0],
+                this_path,
+                that_path,
+                None if this_oid == _null else this_oid,
+                None if that_oid == _null else that_oid,
+                ),
+            )
+
+    return tuple(result)
+
+
+def _range(this: str, that: str) -> Tuple[str, ...]:
+    """What to diff, the index being compared with ``--cached``."""
+
+    if this == index:
+        return "--cached", that
+
+    return that, this
@@ -0,0 +1,149 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Reads and writes the notes :mod:`mantic` attaches to commits.
+
+Notes are kept under their own ref, ``refs/notes/mantic``, so they never
+get mixed up with anybody else's notes. They are not pushed, nor fetched, by
+default, so to share them::
+
+    git push origin refs/notes/mantic
+    git fetch origin refs/notes/mantic:refs/notes/mantic
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import io
+
+import deal
+
+from .. import metrics, trace
+from ._git import handle
+
+ref: str = "refs/notes/mantic"
+"""The ref notes are kept under."""
+
+
+@deal.pre(lambda _: len(_.revision) > 0)
+@deal.raises(TypeError, ValueError)
+@deal.has("import", "io")
+def show(revision: str, repo: str = "") -> Optional[bytes]:
+    """Retrieves the note attached to the commit of a revision, if any.
+
+    Args:
+        revision: A commit, a tag, and so on…
+        repo: The git repository path.
+
+    Returns:
+        The contents of the note, verbatim, or None if there is no note.
+
+    Examples:
+        >>> import subprocess
+        >>> import tempfile
+
+        >>> with tempfile.TemporaryDirectory() as repo:
+        ...     for command in (
+        ...             ("init", "-q"),
+        ...             ("config", "user.name", "mantic"),
+        ...             ("config", "user.email", "mantic@example.com"),
+        ...             ("commit", "-q", "--allow-empty", "-m", "Init"),
+        ...             ):
+        ...         _ = subprocess.run(("git", *command), cwd = repo)
+        ...
+        ...     before = show("HEAD", repo)
+        ...     add("HEAD", b"\\x00note\\n", repo)
+        ...     before, show("HEAD", repo)
+        (None, b'\\x00note\\n')
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    from git.exc import GitCommandError
+
+    oid: str
+
+    # There is no note, or no notes at all, when this fails.
+    try:
+        metrics.count("git.commands")
+
+        with trace.span("git.notes", revision = revision):
+            oid = handle(repo).git.notes(
+                "--ref",
+                ref,
+                "list",
+                _commit(revision),
+                )
+
+    except GitCommandError:
+        return None
+
+    try:
+        with trace.span("git.show", revision = revision) as span:
+            _, _, size, data = handle(repo).git.get_object_data(oid.strip())
+            span["size"] = size
+
+        metrics.count("git.blobs")
+        metrics.count("git.bytes", size)
+
+        return data
+
+    except ValueError as error:
+        raise TypeError(error) from error
+
+
+@deal.pre(lambda _: len(_.revision) > 0)
+@deal.raises(TypeError, ValueError)
+@deal.has("import", "io", "write")
+def add(revision: str, data: bytes, repo: str = "") -> None:
+    """Attaches a note to the commit of a revision, replacing any other.
+
+    The note is stored as is, so it may well be binary.
+
+    Args:
+        revision: A commit, a tag, and so on…
+        data: The contents of the note.
+        repo: The git repository path.
+
+    Raises:
+        TypeError: When arguments are invalid.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    from git.exc import GitCommandError
+    from gitdb import IStream
+
+    # ``git notes add -m`` would clean the note up, so we store it first.
+    stream = IStream("blob", len(data), io.BytesIO(data))
+    oid: str = handle(repo).odb.store(stream).hexsha.decode()
+
+    try:
+        metrics.count("git.commands")
+
+        handle(repo).git.notes(
+            "--ref",
+            ref,
+            "add",
+            "--force",
+            "-C",
+            oid,
+            _commit(revision),
+            )
+
+    except GitCommandError as error:
+        raise TypeError(error) from error
+
+
+def _commit(revision: str) -> str:
+    """Notes are attached to commits, even when a tag is given."""
+
+    return f"{revision}^{{commit}}"
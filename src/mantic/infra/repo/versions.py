@@ -12,9 +12,14 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import sys
+
 import deal
-import pkg_resources
-from git import Repo
+
+from .. import metrics, trace
+from ._git import handle
 
 
 @deal.pure
@@ -30,15 +35,15 @@ def this() -> str:
         >>> major.isdecimal()
         True
 
+    .. versionchanged:: 2.1.0
+        Memoised, so it is only looked up once per process, and looked up
+        with :mod:`importlib.metadata` when available.
+
     .. versionadded:: 1.0.0
 
     """
 
-    return (
-        pkg_resources
-        .get_distribution("mantic")
-        .version
-        )
+    return _this()
 
 
 @deal.pure
@@ -58,13 +63,53 @@ def last(repo: str = "") -> str:
         >>> last(str(repo))
         '10.0.0'
 
+    .. versionchanged:: 2.1.0
+        Memoised, so it is only looked up once per process and repository.
+
     .. versionadded:: 1.0.0
 
     """
 
+    return _last(os.path.abspath(repo or os.curdir))
+
+
+def forget() -> None:
+    """Forgets the last tagged versions looked up so far.
+
+    Long-running processes call it before each check, as new versions may
+    have been tagged since.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    _last.cache_clear()
+
+
+@functools.lru_cache(maxsize = 1)
+def _this() -> str:
+    if sys.version_info >= (3, 8):
+        from importlib import metadata
+
+        return metadata.version("mantic")
+
+    import pkg_resources
+
     return (
-        Repo(repo)
-        .git
-        .describe("--tags", "--abbrev=0", "--first-parent")
-        .split()[0]
+        pkg_resources
+        .get_distribution("mantic")
+        .version
         )
+
+
+@functools.lru_cache(maxsize = None)
+def _last(repo: str) -> str:
+    metrics.count("git.commands")
+
+    with trace.span("git.describe"):
+        return (
+            handle(repo)
+            .git
+            .describe("--tags", "--abbrev=0", "--first-parent")
+            .split()[0]
+            )
@@ -0,0 +1,339 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Snapshots of the signatures of a revision.
+
+A snapshot holds the signatures of every python file of a revision, as
+extracted, along with the tree of the revision they were extracted from.
+Released versions never change, so their snapshot can be taken once, and
+loaded instead of parsing them over and over again.
+
+Snapshots are written to compressed ``JSON`` files, or attached to the
+commit of their revision, as ``git`` notes. Either way, they are only valid
+for the version of :mod:`mantic` they were taken with, and for the way
+signatures were extracted, see :attr:`.Snapshot.namespace`.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import functools
+import gzip
+import json
+
+import deal
+
+from ..domain import Signature
+from . import codec, repo
+from .repo import files, notes
+
+_format: int = 2
+"""The version of the format of snapshots."""
+
+
+class Snapshot(NamedTuple):
+    """The signatures of every python file of a revision.
+
+    Attributes:
+        revision: The revision the snapshot was taken of.
+        tree: The object id of the tree of ``revision``.
+        files: The signatures of each file, by path, as encoded by
+            :func:`.codec.encode`. They are only decoded when asked for.
+        namespace: The way signatures were extracted, as the version of
+            python and the settings of the extractor. Signatures extracted
+            otherwise are not to be compared with.
+
+    Examples:
+        >>> snapshot = Snapshot("1.0.0", "a" * 40, {
+        ...     "file.py": (("greet", (("count", None),)),),
+        ...     })
+
+        >>> snapshot.signatures("file.py")
+        (Signature(name='greet', file='file.py', arguments=(Argument(name=...
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    revision: str
+    tree: str
+    files: Dict[str, Any]
+    namespace: str = ""
+
+    def signatures(self, file: str) -> Tuple[Signature, ...]:
+        """Decodes the signatures of a ``file``, as they were extracted.
+
+        Args:
+            file: The path of the file.
+
+        Returns:
+            The signatures of the file.
+
+        Raises:
+            KeyError: When the file is not in the snapshot.
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        return codec.decode(self.files[file], file)
+
+
+@deal.pure
+def dumps(snapshot: Snapshot) -> bytes:
+    """Serialises a ``snapshot`` to ``JSON``.
+
+    Args:
+        snapshot: The snapshot to serialise.
+
+    Returns:
+        The serialised snapshot.
+
+    Examples:
+        >>> dumps(Snapshot("1.0.0", "a" * 40, {}))
+        b'{"format":2,"mantic":"...","namespace":"","revision":"1.0.0",...
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    data: Dict[str, Any] = {
+        "format": _format,
+        "mantic": repo.versions.this(),
+        "namespace": snapshot.namespace,
+        "revision": snapshot.revision,
+        "tree": snapshot.tree,
+        "files": snapshot.files,
+        }
+
+    return json.dumps(data, separators = (",", ":")).encode()
+
+
+@deal.raises(ValueError)
+@deal.has()
+def loads(data: bytes, namespace: Optional[str] = None) -> Snapshot:
+    """Deserialises a snapshot previously serialised with :func:`.dumps`.
+
+    Args:
+        data: The serialised snapshot.
+        namespace: The way signatures are extracted now, if it matters.
+
+    Returns:
+        The snapshot.
+
+    Raises:
+        ValueError: When ``data`` is not a valid snapshot, or when it was
+            taken with another version of :mod:`mantic`, or in another
+            ``namespace``.
+
+    Examples:
+        >>> loads(dumps(Snapshot("1.0.0", "a" * 40, {})))
+        Snapshot(revision='1.0.0', tree='aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa...
+
+        >>> loads(b'{"format": 0}')
+        Traceback (most recent call last):
+        ValueError: Not a snapshot, or an outdated one
+
+        >>> loads(dumps(Snapshot("1.0.0", "a" * 40, {}, "py38")), "py39")
+        Traceback (most recent call last):
+        ValueError: Taken with another python, or extracting signatures ...
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    snapshot: Dict[str, Any] = json.loads(data)
+
+    if not isinstance(snapshot, dict) or snapshot.get("format") != _format:
+        raise ValueError("Not a snapshot, or an outdated one")
+
+    # Signatures could be extracted differently by another version.
+    if snapshot.get("mantic") != repo.versions.this():
+        raise ValueError(
+            f"Taken with mantic {snapshot.get('mantic')}, take it again "
+            f"with mantic {repo.versions.this()}",
+            )
+
+    # Or with another python, whose syntax tree may differ.
+    if namespace is not None and snapshot.get("namespace") != namespace:
+        raise ValueError(
+            "Taken with another python, or extracting signatures otherwise, "
+            "take it again",
+            )
+
+    try:
+        return Snapshot(
+            revision = str(snapshot["revision"]),
+            tree = str(snapshot["tree"]),
+            files = dict(snapshot["files"]),
+            namespace = str(snapshot["namespace"]),
+            )
+
+    except (KeyError, TypeError) as error:
+        raise ValueError("Not a valid snapshot") from error
+
+
+@deal.has("write")
+def dump(snapshot: Snapshot, path: str) -> None:
+    """Writes a ``snapshot`` to a compressed file.
+
+    Args:
+        snapshot: The snapshot to write.
+        path: The path of the file.
+
+    Examples:
+        >>> import tempfile
+
+        >>> snapshot = Snapshot("1.0.0", "a" * 40, {"file.py": ()})
+
+        >>> with tempfile.NamedTemporaryFile() as file:
+        ...     dump(snapshot, file.name)
+        ...     load(file.name).signatures("file.py")
+        ()
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    with gzip.open(path, "wb") as file:
+        file.write(dumps(snapshot))
+
+
+@deal.raises(OSError, ValueError)
+@deal.has("read")
+def load(path: str, namespace: Optional[str] = None) -> Snapshot:
+    """Reads a snapshot previously written with :func:`.dump`.
+
+    Args:
+        path: The path of the file.
+        namespace: The way signatures are extracted now, if it matters.
+
+    Returns:
+        The snapshot.
+
+    Raises:
+        OSError: When the file can't be read.
+        ValueError: When the file is not a valid snapshot, or when it was
+            taken with another version of :mod:`mantic`, or in another
+            ``namespace``.
+
+    Examples:
+        >>> import tempfile
+
+        >>> with tempfile.NamedTemporaryFile() as file:
+        ...     _ = file.write(gzip.compress(b'{"format": 0}'))
+        ...     _ = file.seek(0)
+        ...     load(file.name)
+        Traceback (most recent call last):
+        ValueError: ...: Not a snapshot, or an outdated one
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    with gzip.open(path, "rb") as file:
+        data: bytes = file.read()
+
+    try:
+        return loads(data, namespace)
+
+    except ValueError as error:
+        raise ValueError(f"{path}: {error}") from error
+
+
+@deal.raises(TypeError, ValueError)
+@deal.has("io", "write")
+def attach(snapshot: Snapshot, repo: str = "") -> None:
+    """Attaches a ``snapshot`` to the commit it was taken of, as a note.
+
+    Git already compresses notes, so they are stored as plain ``JSON``. See
+    :mod:`.repo.notes` to share them.
+
+    Args:
+        snapshot: The snapshot to attach.
+        repo: The git repository path.
+
+    Raises:
+        TypeError: When the revision of the snapshot does not exist.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    notes.add(snapshot.revision, dumps(snapshot), repo)
+
+
+@deal.raises(TypeError, ValueError)
+@deal.has("io")
+def attached(
+        revision: str,
+        repo: str = "",
+        namespace: Optional[str] = None,
+        ) -> Optional[Snapshot]:
+    """Retrieves the snapshot attached to the commit of a revision, if any.
+
+    A snapshot taken with another version of :mod:`mantic`, in another
+    ``namespace``, or of another tree, is just as good as no snapshot at all.
+
+    Args:
+        revision: A commit, a tag, and so on…
+        repo: The git repository path.
+        namespace: The way signatures are extracted now, if it matters.
+
+    Returns:
+        The snapshot, or None if there is no valid snapshot.
+
+    Examples:
+        >>> import subprocess
+        >>> import tempfile
+
+        >>> with tempfile.TemporaryDirectory() as repo:
+        ...     for command in (
+        ...             ("init", "-q"),
+        ...             ("config", "user.name", "mantic"),
+        ...             ("config", "user.email", "mantic@example.com"),
+        ...             ("commit", "-q", "--allow-empty", "-m", "Init"),
+        ...             ("tag", "1.0.0"),
+        ...             ):
+        ...         _ = subprocess.run(("git", *command), cwd = repo)
+        ...
+        ...     tree = files.root("1.0.0", repo)
+        ...     before = attached("1.0.0", repo)
+        ...     attach(Snapshot("1.0.0", tree, {}, "py39"), repo)
+        ...     after = attached("1.0.0", repo, "py39")
+        ...     before, after.tree == tree, attached("1.0.0", repo, "py38")
+        (None, True, None)
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    data: Optional[bytes] = notes.show(revision, repo)
+    snapshot: Optional[Snapshot]
+
+    if data is None:
+        return None
+
+    snapshot = _loads(data, namespace)
+
+    if snapshot is None or snapshot.tree != files.root(revision, repo):
+        return None
+
+    return snapshot
+
+
+@functools.lru_cache(maxsize = 8)
+def _loads(data: bytes, namespace: Optional[str]) -> Optional[Snapshot]:
+    """Long-running processes only decode the same note once."""
+
+    try:
+        return loads(data, namespace)
+
+    except ValueError:
+        return None
@@ -0,0 +1,223 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Records spans of time, to see where a run goes file by file.
+
+Spans are written as Chrome trace events, so a run can be opened in any
+trace viewer, like ``chrome://tracing`` or https://ui.perfetto.dev.
+
+Unless tracing is enabled, a span does nothing at all, and costs no more
+than a function call.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    )
+
+import contextlib
+import json
+import os
+import threading
+import time
+
+import deal
+
+Event = Dict[str, Any]
+"""A Chrome trace event."""
+
+
+class _Discard(Dict[str, Any]):
+    """The arguments of spans when not tracing, thrown away as set."""
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        pass
+
+
+_events: Optional[List[Event]] = None
+"""The events recorded so far, or None when not tracing."""
+
+_disabled: ContextManager[Dict[str, Any]] = contextlib.nullcontext(_Discard())
+"""The span of everything, when not tracing."""
+
+
+def enable() -> None:
+    """Starts tracing, forgetting about any previous events.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    global _events
+    _events = []
+
+
+def disable() -> List[Event]:
+    """Stops tracing.
+
+    Returns:
+        The events recorded since tracing was enabled.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    global _events
+    events, _events = _events or [], None
+    return events
+
+
+def enabled() -> bool:
+    """Tells whether spans are being recorded.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    return _events is not None
+
+
+def span(name: str, **args: Any) -> ContextManager[Dict[str, Any]]:
+    """Records the time spent within, if tracing.
+
+    Args:
+        name: The name of the span, like ``git.show``.
+        **args: What the span is about, like a file, or a revision.
+
+    Returns:
+        A context yielding the arguments of the span, to add to them what
+        is only known within, like the size of a file.
+
+    Examples:
+        >>> with span("parse", file = "file.py") as args:
+        ...     args["size"] = 10
+
+        >>> enable()
+
+        >>> with span("parse", file = "file.py") as args:
+        ...     args["size"] = 10
+
+        >>> [(event["name"], event["args"]) for event in disable()]
+        [('parse', {'file': 'file.py', 'size': 10})]
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    if _events is None:
+        return _disabled
+
+    return _span(_events, name, args)
+
+
+def extend(events: Sequence[Event]) -> None:
+    """Adds events recorded elsewhere, like in another process.
+
+    Args:
+        events: The events to add, if tracing.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    if _events is not None:
+        _events.extend(events)
+
+
+@deal.has("write")
+def write(events: Sequence[Event], path: str) -> None:
+    """Writes ``events`` to a Chrome trace file.
+
+    Args:
+        events: The events to write.
+        path: The path of the file.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    with open(path, "w", encoding = "utf-8") as file:
+        json.dump({"traceEvents": list(events)}, file)
+
+
+@contextlib.contextmanager
+def tracing(path: Optional[str]) -> Iterator[None]:
+    """Traces whatever runs within, if there is a ``path`` to write to.
+
+    The trace is written even when the run exits, as tasks do.
+
+    Args:
+        path: The path of the Chrome trace file, if any.
+
+    Examples:
+        >>> import tempfile
+
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     path = os.path.join(directory, "run.json")
+        ...
+        ...     with tracing(path):
+        ...         with span("parse", file = "file.py"):
+        ...             pass
+        ...
+        ...     with open(path) as file:
+        ...         [event["name"] for event in json.load(file)["traceEvents"]]
+        ['parse']
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    if path is None:
+        yield
+        return
+
+    enable()
+
+    try:
+        yield
+
+    finally:
+        write(disable(), path)
+
+
+@contextlib.contextmanager
+def _span(
+        events: List[Event],
+        name: str,
+        args: Dict[str, Any],
+        ) -> Iterator[Dict[str, Any]]:
+    """Records a complete event, in microseconds since the epoch.
+
+    The clock is shared by every process, so that spans recorded by workers
+    line up with the others.
+
+    """
+
+    start: float = time.time()
+
+    try:
+        yield args
+
+    finally:
+        events.append({
+            "name": name,
+            "cat": name.split(".")[0],
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": (time.time() - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+            })
@@ -5,11 +5,22 @@
 
 """Commons utilities.
 
+.. versionchanged:: 2.1.0
+    Array utilities, and :mod:`numpy` with them, are loaded on first access,
+    not on import.
+
+.. versionchanged:: 2.1.0
+    Adds :class:`.StatementVisitor`, to find definitions without walking
+    through every expression.
+
 .. versionadded:: 1.0.0
 
 """
 
-from ._arrays import add, fill, pop, pre, rep  # noqa: F401
+from typing import Any, TYPE_CHECKING
+
+import importlib
+
 from ._functions import (  # noqa: F401
     chain,
     compact,
@@ -20,3 +31,18 @@ from ._functions import (  # noqa: F401
     flatten,
     partial,
     )
+from ._visitors import StatementVisitor, called  # noqa: F401
+
+if TYPE_CHECKING:
+    from ._arrays import add, fill, pop, pre, rep  # noqa: F401
+
+_numeric = ("add", "fill", "pop", "pre", "rep")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _numeric:
+        value = getattr(importlib.import_module("._arrays", __name__), name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,12 +14,6 @@ from __future__ import annotations
 import deal
 import numpy
 
-import mantic_hypothesis as st
-
-from ..domain import Signature
-
-st.register(Signature, st.signatures)
-
 size_limit = 2e5
 """Just a random size/length sentinel."""
 
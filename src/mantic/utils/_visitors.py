@@ -0,0 +1,122 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Cheap traversal of abstract syntax-trees.
+
+Functions can only be defined by statements, so there is no need to walk
+through expressions, calls, comprehensions and so on, to find them all.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, FrozenSet
+
+import ast
+
+import deal
+
+_blocks: FrozenSet[str] = frozenset(
+    ("body", "orelse", "handlers", "finalbody", "cases"),
+    )
+"""The fields of a node that may hold statements."""
+
+
+class StatementVisitor(ast.NodeVisitor):
+    """A node visitor that only visits statements.
+
+    Unlike :class:`ast.NodeVisitor`, the generic visit only descends into
+    the bodies of modules, classes, ``if``, ``try``, ``with``, and the like.
+    Decorators, arguments, and any other expression are left alone.
+
+    Examples:
+        >>> class Visitor(StatementVisitor):
+        ...     def visit_Lambda(self, node):
+        ...         print("lambda")
+        ...
+        ...     def visit_FunctionDef(self, node):
+        ...         print(node.name)
+
+        >>> source = [
+        ...     "if True:",
+        ...     "    def function(f = lambda: 1):",
+        ...     "        ...",
+        ...     ]
+        >>> Visitor().visit(ast.parse("\\n".join(source)))
+        function
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    def generic_visit(self, node: ast.AST) -> Any:
+        """Visits the statements of the ``node``, in order.
+
+        Args:
+            node: The :mod:`ast` node to visit.
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        field: str
+        child: ast.AST
+
+        for field in node._fields:
+            if field not in _blocks:
+                continue
+
+            value = getattr(node, field, None)
+
+            # ``body`` is an expression for lambdas, and the like.
+            if not isinstance(value, list):
+                continue
+
+            for child in value:
+                self.visit(child)
+
+
+@deal.pure
+def called(node: ast.expr) -> str:
+    """Finds out the name a decorator, or any callable, is called by.
+
+    Args:
+        node: The :mod:`ast` node of the decorator.
+
+    Returns:
+        The last name of the decorator, or an empty string.
+
+    Examples:
+        >>> called(ast.parse("property").body[0].value)
+        'property'
+
+        >>> called(ast.parse("name.setter").body[0].value)
+        'setter'
+
+        >>> called(ast.parse("deal.deprecated(since = 1)").body[0].value)
+        'deprecated'
+
+        >>> called(ast.parse("f()()").body[0].value)
+        'f'
+
+        >>> called(ast.parse("[]").body[0].value)
+        ''
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    while isinstance(node, ast.Call):
+        node = node.func
+
+    if isinstance(node, ast.Attribute):
+        return node.attr
+
+    if isinstance(node, ast.Name):
+        return node.id
+
+    return ""
@@ -17,6 +17,15 @@ Example usage::
 
 """
 
-from mantic import __version__  # noqa: F401
+from typing import Any
+
+import mantic
 
 from .__main__ import main  # noqa: F401
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        return mantic.__version__
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,12 @@
 
 """Main cli initialiser.
 
+Views, and whatever each task needs, are only imported when used, as the
+cli is run on every commit by pre-commit hooks, so startup time matters.
+
+.. versionchanged:: 2.1.0
+    Heavy dependencies are imported on demand.
+
 .. versionadded:: 1.0.0
 
 """
@@ -15,13 +21,11 @@ from typing import cast, Tuple
 
 import inspect
 
-import typic
 from invoke import Program
 
 import mantic_cli
 
 from .tasks import Tasks
-from .views import help_view, home_view, to_options
 
 _tasks: Tasks = Tasks()
 #: The list of tasks.
@@ -30,24 +34,30 @@ _header: str = "Commands"
 #: The home screen header opener.
 
 
-@typic.klass(always = True, strict = True)
 class Main(Program):
     """Interfaces with :mod:`.invoke`."""
 
     def __init__(self) -> None:
-        super().__init__(
-            namespace = _tasks,
-            version = mantic_cli.__version__,
-            )
+        super().__init__(namespace = _tasks)
+
+    def print_version(self) -> None:
+        """Intercepts :mod:`.invoke` to look the version up only if asked."""
+
+        self.version = mantic_cli.__version__
+        return super().print_version()
 
     def print_help(self) -> None:
         """Intercepts :mod:`.invoke` to print the home screen."""
 
+        from .views import home_view
+
         return home_view.render(self._make_pairs(_tasks))
 
     def print_task_help(self, command: str) -> None:
         """Intercepts :mod:`.invoke` to print the help screen."""
 
+        from .views import help_view, to_options
+
         doc: str
         options: Tuple[Tuple[str, ...], ...]
 
@@ -11,30 +11,65 @@ or ``setup.cfg`` file.
 For example::
 
     [tool.mantic]
-    exclude = [".editorconfig", ".gitignore", "tests"]
+    ignore = [".editorconfig", ".gitignore", "tests"]
+
+Paths to ``ignore`` are ``.gitignore`` patterns, see :mod:`.infra.ignore`.
 
 .. versionchanged:: 1.2.0
 
+.. versionchanged:: 2.1.0
+    A plain :mod:`dataclasses` class, to keep startup time low.
+
+.. versionchanged:: 2.1.0
+    Paths to ``ignore`` are ``.gitignore`` patterns, instead of substrings.
+
 .. versionadded:: 1.0.0
 
 """
 
 from typing import Any, MutableMapping, Sequence, Type
 
+import dataclasses
 from configparser import ConfigParser
 from pathlib import Path
 
 import deal
 import toml
-import typic
 
 
-@typic.klass(frozen = True, slots = True, strict = True)
+@dataclasses.dataclass(frozen = True)
 class Config:
     """Provides a configuration representation."""
 
     ignore: Sequence[str]
 
+    def __post_init__(self) -> None:
+        """Checks the types of the configuration, as :mod:`typic` used to.
+
+        Raises:
+            TypeError: When ``ignore`` is not a list of paths.
+
+        Examples:
+            >>> Config(ignore = ["tests"])
+            Config(ignore=['tests'])
+
+            >>> Config(ignore = "tests")
+            Traceback (most recent call last):
+            TypeError: Expected ignore to be a list of paths, got 'tests'
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        if isinstance(self.ignore, str) or not all(
+                isinstance(path, str)
+                for path in self.ignore
+                ):
+            raise TypeError(
+                f"Expected ignore to be a list of paths, got "
+                f"{self.ignore!r}",
+                )
+
 
 @deal.has("import")
 def build_config(config: Type[Config]) -> Config:
@@ -44,13 +79,13 @@ def build_config(config: Type[Config]) -> Config:
 
     if Path("pyproject.toml").exists():
         from_file = toml.load("pyproject.toml")
-        return config.transmute(from_file["tool"]["mantic"])
+        return config(ignore = from_file["tool"]["mantic"]["ignore"])
 
     if Path("setup.cfg").exists():
         parser = ConfigParser()
         parser.read("setup.cfg")
         from_file = {"ignore": parser["tool:mantic"]["ignore"].split()}
-        return config.transmute(from_file)
+        return config(ignore = from_file["ignore"])
 
     raise NotImplementedError
 
@@ -0,0 +1,223 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Runs tasks in a long-running process, listening on a Unix socket.
+
+Checks are run from pre-commit and editor hooks over and over again, and
+each run pays for starting the interpreter, importing everything, spawning
+``git`` and reading the snapshot of the last tagged version. The daemon
+pays for that once, and keeps in memory the files parsed so far, the git
+handles, and the snapshots read.
+
+Each request is one JSON line, with the task to run, the directory to run
+it in, and its options::
+
+    {"task": "check-version", "cwd": "/path", "options": {...}, "tty": true}
+
+Answers are JSON lines as well, what the task prints to ``stdout`` and
+``stderr`` as it goes, and its exit code last::
+
+    {"out": "[INFO] Parsing files from HEAD…\\n"}
+    {"exit": 0}
+
+Requests are answered one at a time, as tasks change directory.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, IO, Optional
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import traceback
+
+
+def default() -> str:
+    """The socket to listen on, or connect to, unless told otherwise.
+
+    Returns:
+        A path within ``$XDG_RUNTIME_DIR``, or within the temporary directory
+        if unset.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    directory: Optional[str] = os.environ.get("XDG_RUNTIME_DIR")
+    name: str = f"mantic-{os.getuid()}.sock"
+
+    if directory is None:
+        return os.path.join(tempfile.gettempdir(), name)
+
+    return os.path.join(directory, "mantic.sock")
+
+
+def request(path: str, task: str, options: Dict[str, Any]) -> Optional[int]:
+    """Asks a daemon to run a task, printing whatever it prints.
+
+    Args:
+        path: The socket the daemon listens on.
+        task: The name of the task, like ``check-version``.
+        options: The options of the task, by name.
+
+    Returns:
+        The exit code of the task, or None if there is no daemon to ask.
+
+    Raises:
+        ConnectionError: When the daemon stops answering mid-way.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        client.connect(path)
+
+    except OSError:
+        client.close()
+        return None
+
+    with client, client.makefile("rwb") as stream:
+        stream.write(_encode({
+            "task": task,
+            "cwd": os.getcwd(),
+            "options": options,
+            "tty": sys.stdout.isatty(),
+            }))
+        stream.flush()
+
+        for line in stream:
+            answer: Dict[str, Any] = json.loads(line)
+
+            if "exit" in answer:
+                return answer["exit"]
+
+            output: IO[str] = sys.stdout if "out" in answer else sys.stderr
+            output.write(answer.get("out", answer.get("err", "")))
+            output.flush()
+
+    raise ConnectionError(f"The daemon at {path} stopped answering")
+
+
+def serve(path: str, tasks: Dict[str, Callable[..., Any]]) -> None:
+    """Answers requests until interrupted.
+
+    A stale socket, left by a daemon that did not stop cleanly, is removed.
+
+    Args:
+        path: The socket to listen on.
+        tasks: The tasks to run, by name.
+
+    Raises:
+        FileExistsError: When another daemon listens on the socket already.
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    from mantic import actions, infra  # noqa: F401
+
+    if os.path.exists(path):
+        if request(path, "", {}) is not None:
+            raise FileExistsError(f"A daemon listens on {path} already")
+
+        os.unlink(path)
+
+    infra.cache.remember()
+
+    handler = type("_Handler", (_Handler,), {"tasks": tasks})
+
+    with socketserver.UnixStreamServer(path, handler) as server:
+        try:
+            server.serve_forever()
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            os.unlink(path)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Runs a task per connection, streaming back what it prints."""
+
+    tasks: Dict[str, Callable[..., Any]]
+
+    def handle(self) -> None:
+        try:
+            message: Dict[str, Any] = json.loads(self.rfile.readline())
+            code: int = self._run(message)
+            self.wfile.write(_encode({"exit": code}))
+
+        # The client is gone, there is nobody to answer.
+        except OSError:
+            pass
+
+    def _run(self, message: Dict[str, Any]) -> int:
+        from mantic import infra
+
+        task: Optional[Callable[..., Any]]
+        task = self.tasks.get(message.get("task", ""))
+        cwd: str = os.getcwd()
+        tty: bool = message.get("tty", False)
+
+        if task is None:
+            return 2
+
+        out = _Stream(self.wfile, "out", tty)
+        err = _Stream(self.wfile, "err", tty)
+
+        try:
+            os.chdir(message["cwd"])
+
+            # New versions may have been tagged since the last request.
+            infra.repo.versions.forget()
+
+            with contextlib.redirect_stdout(out):
+                with contextlib.redirect_stderr(err):
+                    task(None, **message["options"])
+
+        except SystemExit as exit:
+            return exit.code if isinstance(exit.code, int) else 1
+
+        except Exception:
+            err.write(traceback.format_exc())
+            return 1
+
+        finally:
+            os.chdir(cwd)
+
+        return 0
+
+
+class _Stream(io.TextIOBase):
+    """Sends whatever is printed to the client, as it is printed."""
+
+    def __init__(self, wfile: IO[bytes], channel: str, tty: bool) -> None:
+        self.wfile = wfile
+        self.channel = channel
+        self.tty = tty
+
+    def write(self, text: str) -> int:
+        self.wfile.write(_encode({self.channel: text}))
+        return len(text)
+
+    def isatty(self) -> bool:
+        return self.tty
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    return f"{json.dumps(message)}\n".encode()
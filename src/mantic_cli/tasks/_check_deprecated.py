@@ -15,30 +15,82 @@ import sys
 
 import invoke
 
-from mantic import actions, infra
-
 from ..config import config
 from ._task import Task
 
-_task: Task = Task.transmute({
-    "iterable": ("ignore",),
-    "optional": ("ignore",),
-    "help": {
+_task: Task = Task(
+    iterable = ("ignore",),
+    optional = ("ignore",),
+    flags = {"output_format": "format"},
+    help = {
         "ignore": (
             "Paths to ignore",
             f"{', '.join(config.ignore)}",
             ),
+        "profile": (
+            "File to write a cProfile of the run to",
+            "none",
+            ),
+        "trace": (
+            "File to write a Chrome trace of the run to",
+            "none",
+            ),
+        "stats": (
+            "Print counters of the run, as text or json",
+            "none",
+            ),
+        "format": (
+            "Print the report as text, or as ndjson, one record per line",
+            "text",
+            ),
+        "socket": (
+            "Socket of a daemon to run the check with, if it is up",
+            "none",
+            ),
         },
-    })
+    )
 
 
 @invoke.task(**_task.primitive())
-def check_deprecated(_context, ignore):
+def check_deprecated(
+        _context,
+        ignore,
+        profile = None,
+        trace = None,
+        stats = None,
+        output_format = "text",
+        socket = None,
+        ):
     """Check if there are features to deprecate."""
 
     if len(ignore) == 0:
         ignore = config.ignore
 
-    task = actions.CheckDeprecated(infra.logs, ignore = tuple(ignore))
-    task()
+    if socket is not None:
+        from .. import daemon
+
+        code = daemon.request(
+            socket,
+            "check-deprecated",
+            {
+                "ignore": list(ignore),
+                "profile": profile,
+                "trace": trace,
+                "stats": stats,
+                "output_format": output_format,
+                },
+            )
+
+        if code is not None:
+            sys.exit(code)
+
+    from mantic import actions, infra
+
+    logs = infra.ndjson if output_format == "ndjson" else infra.logs
+
+    with infra.metrics.collecting(stats):
+        with infra.profiling.profiling(profile), infra.trace.tracing(trace):
+            task = actions.CheckDeprecated(logs, ignore = tuple(ignore))
+            task()
+
     sys.exit(task.exit.value)
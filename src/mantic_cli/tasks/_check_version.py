@@ -15,30 +15,132 @@ import sys
 
 import invoke
 
-from mantic import actions, infra
-
 from ..config import config
 from ._task import Task
 
-_task: Task = Task.transmute({
-    "iterable": ("ignore",),
-    "optional": ("ignore",),
-    "help": {
+_task: Task = Task(
+    iterable = ("ignore",),
+    optional = ("ignore",),
+    flags = {"output_format": "format"},
+    help = {
         "ignore": (
             "Paths to ignore",
             f"{', '.join(config.ignore)}",
             ),
+        "jobs": (
+            "Number of processes to parse files with, 0 for one per CPU",
+            "1",
+            ),
+        "staged": (
+            "Check the files staged, instead of the last commit",
+            ),
+        "stream": (
+            "Compare files one by one, reporting changes as they are found",
+            ),
+        "fail_fast": (
+            "Compare files one by one, and stop once the outcome is known",
+            ),
+        "baseline": (
+            "Snapshot of the last tagged version, to compare with",
+            "the one noted on the last tagged version, if any",
+            ),
+        "cache": (
+            "Reuse the signatures and the verdict of previous runs",
+            "True",
+            ),
+        "profile": (
+            "File to write a cProfile of the run to",
+            "none",
+            ),
+        "trace": (
+            "File to write a Chrome trace of the run to",
+            "none",
+            ),
+        "stats": (
+            "Print counters of the run, as text or json",
+            "none",
+            ),
+        "format": (
+            "Print the report as text, or as ndjson, one record per line",
+            "text",
+            ),
+        "socket": (
+            "Socket of a daemon to run the check with, if it is up",
+            "none",
+            ),
         },
-    })
+    )
 
 
 @invoke.task(**_task.primitive())
-def check_version(_context, ignore):
+def check_version(
+        _context,
+        ignore,
+        jobs = 1,
+        stream = False,
+        fail_fast = False,
+        cache = True,
+        baseline = None,
+        profile = None,
+        trace = None,
+        stats = None,
+        output_format = "text",
+        socket = None,
+        staged = False,
+        ):
     """Check if the actual version is valid."""
 
     if len(ignore) == 0:
         ignore = config.ignore
 
-    task = actions.CheckVersion(infra.logs, tuple(ignore))
-    task()
+    if int(jobs) < 0:
+        raise invoke.Exit(f"--jobs must be 0 or more, got {jobs}", 2)
+
+    if socket is not None:
+        from .. import daemon
+
+        code = daemon.request(
+            socket,
+            "check-version",
+            {
+                "ignore": list(ignore),
+                "jobs": jobs,
+                "staged": staged,
+                "stream": stream,
+                "fail_fast": fail_fast,
+                "cache": cache,
+                "baseline": baseline,
+                "profile": profile,
+                "trace": trace,
+                "stats": stats,
+                "output_format": output_format,
+                },
+            )
+
+        if code is not None:
+            sys.exit(code)
+
+    from mantic import actions, infra
+
+    logs = infra.ndjson if output_format == "ndjson" else infra.logs
+
+    with infra.metrics.collecting(stats):
+        with infra.profiling.profiling(profile), infra.trace.tracing(trace):
+            parser = actions.ParseFiles(
+                this = infra.repo.files.index if staged else "HEAD",
+                jobs = int(jobs),
+                cache = cache,
+                ignore = tuple(ignore),
+                baseline = infra.snapshot.load(baseline) if baseline else None,
+                )
+            task = actions.CheckVersion(
+                logs,
+                tuple(ignore),
+                parser,
+                stream,
+                fail_fast,
+                cache,
+                )
+            task()
+
     sys.exit(task.exit.value)
@@ -0,0 +1,46 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""The ``serve`` task.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+import invoke
+
+from ._check_deprecated import check_deprecated
+from ._check_version import check_version
+from ._task import Task
+
+_task: Task = Task(
+    iterable = (),
+    optional = (),
+    help = {
+        "socket": (
+            "Socket to listen on",
+            "mantic.sock, within $XDG_RUNTIME_DIR or the temporary directory",
+            ),
+        },
+    )
+
+
+@invoke.task(**_task.primitive())
+def serve(_context, socket = None):
+    """Run checks for clients, keeping caches warm in between."""
+
+    from .. import daemon
+
+    if socket is None:
+        socket = daemon.default()
+
+    print(f"Listening on {socket}, Ctrl-C to stop", flush = True)
+
+    daemon.serve(socket, {
+        "check-deprecated": check_deprecated.body,
+        "check-version": check_version.body,
+        })
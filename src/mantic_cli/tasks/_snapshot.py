@@ -0,0 +1,84 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""The ``snapshot`` task.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from __future__ import annotations
+
+import sys
+
+import invoke
+
+from ._task import Task
+
+_task: Task = Task(
+    iterable = (),
+    optional = (),
+    help = {
+        "output": (
+            "File to write the snapshot to",
+            "mantic.snapshot",
+            ),
+        "revision": (
+            "Revision to take a snapshot of",
+            "the last tagged version",
+            ),
+        "note": (
+            "Attach the snapshot to the revision, as a git note, instead",
+            ),
+        "profile": (
+            "File to write a cProfile of the run to",
+            "none",
+            ),
+        "trace": (
+            "File to write a Chrome trace of the run to",
+            "none",
+            ),
+        "jobs": (
+            "Number of processes to parse files with, 0 for one per CPU",
+            "1",
+            ),
+        },
+    )
+
+
+@invoke.task(**_task.primitive())
+def snapshot(
+        _context,
+        output = "mantic.snapshot",
+        revision = None,
+        jobs = 1,
+        note = False,
+        profile = None,
+        trace = None,
+        ):
+    """Take a snapshot of the signatures of a revision."""
+
+    if int(jobs) < 0:
+        raise invoke.Exit(f"--jobs must be 0 or more, got {jobs}", 2)
+
+    from mantic import actions, infra
+
+    with infra.profiling.profiling(profile), infra.trace.tracing(trace):
+        if revision is None:
+            revision = infra.repo.versions.last()
+
+        parser = actions.ParseFiles(
+            this = revision,
+            that = revision,
+            jobs = int(jobs),
+            )
+        task = actions.TakeSnapshot(
+            infra.logs,
+            None if note else output,
+            parser,
+            )
+        task()
+
+    sys.exit(task.exit.value)
@@ -5,21 +5,144 @@
 
 """The schema of a task.
 
+.. versionchanged:: 2.1.0
+    A plain :mod:`dataclasses` class, to keep startup time low.
+
+.. versionchanged:: 2.1.0
+    Parameters can be given other names on the command line, see
+    :attr:`.Task.flags`.
+
 .. versionadded:: 1.0.0
 
 """
 
 from __future__ import annotations
 
-from typing import MutableMapping, Tuple
+from typing import Any, Dict, MutableMapping, Set, Tuple
+
+import dataclasses
 
-import typic
+import invoke
 
 
-@typic.klass(frozen = True, slots = True, strict = True)
+@dataclasses.dataclass(frozen = True)
 class Task:
-    """Represents a task."""
+    """Represents a task.
+
+    Attributes:
+        iterable: The parameters given as many times as needed.
+        optional: The parameters whose value is optional.
+        help: The help of each flag, and its default.
+        flags: The name of the flag of each parameter, if not its own, as
+            when a parameter would shadow a builtin, like ``format``.
+
+    """
 
-    iterable: Tuple[str]
-    optional: Tuple[str]
+    iterable: Tuple[str, ...]
+    optional: Tuple[str, ...]
     help: MutableMapping[str, Tuple[str, ...]]
+    flags: MutableMapping[str, str] = dataclasses.field(default_factory = dict)
+
+    def __post_init__(self) -> None:
+        """Checks the types of the task, as :mod:`typic` used to.
+
+        Raises:
+            TypeError: When a field is not of the type declared.
+
+        Examples:
+            >>> Task(iterable = ("ignore",), optional = (), help = {})
+            Task(iterable=('ignore',), optional=(), help={}, flags={})
+
+            >>> Task(iterable = "ignore", optional = (), help = {})
+            Traceback (most recent call last):
+            TypeError: Expected iterable to be a tuple of strings, got 'ignore'
+
+        .. versionadded:: 2.1.0
+
+        """
+
+        for name in ("iterable", "optional"):
+            if not _strings(getattr(self, name)):
+                raise TypeError(
+                    f"Expected {name} to be a tuple of strings, got "
+                    f"{getattr(self, name)!r}",
+                    )
+
+        for option, text in self.help.items():
+            if not isinstance(option, str) or not _strings(text):
+                raise TypeError(
+                    f"Expected the help of {option!r} to be a tuple of "
+                    f"strings, got {text!r}",
+                    )
+
+        for name, flag in self.flags.items():
+            if not isinstance(name, str) or not isinstance(flag, str):
+                raise TypeError(
+                    f"Expected the flag of {name!r} to be a string, got "
+                    f"{flag!r}",
+                    )
+
+    def primitive(self) -> Dict[str, Any]:
+        """The task, as keyword arguments for :func:`invoke.task`."""
+
+        return {**dataclasses.asdict(self), "klass": _Flagged}
+
+
+class _Flagged(invoke.Task):
+    """An :mod:`invoke` task whose parameters may be flagged otherwise.
+
+    Examples:
+        >>> flags = {"output_format": "format"}
+
+        >>> @invoke.task(**Task((), (), {}, flags).primitive())
+        ... def task(_context, output_format = "text"):
+        ...     return output_format
+
+        >>> [argument.names for argument in task.get_arguments()]
+        [('format', 'f')]
+
+        >>> task(invoke.Context(), format = "ndjson")
+        'ndjson'
+
+    """
+
+    def __init__(
+            self,
+            *args: Any,
+            flags: MutableMapping[str, str],
+            **kwargs: Any,
+            ) -> None:
+        super().__init__(*args, **kwargs)
+        self.flags = flags
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Gives the value of each flag to its parameter."""
+
+        for name, flag in self.flags.items():
+            if flag in kwargs:
+                kwargs[name] = kwargs.pop(flag)
+
+        return super().__call__(*args, **kwargs)
+
+    def arg_opts(
+            self,
+            name: str,
+            default: Any,
+            taken_names: Set[str],
+            ) -> Dict[str, Any]:
+        """Builds the flag of a parameter as if it was named after it.
+
+        The parser keys values by flag, so they are renamed when called.
+
+        """
+
+        flag: str = self.flags.get(name, name)
+
+        return super().arg_opts(flag, default, taken_names)
+
+
+def _strings(value: Any) -> bool:
+    return isinstance(value, tuple) and all(
+        isinstance(item, str)
+        for item in value
+        )
@@ -15,6 +15,8 @@ from invoke import Collection
 
 from ._check_deprecated import check_deprecated
 from ._check_version import check_version
+from ._serve import serve
+from ._snapshot import snapshot
 
 
 class Tasks(Collection):
@@ -24,3 +26,5 @@ class Tasks(Collection):
         super().__init__()
         self.add_task(check_deprecated)
         self.add_task(check_version)
+        self.add_task(serve)
+        self.add_task(snapshot)
@@ -15,12 +15,8 @@ import deal
 from rich.layout import Layout
 from rich.panel import Panel
 
-import mantic_hypothesis as st
 from mantic import utils
 
-st.register(Layout, st.layouts)
-st.register(Panel, st.panels)
-
 _grid = utils.partial(Layout, " ", ratio = 2)
 #: To fill around the terminal.
 
@@ -20,17 +20,12 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-import mantic_hypothesis as st
+import mantic_cli
 from mantic import __name__, utils
 
-from .. import __version__
 from ._base import columns, rows
 from ._theme import ThemeConsole
 
-st.register(Layout, st.layouts)
-st.register(Panel, st.panels)
-st.register(Table, st.tables)
-
 _headers = "Flags", "Description", "Default values"
 #: Help command headers.
 
@@ -123,7 +118,7 @@ def _main(command: str, content: Table) -> Panel:
         border_style = ThemeConsole.BORDER,
         padding = 5,
         title = _usage(command),
-        subtitle = __version__,
+        subtitle = mantic_cli.__version__,
         )
 
 
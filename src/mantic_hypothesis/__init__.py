@@ -5,15 +5,26 @@
 
 """Shared hypothesis strategies.
 
+Strategies are registered by :func:`._hypothesis_setup_hook`, which
+:mod:`hypothesis` calls through its ``hypothesis`` entry point when it is
+imported, so that production code never has to import :mod:`hypothesis`.
+
+:mod:`hypothesis` itself is only imported when strategies are built, as it
+imports this module, through the entry point, while being imported.
+
+.. versionchanged:: 2.1.0
+    Strategies are registered through an entry point.
+
 .. versionadded:: 1.0.0
 
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable, Type
+from typing import Any, Callable, Type, TYPE_CHECKING
 
-from hypothesis import strategies as st
+if TYPE_CHECKING:
+    from hypothesis import strategies as st
 
 F = Callable[..., Any]
 
@@ -21,6 +32,8 @@ F = Callable[..., Any]
 def layouts(layout: Type[object]) -> st.SearchStrategy[object]:
     """A strategy for layouts."""
 
+    from hypothesis import strategies as st
+
     return st.builds(
         layout,
         st.text(),
@@ -35,6 +48,8 @@ def layouts(layout: Type[object]) -> st.SearchStrategy[object]:
 def panels(panel: Type[object]) -> st.SearchStrategy[object]:
     """A strategy for panels."""
 
+    from hypothesis import strategies as st
+
     return st.builds(
         panel,
         st.text(),
@@ -46,6 +61,8 @@ def panels(panel: Type[object]) -> st.SearchStrategy[object]:
 def tables(table: Type[object]) -> st.SearchStrategy[object]:
     """A strategy for tables."""
 
+    from hypothesis import strategies as st
+
     return st.builds(
         table,
         st.text(),
@@ -55,6 +72,8 @@ def tables(table: Type[object]) -> st.SearchStrategy[object]:
 def signatures(signature: Type[object]) -> st.SearchStrategy[object]:
     """A strategy for signatures."""
 
+    from hypothesis import strategies as st
+
     return st.builds(
         signature,
         name = st.text(min_size = 1),
@@ -79,4 +98,34 @@ def register(what: Type[object], strategy: F) -> None:
 
     """
 
+    from hypothesis import strategies as st
+
     st.register_type_strategy(what, strategy)
+
+
+def _hypothesis_setup_hook() -> None:
+    """Registers the strategies for :mod:`.mantic` types.
+
+    Examples:
+        >>> from hypothesis import strategies as st
+
+        >>> from mantic.domain import Signature
+
+        >>> _hypothesis_setup_hook()
+        >>> st.from_type(Signature).example()
+        Signature(name=..., file=..., arguments=())
+
+    .. versionadded:: 2.1.0
+
+    """
+
+    from rich.layout import Layout
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from mantic.domain import Signature
+
+    register(Layout, layouts)
+    register(Panel, panels)
+    register(Table, tables)
+    register(Signature, signatures)
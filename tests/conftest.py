@@ -0,0 +1,20 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+import pytest
+
+from mantic_hypothesis import _hypothesis_setup_hook
+
+# The entry point only registers strategies once the package is installed
+# again, so we do not rely on it being up to date.
+_hypothesis_setup_hook()
+
+
+@pytest.fixture(autouse = True)
+def cache(tmp_path_factory, monkeypatch):
+    """Keeps the signatures cached by tests out of the user's cache."""
+
+    directory = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("MANTIC_CACHE_DIR", str(directory))
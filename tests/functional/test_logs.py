@@ -13,8 +13,12 @@ _colors = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
 @pytest.fixture
-def capture(capsys):
-    """Capture prints."""
+def capture(capsys, monkeypatch):
+    """Capture prints, as if in a terminal."""
+
+    monkeypatch.setattr(infra.logs, "_interactive", lambda: True)
+    monkeypatch.setattr(infra.logs, "_started", None)
+    monkeypatch.setattr(infra.logs, "_drawn", 0.0)
 
     def _capture():
         # We strip colors to test just content.
@@ -69,3 +73,34 @@ def test_wipe(capture):
     infra.logs.wipe()
     output = "                                                             \r"
     assert capture()[-62:] == output
+
+
+def test_push_throttled(capture):
+    infra.logs.init()
+
+    for count in range(1000):
+        infra.logs.push(count, 1000)
+
+    frames = capture().split("\r")
+
+    assert len(frames) < 100
+    assert frames[-2].startswith("[/] 100% |✓")
+    assert "/s, ETA 0:00" in frames[-2]
+
+
+def test_push_milestones(capsys):
+    infra.logs.init()
+
+    for count in range(1000):
+        infra.logs.push(count, 1000)
+
+    lines = _colors.sub("", capsys.readouterr().out).splitlines()
+
+    assert "\r" not in "".join(lines)
+    assert lines[-1].startswith("[/] 100% (1000/1000, ")
+    assert len(lines) <= 4
+
+
+def test_wipe_milestones(capsys):
+    infra.logs.wipe()
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,115 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+heavy = ("git", "hypothesis", "nptyping", "numpy", "pkg_resources", "typic")
+"""Modules that ``mantic --help`` or ``mantic --version`` shouldn't import."""
+
+budget = 350
+"""How many modules ``mantic --help`` or ``mantic --version`` may import.
+
+Unlike wall-clock time, the count doesn't depend on the machine, so it
+stays the same from one run to the next.
+
+"""
+
+_spawns = textwrap.dedent(
+    """
+    import subprocess
+    import sys
+
+    popen = subprocess.Popen.__init__
+
+    def spy(self, args, *rest, **kwargs):
+        print("spawned:", args)
+        popen(self, args, *rest, **kwargs)
+
+    subprocess.Popen.__init__ = spy
+
+    import mantic.actions
+    from mantic_cli import main
+
+    sys.argv = ["mantic", *sys.argv[1:]]
+
+    try:
+        main.run()
+    except SystemExit:
+        pass
+    """
+    )
+
+_imports = textwrap.dedent(
+    """
+    import sys
+
+    startup = set(sys.modules)
+
+    from mantic_cli import main
+
+    sys.argv = ["mantic", *sys.argv[1:]]
+
+    try:
+        main.run()
+    except SystemExit:
+        pass
+
+    print("imported:", *sorted(set(sys.modules) - startup))
+    """
+    )
+
+
+@pytest.fixture
+def run(tmp_path):
+    """Runs a script outside of any git repository."""
+
+    (tmp_path / "pyproject.toml").write_text("[tool.mantic]\nignore = []\n")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    def _run(script, *args):
+        return subprocess.run(
+            (sys.executable, "-c", script, *args),
+            cwd = tmp_path,
+            env = env,
+            capture_output = True,
+            text = True,
+            check = True,
+            ).stdout
+
+    return _run
+
+
+@pytest.mark.parametrize(
+    "args",
+    [(), ("--help",), ("--help", "check-version")],
+    )
+def test_help_does_not_run_git(run, args):
+    assert "spawned:" not in run(_spawns, *args)
+
+
+def test_version_does_not_run_git(run):
+    output = run(_spawns, "--version")
+
+    assert "spawned:" not in output
+    assert output.startswith("Mantic ")
+
+
+@pytest.mark.parametrize("args", [("--help",), ("--version",)])
+def test_does_not_import_heavy_modules(run, args):
+    imported = run(_imports, *args).split("imported:")[-1].split()
+
+    assert not set(heavy) & set(imported)
+
+
+@pytest.mark.parametrize("args", [("--help",), ("--version",)])
+def test_imports_within_budget(run, args):
+    imported = run(_imports, *args).split("imported:")[-1].split()
+
+    assert len(imported) <= budget
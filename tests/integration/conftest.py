@@ -0,0 +1,60 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+import subprocess
+import textwrap
+
+import pytest
+
+
+def git(*args):
+    subprocess.run(("git", *args), check = True, capture_output = True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """A repository where modules are added, changed and removed."""
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MANTIC_CACHE_DIR", str(tmp_path / ".cache"))
+
+    git("init", "-q")
+    git("config", "user.name", "mantic")
+    git("config", "user.email", "mantic@example.com")
+
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+
+    for i in range(0, 12, 3):
+        module = tmp_path / "pkg" / f"module_{i}.py"
+        module.write_text(f"def function(a, b = {i}):\n    ...\n")
+
+    (tmp_path / "pkg" / "gone.py").write_text("def function(a):\n    ...\n")
+
+    git("add", ".")
+    git("commit", "-qm", "Initial commit")
+    git("tag", "1.0.0")
+
+    for i in range(12):
+        module = tmp_path / "pkg" / f"module_{i}.py"
+        module.write_text(
+            textwrap.dedent(
+                f"""
+                def function(a, b = {i}):
+                    ...
+
+                class Klass:
+                    def function(self, *, c = None):
+                        ...
+                """
+                )
+            * (i + 1)
+            )
+
+    git("rm", "-q", "pkg/gone.py")
+    git("add", ".")
+    git("commit", "-qm", "Add modules")
+
+    return tmp_path
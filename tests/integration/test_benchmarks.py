@@ -0,0 +1,53 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+import json
+
+import pytest
+
+from benchmarks import generate, Shape
+from benchmarks.__main__ import main
+
+shape = Shape(tags = 2, files = 6, functions = 4, deprecations = 0.2)
+
+
+def test_generated_modules_compile(tmp_path):
+    repo = generate(tmp_path / "repo", shape)
+
+    for module in repo.rglob("*.py"):
+        compile(module.read_text(), str(module), "exec")
+
+
+def test_generation_is_reproducible(tmp_path):
+    this = generate(tmp_path / "this", shape)
+    that = generate(tmp_path / "that", shape)
+
+    for module in this.rglob("*.py"):
+        relative = module.relative_to(this)
+        assert module.read_text() == (that / relative).read_text()
+
+
+def test_report(tmp_path):
+    output = tmp_path / "report.json"
+
+    main((
+        "--tags", "2",
+        "--files", "6",
+        "--repeat", "2",
+        "--stage", "BuildSignatures",
+        "--stage", "CheckVersion",
+        "--output", str(output),
+        ))
+
+    report = json.loads(output.read_text())
+
+    assert report["shape"]["files"] == 6
+    assert list(report["stages"]) == ["BuildSignatures", "CheckVersion"]
+    assert len(report["stages"]["CheckVersion"]["runs"]) == 2
+
+
+def test_unknown_stage(tmp_path):
+    with pytest.raises(KeyError):
+        main(("--files", "2", "--stage", "nope", "--output", "/dev/null"))
@@ -83,3 +83,39 @@ def test_find_deprecated_when_expired(fail):
 
     fail.assert_called()
     assert exit.value.code != Exit.OK
+
+
+def test_check_uncommitted_files(warn, fail, repo):
+    """Checks files as they are on the disk, before being committed."""
+
+    with Module("1.0.0") as (file, _):
+        (repo / "pkg" / "module_0.py").write_bytes(file.read())
+
+    checker = CheckDeprecated(logs, version = "1.0.0")
+    checker()
+
+    warn.assert_called_once()
+    fail.assert_called_once()
+    assert "pkg.module_0.function" in warn.call_args[0][0]
+    assert checker.exit == Exit.KO
+
+
+def test_check_files_from_elsewhere(
+        warn,
+        fail,
+        repo,
+        monkeypatch,
+        tmp_path_factory,
+        ):
+    """Checks files of another repository than the current one."""
+
+    with Module("1.0.0") as (file, _):
+        (repo / "pkg" / "module_0.py").write_bytes(file.read())
+
+    monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
+    checker = CheckDeprecated(logs, version = "1.0.0", repo = str(repo))
+    checker()
+
+    warn.assert_called_once()
+    assert "pkg.module_0.function" in warn.call_args[0][0]
+    assert checker.exit == Exit.KO
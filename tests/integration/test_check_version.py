@@ -3,14 +3,18 @@
 # Licensed under the EUPL-1.2-or-later
 # For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
 
+import json
 import sys
 
+import invoke
 import pytest
 
 from mantic import utils
-from mantic.actions import CheckVersion
-from mantic.domain import Exit
-from mantic.infra import logs
+from mantic.actions import CheckVersion, Finding, check_version
+from mantic.actions._parse_files import _namespace
+from mantic.domain import Exit, VersionInt
+from mantic.infra import logs, ndjson
+from mantic_cli.tasks import Tasks
 
 
 @pytest.fixture
@@ -219,3 +223,153 @@ def test_funcs_when_duplicates(info, warn, fail, checker):
     warn.assert_any_call("- pysemver._func_checker.score(sexies) => MAJOR\n")
     fail.assert_called()
     assert exit.value.code != Exit.OK
+
+
+def test_stream(mocker, repo):
+    """Finds the same changes when comparing files one by one."""
+
+    warn = mocker.spy(logs, "warn")
+    found = []
+
+    for stream in (False, True):
+        checker = CheckVersion(logs, ignore = (), stream = stream)
+        checker()
+        warnings = sorted(map(utils.first, warn.call_args_list))
+        found.append((warnings, checker.bump_version.required))
+        warn.reset_mock()
+
+    assert found[0] == found[1]
+    assert found[1][1] == VersionInt.MAJOR
+
+
+def test_fail_fast(mocker, repo):
+    """Stops as soon as the current version is known not to be acceptable."""
+
+    info = mocker.spy(logs, "info")
+    warn = mocker.spy(logs, "warn")
+    checker = CheckVersion(logs, ignore = (), fail_fast = True)
+    checker.bump_version.this = "1.0.0"
+    checker.bump_version.that = "1.0.0"
+    checker()
+
+    assert checker.stopped
+    assert checker.exit == VersionInt.PATCH
+    warn.assert_called_once()
+    info.assert_called_with("Version bump required: at least PATCH!\n")
+
+
+def test_fail_fast_when_major(mocker, repo):
+    """Stops as soon as a major bump is required."""
+
+    warn = mocker.spy(logs, "warn")
+    checker = CheckVersion(logs, ignore = (), fail_fast = True)
+    checker.bump_version.this = "2.0.0"
+    checker.bump_version.that = "1.0.0"
+    checker()
+
+    assert checker.stopped
+    assert checker.bump_version.required == VersionInt.MAJOR
+    assert checker.exit == VersionInt.NONE
+    assert "MAJOR" in utils.first(warn.call_args)[0]
+
+
+def test_cache(mocker, repo):
+    """Replays the verdict of an identical run, without parsing any file."""
+
+    warn = mocker.spy(logs, "warn")
+    found = []
+
+    for _ in range(2):
+        checker = CheckVersion(logs, ignore = (), cache = True)
+        extract = mocker.spy(checker.parser, "_extract")
+        checker()
+        warnings = list(map(utils.first, warn.call_args_list))
+        found.append((warnings, checker.bump_version.required, checker.exit))
+        warn.reset_mock()
+
+    assert found[0] == found[1]
+    assert found[1][1] == VersionInt.MAJOR
+    extract.assert_not_called()
+
+    checker = CheckVersion(logs, ignore = ("pkg/gone.py",), cache = True)
+    extract = mocker.spy(checker.parser, "_extract")
+    checker()
+
+    extract.assert_called()
+
+
+def test_cache_by_python_version(mocker, monkeypatch, repo):
+    """Checks again under another python, as it may parse files otherwise."""
+
+    CheckVersion(logs, ignore = (), cache = True)()
+
+    monkeypatch.setattr(sys, "version_info", (2, 7, 18))
+    _namespace.cache_clear()
+
+    checker = CheckVersion(logs, ignore = (), cache = True)
+    extract = mocker.spy(checker.parser, "_extract")
+    checker()
+    _namespace.cache_clear()
+
+    extract.assert_called()
+
+
+def test_ndjson(mocker, capsys, repo):
+    """Prints a record per change found, then the verdict, and nothing else."""
+
+    warn = mocker.spy(ndjson, "warn")
+    checker = CheckVersion(ndjson, ignore = ())
+    checker()
+    records = list(map(json.loads, capsys.readouterr().out.splitlines()))
+    *findings, summary = records
+
+    assert len(findings) == warn.call_count > 0
+    assert {finding["type"] for finding in findings} == {"finding"}
+    assert {
+        "name": "pkg.gone.function",
+        "file": "pkg/gone.py",
+        "reason": "removed",
+        "bump": "MAJOR",
+        "type": "finding",
+        } in findings
+    assert summary["type"] == "summary"
+    assert summary["required"] == "MAJOR"
+
+
+def test_check_version_from_elsewhere(
+        capsys,
+        monkeypatch,
+        tmp_path_factory,
+        repo,
+        ):
+    """Checks a repository without printing anything, from anywhere."""
+
+    monkeypatch.chdir(tmp_path_factory.mktemp("elsewhere"))
+    major = check_version(str(repo), version = "2.0.0")
+    patch = check_version(str(repo), version = "1.0.1", cache = False)
+
+    assert major.that == "1.0.0"
+    assert major.required == patch.required == VersionInt.MAJOR
+    assert major.acceptable and not patch.acceptable
+    assert major.findings == patch.findings
+    assert Finding(
+        "pkg.gone.function",
+        "pkg/gone.py",
+        "removed",
+        VersionInt.MAJOR,
+        ) in major.findings
+    assert capsys.readouterr().out == ""
+
+
+def test_check_version_without_version(repo):
+    """The version of another package is never taken for that of mantic."""
+
+    with pytest.raises(TypeError):
+        check_version(str(repo))
+
+
+def test_check_version_task_with_negative_jobs(repo):
+    with pytest.raises(invoke.Exit) as error:
+        Tasks()["check-version"](invoke.Context(), ignore = [], jobs = -1)
+
+    assert error.value.code == 2
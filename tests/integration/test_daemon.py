@@ -0,0 +1,80 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from mantic.domain import VersionInt
+from mantic_cli import daemon
+
+
+@pytest.fixture
+def socket(repo):
+    """A daemon, serving from the repository."""
+
+    path = str(repo / "mantic.sock")
+    (repo / "pyproject.toml").write_text("[tool.mantic]\nignore = []\n")
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    server = subprocess.Popen(
+        (
+            sys.executable,
+            "-c",
+            "from mantic_cli import main; main.run()",
+            "serve",
+            "--socket",
+            path,
+            ),
+        env = env,
+        stdout = subprocess.DEVNULL,
+        )
+
+    deadline = time.monotonic() + 30
+
+    while not os.path.exists(path):
+        if server.poll() is not None:
+            pytest.fail(f"The daemon exited with {server.returncode}")
+
+        if time.monotonic() > deadline:
+            server.kill()
+            pytest.fail("The daemon did not listen in time")
+
+        time.sleep(0.05)
+
+    yield path
+
+    server.send_signal(signal.SIGINT)
+    server.wait()
+
+    assert not os.path.exists(path)
+
+
+def test_request(capsys, socket):
+    options = {"ignore": [], "output_format": "ndjson"}
+
+    for _ in range(2):
+        code = daemon.request(socket, "check-version", options)
+        summary = json.loads(capsys.readouterr().out.splitlines()[-1])
+
+        assert summary["type"] == "summary"
+        assert summary["required"] == "MAJOR"
+        # An unacceptable version exits with the bump it requires.
+        if summary["acceptable"]:
+            assert code == 0
+
+        else:
+            assert code == VersionInt[summary["required"]]
+
+
+def test_request_without_daemon(repo):
+    path = str(repo / "mantic.sock")
+
+    assert daemon.request(path, "check-version", {}) is None
@@ -0,0 +1,206 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+import subprocess
+import sys
+
+import pytest
+
+from mantic.actions import ParseFiles
+from mantic.actions._parse_files import _namespace
+from mantic.infra import metrics, repo as git, snapshot
+
+
+def parse(parser, what):
+    with parser(what = what) as parsing:
+        counts = list(parsing)
+
+    return counts, parser.signatures
+
+
+def test_parse_in_parallel(repo):
+    serial = ParseFiles(this = "HEAD", that = "1.0.0", cache = False)
+    parallel = ParseFiles(
+        this = "HEAD",
+        that = "1.0.0",
+        cache = False,
+        jobs = 4,
+        )
+
+    assert parse(parallel, "this") == parse(serial, "this")
+    assert parse(parallel, "that") == parse(serial, "that")
+
+
+def test_parse_with_negative_jobs(repo):
+    with pytest.raises(ValueError, match = "jobs"):
+        ParseFiles(this = "HEAD", that = "1.0.0", jobs = -1)
+
+
+def test_parse_from_cache(repo):
+    fresh = ParseFiles(this = "HEAD", that = "1.0.0", jobs = 4)
+    cached = ParseFiles(this = "HEAD", that = "1.0.0")
+
+    assert parse(cached, "this") == parse(fresh, "this")
+    assert any((repo / ".cache").rglob("*"))
+
+
+def test_count_cache_hits(repo):
+    metrics.reset()
+    parse(ParseFiles(this = "HEAD", that = "1.0.0"), "this")
+    parsed = metrics.report()["counters"]
+
+    metrics.reset()
+    parse(ParseFiles(this = "HEAD", that = "1.0.0"), "this")
+    cached = metrics.report()["counters"]
+
+    assert parsed["files.parsed"] == parsed["cache.misses"] > 0
+    assert cached["cache.hits"] == parsed["cache.misses"]
+    assert "files.parsed" not in cached
+    assert parsed["git.blobs"] == parsed["files.parsed"]
+    assert "git.blobs" not in cached
+    assert cached["signatures.built"] == parsed["signatures.built"]
+
+
+def test_pairs(repo):
+    parser = ParseFiles(this = "HEAD", that = "1.0.0")
+    _, this = parse(parser, "this")
+    _, that = parse(parser, "that")
+
+    pairs = list(parser.pairs())
+    these = [signature for _, _, file, _ in pairs for signature in file]
+    those = [signature for _, _, _, file in pairs for signature in file]
+
+    assert [(count, total) for count, total, _, _ in pairs] == [
+        (count, 13) for count in range(13)
+        ]
+    assert these == list(this)
+    assert those == list(that)
+
+
+def test_pairs_in_parallel(repo):
+    serial = ParseFiles(this = "HEAD", that = "1.0.0", cache = False)
+    parallel = ParseFiles(
+        this = "HEAD",
+        that = "1.0.0",
+        cache = False,
+        jobs = 2,
+        )
+
+    metrics.reset()
+    pairs = parallel.pairs()
+    first = [next(pairs), next(pairs)]
+
+    # Only a couple of files per process are read ahead, in each revision,
+    # on top of those yielded already.
+    assert metrics.report()["counters"]["git.blobs"] <= 2 * 2 * 2 + 2
+    assert [*first, *pairs] == list(serial.pairs())
+
+
+def test_parse_renamed_files(repo):
+    subprocess.run(("git", "checkout", "-q", "1.0.0", "--", "pkg/module_3.py"))
+    subprocess.run(("git", "mv", "pkg/module_3.py", "pkg/renamed.py"))
+    subprocess.run(("git", "commit", "-qm", "Rename module"))
+
+    parser = ParseFiles(this = "HEAD", that = "1.0.0")
+    _, this = parse(parser, "this")
+    _, that = parse(parser, "that")
+
+    assert "pkg.renamed.function" in {signature.name for signature in this}
+    assert "pkg.module_3.function" in {signature.name for signature in that}
+
+
+def test_parse_from_baseline(repo, mocker):
+    *_, (_, _, taken) = ParseFiles(this = "1.0.0").snapshot("1.0.0")
+    snapshot.dump(taken, str(repo / "1.0.0.snapshot"))
+    baseline = snapshot.load(str(repo / "1.0.0.snapshot"))
+
+    parser = ParseFiles(this = "HEAD", that = "1.0.0", cache = False)
+    loaded = ParseFiles(
+        this = "HEAD",
+        that = "1.0.0",
+        cache = False,
+        baseline = baseline,
+        )
+
+    blobs = mocker.spy(git.files, "blobs")
+
+    assert sorted(baseline.files) == [
+        "pkg/__init__.py",
+        "pkg/gone.py",
+        *(f"pkg/module_{i}.py" for i in range(0, 12, 3)),
+        ]
+    assert parse(loaded, "that") == parse(parser, "that")
+    assert blobs.call_count == 1
+
+
+def test_parse_from_another_baseline(repo):
+    *_, (_, _, taken) = ParseFiles(this = "HEAD").snapshot("HEAD")
+
+    with pytest.raises(ValueError):
+        ParseFiles(this = "HEAD", that = "1.0.0", baseline = taken)
+
+
+def test_parse_from_baseline_taken_otherwise(repo):
+    *_, (_, _, taken) = ParseFiles(this = "1.0.0").snapshot("1.0.0")
+    baseline = taken._replace(namespace = "otherwise")
+
+    with pytest.raises(ValueError, match = "take it again"):
+        ParseFiles(this = "HEAD", that = "1.0.0", baseline = baseline)
+
+
+def test_parse_from_note(repo, mocker):
+    *_, (_, _, taken) = ParseFiles(this = "1.0.0").snapshot("1.0.0")
+    parser = ParseFiles(this = "HEAD", that = "1.0.0", cache = False)
+    snapshot.attach(taken)
+
+    noted = ParseFiles(this = "HEAD", that = "1.0.0")
+    blobs = mocker.spy(git.files, "blobs")
+
+    assert noted.baseline.tree == taken.tree
+    assert parse(noted, "that") == parse(parser, "that")
+    assert blobs.call_count == 1
+
+
+def test_parse_from_note_taken_otherwise(repo, mocker, monkeypatch):
+    *_, (_, _, taken) = ParseFiles(this = "1.0.0").snapshot("1.0.0")
+    snapshot.attach(taken)
+
+    monkeypatch.setattr(sys, "version_info", (2, 7, 18))
+    _namespace.cache_clear()
+    parser = ParseFiles(this = "HEAD", that = "1.0.0", cache = False)
+    noted = ParseFiles(this = "HEAD", that = "1.0.0")
+    blobs = mocker.spy(git.files, "blobs")
+
+    try:
+        assert noted.baseline is None
+        assert parse(noted, "that") == parse(parser, "that")
+        assert blobs.call_count == 2
+
+    finally:
+        _namespace.cache_clear()
+
+
+def test_parse_staged_files(repo):
+    (repo / "pkg" / "module_0.py").write_text("def function(a):\n    ...\n")
+    (repo / "pkg" / "module_1.py").write_text("def unstaged(a):\n    ...\n")
+    subprocess.run(("git", "add", "pkg/module_0.py"))
+
+    metrics.reset()
+    parser = ParseFiles(this = git.files.index, that = "HEAD", cache = False)
+    _, this = parse(parser, "this")
+
+    assert parser.diff == ("pkg/module_0.py",)
+    assert {signature.name for signature in this} == {"pkg.module_0.function"}
+    assert metrics.report()["counters"]["git.blobs"] == 1
+
+
+def test_snapshot_syntax_error(repo):
+    (repo / "pkg" / "module_5.py").write_text("def function(:\n")
+    subprocess.run(("git", "commit", "-qam", "Break module"))
+
+    with pytest.raises(SyntaxError) as error:
+        list(ParseFiles(this = "HEAD", cache = False).snapshot("HEAD"))
+
+    assert error.value.filename == "pkg/module_5.py"
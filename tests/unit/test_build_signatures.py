@@ -0,0 +1,86 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Signature builder tests.
+
+.. versionadded:: 2.1.0
+
+"""
+
+import pytest
+
+from mantic.actions import BuildSignatures
+
+
+@pytest.fixture
+def builder():
+    return BuildSignatures(["file.py", "other.py", "file.py"])
+
+
+def test_names_are_unique_across_files(builder):
+    builder("def function(a):\n    ...")
+    builder("def function(a):\n    ...")
+    builder("def function(a):\n    ...\ndef function(b):\n    ...")
+
+    names = [signature.name.split(".")[-1] for signature in builder.signatures]
+
+    assert names == ["function", "function", "function(bis)", "function(ter)"]
+
+
+def test_names_beyond_ten_duplicates(builder):
+    builder("def function(a):\n    ...\n" * 12)
+
+    names = [signature.name.split(".")[-1] for signature in builder.signatures]
+
+    assert len(set(names)) == 12
+    assert names[9:] == ["function(decies)", "function(11)", "function(12)"]
+
+
+def test_definitions_in_blocks(builder):
+    builder(
+        "if x:\n"
+        "    def a(p):\n"
+        "        def nested(q):\n"
+        "            ...\n"
+        "try:\n"
+        "    def b(p):\n"
+        "        ...\n"
+        "except ImportError:\n"
+        "    def c(p = None):\n"
+        "        ...\n"
+        "class Klass:\n"
+        "    with x:\n"
+        "        def d(self):\n"
+        "            ...\n"
+        )
+
+    names = [signature.name.split(".")[-1] for signature in builder.signatures]
+
+    assert names == ["a", "b", "c", "d"]
+
+
+def test_names_of_properties(builder):
+    builder(
+        "class Klass:\n"
+        "    @property\n"
+        "    def a(self):\n"
+        "        ...\n"
+        "    @a.setter\n"
+        "    def a(self, value):\n"
+        "        ...\n"
+        "    @functools.cached_property\n"
+        "    def b(self):\n"
+        "        ...\n"
+        "    @my_property.setter\n"
+        "    def c(self, value):\n"
+        "        ...\n"
+        "    @deal.pre(lambda _: 'property')\n"
+        "    def d(self):\n"
+        "        ...\n"
+        )
+
+    names = [signature.name.split(".")[-1] for signature in builder.signatures]
+
+    assert names == ["a#getter", "a#setter", "b#getter", "c#setter", "d"]
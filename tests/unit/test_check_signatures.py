@@ -0,0 +1,65 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Batch signature checker tests.
+
+.. versionadded:: 2.1.0
+
+"""
+
+from hypothesis import given, strategies as st
+
+from mantic.actions.check_signature import CheckSignature, CheckSignatures
+from mantic.domain import Argument, Signature
+
+arguments = st.builds(
+    Argument,
+    st.sampled_from(("a", "b", "c")),
+    st.sampled_from((None, "1")),
+    )
+
+several = st.lists(arguments, min_size = 1, max_size = 4).map(tuple)
+
+# The pairwise checker fails when a signature without arguments is compared
+# with one with more than one, so we only build pairs it can compare: either
+# both with arguments, or one without and the other with exactly one.
+pairs = st.lists(
+    st.one_of(
+        st.tuples(several, several),
+        arguments.flatmap(
+            lambda argument: st.sampled_from((
+                ((), (argument,)),
+                ((argument,), ()),
+                )),
+            ),
+        ).map(
+        lambda pair: tuple(
+            Signature("greet", "file.py", args)
+            for args in pair
+            ),
+        ),
+    max_size = 20,
+    )
+
+
+@given(pairs)
+def test_same_scores_and_reasons_as_pairwise(pairs):
+    checkers = [CheckSignature(this, that) for this, that in pairs]
+    these = tuple(this for this, _ in pairs)
+    those = tuple(that for _, that in pairs)
+    batch = CheckSignatures(these, those)
+
+    assert list(batch.score()) == [checker.score() for checker in checkers]
+    assert list(batch.reasons) == [checker.reason for checker in checkers]
+
+
+def test_signatures_without_arguments():
+    this = Signature("greet", "file.py")
+    that = Signature("greet", "other.py")
+    more = Signature("greet", "file.py", (Argument("a"), Argument("b")))
+    batch = CheckSignatures((this, this, more), (this, that, this))
+
+    assert list(batch.score()) == [0, 1, 3]
+    assert batch.reasons == (None, None, "args-diff")
@@ -0,0 +1,55 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Signature codec tests.
+
+.. versionadded:: 2.1.0
+
+"""
+
+import textwrap
+
+import pytest
+
+from mantic.actions._build_signatures import BuildSignatures
+from mantic.infra import codec
+
+
+@pytest.fixture
+def source():
+    return textwrap.dedent(
+        """
+        def function(a, b = 1, *, c = (1, "2"), d = None, **e):
+            ...
+
+        class Klass:
+            def method(self, f = 2, g = [], h = Klass.CONST):
+                ...
+
+            @property
+            def prop(self):
+                ...
+
+            @prop.setter
+            def prop(self, value):
+                ...
+        """
+        )
+
+
+def test_round_trip(source):
+    signatures = BuildSignatures(("file.py",)).extract(source)
+    assert codec.loads(codec.dumps(signatures), "file.py") == signatures
+
+
+def test_round_trip_keeps_signatures_hashable(source):
+    signatures = BuildSignatures(("file.py",)).extract(source)
+    loaded = codec.loads(codec.dumps(signatures), "file.py")
+    assert set(loaded) == set(signatures)
+
+
+def test_loads_with_invalid_data():
+    with pytest.raises(ValueError):
+        codec.loads(b"[[", "file.py")
@@ -0,0 +1,64 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Ignore matcher tests.
+
+.. versionadded:: 2.1.0
+
+"""
+
+import pytest
+
+from mantic.infra.ignore import matcher, pathspecs
+
+
+@pytest.mark.parametrize("pattern, file, ignored", [
+    ("tests", "tests/test_this.py", True),
+    ("tests", "src/tests/__init__.py", True),
+    ("tests", "src/contests.py", False),
+    ("tests", "tests.py", False),
+    ("README.md", "docs/README.md", True),
+    ("README.md", "README.md.bak", False),
+    ("/setup.cfg", "setup.cfg", True),
+    ("/setup.cfg", "src/setup.cfg", False),
+    ("docs/", "docs/index.rst", True),
+    ("docs/", "docs", False),
+    ("docs/*.rst", "docs/index.rst", True),
+    ("docs/*.rst", "docs/api/index.rst", False),
+    ("docs/**/*.rst", "docs/api/index.rst", True),
+    ("**/fixtures", "tests/unit/fixtures/file.py", True),
+    ("*.py[co]", "module.pyc", True),
+    ("*.py[!co]", "module.pyc", False),
+    ("module_?.py", "src/module_1.py", True),
+    ("# tests", "tests/test_this.py", False),
+    ])
+def test_matcher(pattern, file, ignored):
+    assert matcher((pattern,))(file) is ignored
+
+
+def test_matcher_without_patterns():
+    assert not matcher(())("file.py")
+
+
+def test_matcher_with_negations():
+    ignored = matcher(("tests", "!tests/fixtures", "tests/fixtures/*.txt"))
+
+    assert ignored("tests/test_this.py")
+    assert not ignored("tests/fixtures/file.py")
+    assert ignored("tests/fixtures/file.txt")
+
+
+def test_pathspecs():
+    assert pathspecs(("tests", "/setup.cfg", "docs/", "# comment")) == (
+        ":(exclude,glob)**/tests",
+        ":(exclude,glob)**/tests/**",
+        ":(exclude,glob)setup.cfg",
+        ":(exclude,glob)setup.cfg/**",
+        ":(exclude,glob)**/docs/**",
+        )
+
+
+def test_pathspecs_with_negations():
+    assert pathspecs(("tests", "!tests/fixtures")) == ()
@@ -0,0 +1,44 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Metrics tests.
+
+.. versionadded:: 2.1.0
+
+"""
+
+import io
+import json
+
+from mantic.actions.check_signature import CheckSignatures
+from mantic.domain import Argument, Signature
+from mantic.infra import metrics
+
+
+def test_count_comparisons():
+    signature = Signature("greet", "file.py", (Argument("count"),))
+    metrics.reset()
+    CheckSignatures((signature,) * 3, (signature,) * 3).score()
+
+    assert metrics.report()["counters"] == {"signatures.compared": 3}
+
+
+def test_collecting_when_exiting():
+    output = io.StringIO()
+
+    try:
+        with metrics.collecting("json", output):
+            with metrics.stage("parse"):
+                raise SystemExit(1)
+
+    except SystemExit:
+        pass
+
+    statistics = json.loads(output.getvalue())
+
+    assert list(statistics["stages"]) == ["parse"]
+    assert statistics["memory"] > 0
+    assert statistics["time"] > 0
+    assert metrics.report()["memory"] is None
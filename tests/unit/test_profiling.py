@@ -0,0 +1,51 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Profiling tests.
+
+.. versionadded:: 2.1.0
+
+"""
+
+import cProfile
+import io
+import pstats
+
+from mantic.infra import codec, logs
+from mantic.infra.profiling import profiling, summary
+
+
+def test_summary(capsys):
+    profile = cProfile.Profile()
+    profile.runcall(codec.loads, b'[["greet",[["count",null]]]]', "file.py")
+    profile.runcall(logs.info, "Nothing to see here…")
+    phases = {name: calls for name, _, calls in summary(pstats.Stats(profile))}
+
+    assert phases["extraction"] == 1
+    assert phases["reporting"] == 1
+    assert phases["scoring"] == 0
+
+
+def test_profiling_when_exiting(tmp_path):
+    output = io.StringIO()
+
+    try:
+        with profiling(str(tmp_path / "run.pstats"), output):
+            raise SystemExit(1)
+
+    except SystemExit:
+        pass
+
+    assert (tmp_path / "run.pstats").exists()
+    assert "total" in output.getvalue()
+
+
+def test_profiling_without_path(tmp_path):
+    output = io.StringIO()
+
+    with profiling(None, output):
+        pass
+
+    assert output.getvalue() == ""
@@ -0,0 +1,72 @@
+# Copyleft (ɔ) 2021 Mauko Quiroga <mauko@pm.me>
+#
+# Licensed under the EUPL-1.2-or-later
+# For details: https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+
+"""Tracing tests.
+
+.. versionadded:: 2.1.0
+
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+from mantic.actions._parse_files import _extract_file
+from mantic.actions.check_signature import CheckSignatures
+from mantic.domain import Argument, Signature
+from mantic.infra import trace
+
+
+def test_span_when_disabled():
+    with trace.span("parse", file = "file.py") as args:
+        args["size"] = 10
+
+    assert not trace.enabled()
+    assert trace.disable() == []
+
+
+def test_span_of_score():
+    signature = Signature("greet", "file.py", (Argument("count"),))
+    trace.enable()
+    CheckSignatures((signature,), (signature,)).score()
+    (event,) = trace.disable()
+
+    assert event["name"] == "score"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert event["args"] == {"signatures": 1}
+
+
+def test_spans_of_workers():
+    trace.enable()
+
+    with ProcessPoolExecutor(max_workers = 1) as pool:
+        source = "def greet(): ..."
+        future = pool.submit(_extract_file, "file.py", source, True)
+        _, events = future.result()
+
+    trace.extend(events)
+    (event,) = trace.disable()
+
+    assert event["name"] == "parse"
+    assert event["args"] == {"file": "file.py", "size": 16, "signatures": 1}
+
+
+def test_tracing_when_exiting(tmp_path):
+    path = tmp_path / "run.json"
+
+    try:
+        with trace.tracing(str(path)):
+            with trace.span("git.show", revision = "HEAD"):
+                raise SystemExit(1)
+
+    except SystemExit:
+        pass
+
+    (event,) = json.loads(path.read_text())["traceEvents"]
+
+    assert not trace.enabled()
+    assert event["name"] == "git.show"
+    assert event["cat"] == "git"
+    assert event["args"] == {"revision": "HEAD"}